@@ -0,0 +1,71 @@
+"""
+Algorithm Output Adapter
+Runs a scheduling policy on the shared engine and shapes the result
+for the services layer
+"""
+
+from backend.modules.process_table import ProcessTable
+
+def execute(processes, policy):
+    """
+    Execute a scheduling policy
+    
+    Args:
+        processes: List of process dictionaries with id, arrival_time,
+            burst_time and optional priority, or a ProcessTable
+        policy: SchedulingPolicy to run
+        
+    Returns:
+        Dictionary containing:
+            - gantt_chart: List of execution segments
+            - metrics: Performance metrics
+            - process_details: Detailed process information, in completion order
+    """
+    table = ProcessTable.of(processes, 'arrival_time', 'burst_time')
+    
+    gantt_chart = []
+    process_details = []
+    current_time = 0
+    
+    # Preempted runs become separate Gantt segments
+    for index, start, end, remaining in policy.run(table):
+        gantt_chart.append({
+            'process': table.ids[index],
+            'start': start,
+            'end': end
+        })
+        
+        if remaining == 0:
+            arrival = table.arrival[index]
+            burst = table.burst[index]
+            turnaround_time = end - arrival
+            
+            details = {
+                'id': table.ids[index],
+                'arrival_time': arrival,
+                'burst_time': burst
+            }
+            if policy.reports_priority:
+                details['priority'] = table.priority[index]
+            details['waiting_time'] = turnaround_time - burst
+            details['turnaround_time'] = turnaround_time
+            details['completion_time'] = end
+            process_details.append(details)
+        
+        current_time = end
+    
+    # Calculate metrics over the table columns
+    n = len(table)
+    
+    metrics = {
+        'average_waiting_time': round(table.total_waiting() / n, 2),
+        'average_turnaround_time': round(table.total_turnaround() / n, 2),
+        'cpu_utilization': round((table.total_burst() / current_time) * 100, 2) if current_time > 0 else 0,
+        'throughput': round(n / current_time, 2) if current_time > 0 else 0
+    }
+    
+    return {
+        'gantt_chart': gantt_chart,
+        'metrics': metrics,
+        'process_details': process_details
+    }
@@ -4,7 +4,7 @@ VizOS Backend - Flask API Server
 Interactive Operating System Simulation Tool
 """
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
 import json
 import sys
@@ -27,10 +27,16 @@ from backend.modules.fcfs_module import FCFSModule
 from backend.modules.sjf_module import SJFModule
 from backend.modules.priority_module import PriorityModule
 from backend.modules.roundrobin_module import RoundRobinModule
+from backend.modules.mlfq_module import MLFQModule
+from backend.modules.smp_module import SMPModule
 from backend.modules.bankers_module import BankersModule
 from backend.modules.deadlock_module import DeadlockModule
 from backend.modules.page_replacement_module import PageReplacementModule
 from backend.modules.memory_allocation_module import MemoryAllocationModule
+from backend.modules.address_translation_module import AddressTranslationModule
+from backend.modules import trace_generator
+from backend.modules.process_table import ProcessTable
+from backend.modules import schedule_stream
 
 # Use absolute paths for static files (important for Vercel serverless)
 frontend_dir = os.path.join(proj_root, 'frontend')
@@ -46,10 +52,13 @@ fcfs = FCFSModule()
 sjf = SJFModule()
 priority = PriorityModule()
 roundrobin = RoundRobinModule()
+mlfq = MLFQModule()
+smp = SMPModule()
 bankers = BankersModule()
 deadlock = DeadlockModule()
 page_replacement = PageReplacementModule()
 memory_allocation = MemoryAllocationModule()
+address_translation = AddressTranslationModule()
 
 @app.route('/')
 def home():
@@ -67,26 +76,75 @@ def api_home():
                     'fcfs': '/api/scheduling/fcfs',
                     'sjf': '/api/scheduling/sjf',
                     'priority': '/api/scheduling/priority',
-                    'roundrobin': '/api/scheduling/roundrobin'
+                    'roundrobin': '/api/scheduling/roundrobin',
+                    'roundrobin_sweep': '/api/scheduling/roundrobin/sweep',
+                    'mlfq': '/api/scheduling/mlfq'
                 },
                 'bankers': '/api/bankers',
                 'deadlock': '/api/deadlock',
                 'page_replacement': '/api/page-replacement',
-                'memory_allocation': '/api/memory-allocation'
+                'page_replacement_mrc': '/api/page-replacement/mrc',
+                'page_replacement_fifo_sweep': '/api/page-replacement/fifo-sweep',
+                'working_set': '/api/page-replacement/working-set',
+                'page_trace_generator': '/api/page-replacement/generate',
+                'memory_allocation': '/api/memory-allocation',
+                'memory_allocation_timeline': '/api/memory-allocation/timeline',
+                'memory_allocation_compare': '/api/memory-allocation/compare',
+                'address_translation': '/api/address-translation'
             }
     })
 
+def _simulate_multiprocessor(data, processes, policy):
+    """Run a scheduling request that asks for more than one CPU"""
+    num_cpus = data.get('num_cpus', 1)
+    balancing = data.get('balancing', 'global')
+    
+    if num_cpus < 1:
+        return jsonify({'error': 'Number of CPUs must be at least 1'}), 400
+    
+    if data.get('preemptive', False):
+        return jsonify({'error': 'Preemptive scheduling supports a single CPU only'}), 400
+    
+    if data.get('stream', False):
+        return jsonify({'error': 'Streaming supports a single CPU only'}), 400
+    
+    if data.get('max_segments') is not None:
+        return jsonify({'error': 'Gantt downsampling supports a single CPU only'}), 400
+    
+    if balancing not in smp.balancing_policies:
+        return jsonify({'error': 'Invalid balancing. Must be "global", "per_cpu", or "work_stealing"'}), 400
+    
+    result = smp.simulate(processes, policy, num_cpus, balancing,
+                          data.get('time_quantum', 2), data.get('balance_interval', 10))
+    return jsonify(result)
+
+def _stream_schedule(stream, processes, *args):
+    """Send a scheduling result as NDJSON, with the metrics on the last line"""
+    # Build the table before the response starts, so bad input still gets an error status
+    table = ProcessTable.from_processes(processes)
+    return Response(schedule_stream.ndjson(stream(table, *args)), mimetype='application/x-ndjson')
+
 @app.route('/api/scheduling/fcfs', methods=['POST'])
 def api_fcfs():
     """FCFS CPU Scheduling API endpoint"""
     try:
         data = request.get_json()
         processes = data.get('processes', [])
+        max_segments = data.get('max_segments')
         
         if not processes:
             return jsonify({'error': 'No processes provided'}), 400
         
-        result = fcfs.simulate(processes)
+        if data.get('num_cpus', 1) != 1:
+            return _simulate_multiprocessor(data, processes, 'fcfs')
+        
+        if max_segments is not None and max_segments < 1:
+            return jsonify({'error': 'max_segments must be at least 1'}), 400
+        
+        if data.get('stream', False):
+            return _stream_schedule(fcfs.stream, processes, max_segments)
+        
+        result = fcfs.simulate(processes, max_segments)
         return jsonify(result)
     
     except Exception as e:
@@ -94,15 +152,26 @@ def api_fcfs():
 
 @app.route('/api/scheduling/sjf', methods=['POST'])
 def api_sjf():
-    """SJF CPU Scheduling API endpoint"""
+    """SJF CPU Scheduling API endpoint (SRTF when preemptive)"""
     try:
         data = request.get_json()
         processes = data.get('processes', [])
+        preemptive = data.get('preemptive', False)
+        max_segments = data.get('max_segments')
         
         if not processes:
             return jsonify({'error': 'No processes provided'}), 400
         
-        result = sjf.simulate(processes)
+        if data.get('num_cpus', 1) != 1:
+            return _simulate_multiprocessor(data, processes, 'sjf')
+        
+        if max_segments is not None and max_segments < 1:
+            return jsonify({'error': 'max_segments must be at least 1'}), 400
+        
+        if data.get('stream', False):
+            return _stream_schedule(sjf.stream, processes, preemptive, max_segments)
+        
+        result = sjf.simulate(processes, preemptive, max_segments)
         return jsonify(result)
     
     except Exception as e:
@@ -114,11 +183,22 @@ def api_priority():
     try:
         data = request.get_json()
         processes = data.get('processes', [])
+        preemptive = data.get('preemptive', False)
+        max_segments = data.get('max_segments')
         
         if not processes:
             return jsonify({'error': 'No processes provided'}), 400
         
-        result = priority.simulate(processes)
+        if data.get('num_cpus', 1) != 1:
+            return _simulate_multiprocessor(data, processes, 'priority')
+        
+        if max_segments is not None and max_segments < 1:
+            return jsonify({'error': 'max_segments must be at least 1'}), 400
+        
+        if data.get('stream', False):
+            return _stream_schedule(priority.stream, processes, preemptive, max_segments)
+        
+        result = priority.simulate(processes, preemptive, max_segments)
         return jsonify(result)
     
     except Exception as e:
@@ -131,11 +211,84 @@ def api_roundrobin():
         data = request.get_json()
         processes = data.get('processes', [])
         time_quantum = data.get('time_quantum', 2)
+        max_segments = data.get('max_segments')
+        
+        if not processes:
+            return jsonify({'error': 'No processes provided'}), 400
+        
+        if data.get('num_cpus', 1) != 1:
+            return _simulate_multiprocessor(data, processes, 'roundrobin')
+        
+        if max_segments is not None and max_segments < 1:
+            return jsonify({'error': 'max_segments must be at least 1'}), 400
+        
+        if data.get('stream', False):
+            return _stream_schedule(roundrobin.stream, processes, time_quantum, max_segments)
+        
+        result = roundrobin.simulate(processes, time_quantum, max_segments)
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/scheduling/roundrobin/sweep', methods=['POST'])
+def api_roundrobin_sweep():
+    """Round Robin time quantum sweep API endpoint"""
+    try:
+        data = request.get_json()
+        processes = data.get('processes', [])
+        quanta = data.get('quanta', [])
+        include_gantt = data.get('include_gantt', False)
+        
+        if not processes:
+            return jsonify({'error': 'No processes provided'}), 400
+        
+        # Accept either an explicit list or an inclusive {start, end, step} range
+        if isinstance(quanta, dict):
+            quanta = list(range(quanta.get('start', 1), quanta.get('end', 0) + 1, quanta.get('step', 1)))
+        
+        if not quanta:
+            return jsonify({'error': 'No time quanta provided'}), 400
+        
+        if any(q <= 0 for q in quanta):
+            return jsonify({'error': 'Time quanta must be positive'}), 400
+        
+        result = roundrobin.sweep(processes, quanta, include_gantt)
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/scheduling/mlfq', methods=['POST'])
+def api_mlfq():
+    """Multi-Level Feedback Queue CPU Scheduling API endpoint"""
+    try:
+        data = request.get_json()
+        processes = data.get('processes', [])
+        max_segments = data.get('max_segments')
+        quanta = data.get('quanta')
+        num_levels = data.get('num_levels', len(quanta) if quanta else 3)
+        boost_interval = data.get('boost_interval')
         
         if not processes:
             return jsonify({'error': 'No processes provided'}), 400
         
-        result = roundrobin.simulate(processes, time_quantum)
+        if num_levels < 1:
+            return jsonify({'error': 'Number of levels must be at least 1'}), 400
+        
+        if quanta is not None and (len(quanta) != num_levels or any(q <= 0 for q in quanta)):
+            return jsonify({'error': 'Provide one positive time quantum per level'}), 400
+        
+        if boost_interval is not None and boost_interval <= 0:
+            return jsonify({'error': 'Boost interval must be positive'}), 400
+        
+        if max_segments is not None and max_segments < 1:
+            return jsonify({'error': 'max_segments must be at least 1'}), 400
+        
+        if data.get('stream', False):
+            return _stream_schedule(mlfq.stream, processes, num_levels, quanta, boost_interval, max_segments)
+        
+        result = mlfq.simulate(processes, num_levels, quanta, boost_interval, max_segments)
         return jsonify(result)
     
     except Exception as e:
@@ -183,6 +336,8 @@ def api_page_replacement():
         algorithm = data.get('algorithm', 'fifo')
         frames = data.get('frames', 3)
         page_requests = data.get('page_requests', [])
+        trace = data.get('trace', 'full')
+        keyframe_interval = data.get('keyframe_interval', 100)
         
         if not page_requests:
             return jsonify({'error': 'No page requests provided'}), 400
@@ -190,12 +345,125 @@ def api_page_replacement():
         if frames < 1:
             return jsonify({'error': 'Number of frames must be at least 1'}), 400
         
-        result = page_replacement.simulate(algorithm, frames, page_requests)
+        if keyframe_interval < 1:
+            return jsonify({'error': 'keyframe_interval must be at least 1'}), 400
+        
+        result = page_replacement.simulate(algorithm, frames, page_requests, trace, keyframe_interval)
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/page-replacement/mrc', methods=['POST'])
+def api_page_replacement_mrc():
+    """LRU miss-ratio curve API endpoint"""
+    try:
+        data = request.get_json()
+        page_requests = data.get('page_requests', [])
+        max_frames = data.get('max_frames')
+        
+        if not page_requests:
+            return jsonify({'error': 'No page requests provided'}), 400
+        
+        if max_frames is not None and max_frames < 1:
+            return jsonify({'error': 'max_frames must be at least 1'}), 400
+        
+        result = page_replacement.miss_ratio_curve(page_requests, max_frames)
         return jsonify(result)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/page-replacement/fifo-sweep', methods=['POST'])
+def api_page_replacement_fifo_sweep():
+    """FIFO fault curve and Belady's anomaly API endpoint"""
+    try:
+        data = request.get_json()
+        page_requests = data.get('page_requests', [])
+        max_frames = data.get('max_frames')
+        
+        if not page_requests:
+            return jsonify({'error': 'No page requests provided'}), 400
+        
+        if max_frames is not None and max_frames < 1:
+            return jsonify({'error': 'max_frames must be at least 1'}), 400
+        
+        # The sweep keeps the trace as 64-bit integers for its worker processes
+        if any(not isinstance(page, int) or isinstance(page, bool) or not 0 <= page < 2 ** 63
+               for page in page_requests):
+            return jsonify({'error': 'Page numbers must be non-negative integers below 2 ** 63'}), 400
+        
+        result = page_replacement.fifo_sweep(page_requests, max_frames)
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/page-replacement/working-set', methods=['POST'])
+def api_working_set():
+    """Working-set and page-fault-frequency API endpoint"""
+    try:
+        data = request.get_json()
+        page_requests = data.get('page_requests', [])
+        window = data.get('window', 10)
+        pff_threshold = data.get('pff_threshold')
+        sample_interval = data.get('sample_interval', 1)
+        
+        if not page_requests:
+            return jsonify({'error': 'No page requests provided'}), 400
+        
+        if window < 1:
+            return jsonify({'error': 'Window must be at least 1'}), 400
+        
+        if pff_threshold is not None and pff_threshold < 1:
+            return jsonify({'error': 'pff_threshold must be at least 1'}), 400
+        
+        if sample_interval < 1:
+            return jsonify({'error': 'sample_interval must be at least 1'}), 400
+        
+        result = page_replacement.working_set(page_requests, window, pff_threshold, sample_interval)
+        return jsonify(result)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/page-replacement/generate', methods=['POST'])
+def api_generate_page_trace():
+    """Synthetic page trace API endpoint"""
+    try:
+        data = request.get_json()
+        pattern = data.get('pattern', {'type': 'zipf', 'pages': 10})
+        length = data.get('length', 20)
+        seed = data.get('seed')
+        
+        # Longer traces are generated offline with python -m backend.modules.trace_generator
+        if length < 1 or length > 1000000:
+            return jsonify({'error': 'Length must be between 1 and 1000000'}), 400
+        
+        # Zipf patterns build a table per page, so bound the pages as well
+        if trace_generator.pattern_pages(pattern) > 1000000:
+            return jsonify({'error': 'Patterns may span at most 1000000 pages'}), 400
+        
+        page_requests = []
+        for chunk in trace_generator.generate(pattern, length, seed):
+            page_requests.extend(chunk)
+        
+        return jsonify({
+            'success': True,
+            'pattern': pattern,
+            'seed': seed,
+            'page_requests': page_requests
+        })
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/memory-allocation', methods=['POST'])
 def api_memory_allocation():
     """Memory Allocation API endpoint"""
@@ -204,6 +472,7 @@ def api_memory_allocation():
         blocks = data.get('blocks', [])
         processes = data.get('processes', [])
         strategy = data.get('strategy', 'best')
+        sample_interval = data.get('sample_interval', 1)
         
         if not blocks:
             return jsonify({'error': 'No memory blocks provided'}), 400
@@ -211,15 +480,108 @@ def api_memory_allocation():
         if not processes:
             return jsonify({'error': 'No processes provided'}), 400
         
-        if strategy not in ['best', 'first', 'worst']:
-            return jsonify({'error': 'Invalid strategy. Must be "best", "first", or "worst"'}), 400
+        if strategy not in ['best', 'first', 'worst', 'buddy']:
+            return jsonify({'error': 'Invalid strategy. Must be "best", "first", "worst", or "buddy"'}), 400
+        
+        if sample_interval < 1:
+            return jsonify({'error': 'sample_interval must be at least 1'}), 400
         
-        result = memory_allocation.allocate_memory(blocks, processes, strategy)
+        result = memory_allocation.allocate_memory(blocks, processes, strategy, sample_interval)
         return jsonify(result)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/memory-allocation/timeline', methods=['POST'])
+def api_memory_allocation_timeline():
+    """Memory allocation timeline (alloc and free events) API endpoint"""
+    try:
+        data = request.get_json()
+        memory_size = data.get('memory_size')
+        events = data.get('events', [])
+        strategy = data.get('strategy', 'first')
+        sample_interval = data.get('sample_interval', 1)
+        
+        if not isinstance(memory_size, int) or memory_size < 1:
+            return jsonify({'error': 'memory_size must be a positive integer'}), 400
+        
+        if not events:
+            return jsonify({'error': 'No events provided'}), 400
+        
+        if strategy not in ['best', 'first', 'worst', 'tlsf']:
+            return jsonify({'error': 'Invalid strategy. Must be "best", "first", "worst", or "tlsf"'}), 400
+        
+        if sample_interval < 1:
+            return jsonify({'error': 'sample_interval must be at least 1'}), 400
+        
+        result = memory_allocation.simulate_timeline(memory_size, events, strategy,
+                                                     data.get('include_steps', True), sample_interval,
+                                                     data.get('measure_costs', False))
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/memory-allocation/compare', methods=['POST'])
+def api_memory_allocation_compare():
+    """Per-operation allocator cost comparison API endpoint"""
+    try:
+        data = request.get_json()
+        memory_size = data.get('memory_size')
+        events = data.get('events', [])
+        strategies = data.get('strategies', ['tlsf', 'best'])
+        
+        if not isinstance(memory_size, int) or memory_size < 1:
+            return jsonify({'error': 'memory_size must be a positive integer'}), 400
+        
+        if not events:
+            return jsonify({'error': 'No events provided'}), 400
+        
+        if not strategies or any(strategy not in ['best', 'first', 'worst', 'tlsf'] for strategy in strategies):
+            return jsonify({'error': 'Invalid strategies. Each must be "best", "first", "worst", or "tlsf"'}), 400
+        
+        result = memory_allocation.compare_costs(memory_size, events, strategies)
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/address-translation', methods=['POST'])
+def api_address_translation():
+    """Address Translation (TLB and page table) API endpoint"""
+    try:
+        data = request.get_json()
+        # Addresses may be given as numbers or as strings such as "0x7ffe1000"
+        addresses = [int(address, 0) if isinstance(address, str) else address
+                     for address in data.get('addresses', [])]
+        
+        if not addresses:
+            return jsonify({'error': 'No addresses provided'}), 400
+        
+        result = address_translation.simulate(
+            addresses,
+            page_sizes=data.get('page_sizes', [4096]),
+            tlb_entries=data.get('tlb_entries', 64),
+            tlb_ways=data.get('tlb_ways', 4),
+            address_bits=data.get('address_bits', 48),
+            bits_per_level=data.get('bits_per_level', 9),
+            tlb_time=data.get('tlb_time', 1),
+            memory_time=data.get('memory_time', 100)
+        )
+        return jsonify(result)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
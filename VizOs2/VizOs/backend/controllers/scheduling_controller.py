@@ -52,7 +52,9 @@ def sjf(request):
             return error_handler.validation_error("Missing 'processes' field")
         
         processes = data['processes']
-        result = scheduler_service.sjf(processes)
+        preemptive = data.get('preemptive', False)
+        
+        result = scheduler_service.sjf(processes, preemptive)
         
         return response_formatter.success(result, "SJF scheduling completed successfully")
     
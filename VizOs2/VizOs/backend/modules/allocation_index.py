@@ -0,0 +1,374 @@
+"""
+Allocation Index
+Search structures that find a fitting memory block in O(log blocks)
+"""
+
+from bisect import bisect_left, insort
+from itertools import compress, count
+
+
+class SortedRuns:
+    """
+    Sorted list kept as short sorted runs
+
+    Inserting into or deleting from one long sorted list shifts half of it
+    on average; here only one run of at most 2 * RUN items shifts, found
+    by binary search over the run maxima.
+    """
+
+    RUN = 512
+
+    def __init__(self, items=()):
+        items = sorted(items)
+        self.runs = [items[start:start + self.RUN] for start in range(0, len(items), self.RUN)]
+        self.maxes = [run[-1] for run in self.runs]
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def __iter__(self):
+        for run in self.runs:
+            yield from run
+
+    def last(self):
+        """Largest item, or None when empty"""
+        return self.maxes[-1] if self.maxes else None
+
+    def ceiling(self, value):
+        """Smallest item not below value, or None"""
+        position = bisect_left(self.maxes, value)
+        if position == len(self.maxes):
+            return None
+        run = self.runs[position]
+        return run[bisect_left(run, value)]
+
+    def add(self, value):
+        """Insert an item"""
+        maxes = self.maxes
+        if not maxes:
+            self.runs.append([value])
+            maxes.append(value)
+            return
+
+        position = bisect_left(maxes, value)
+        if position == len(maxes):
+            position -= 1
+            self.runs[position].append(value)
+            maxes[position] = value
+        else:
+            insort(self.runs[position], value)
+
+        run = self.runs[position]
+        if len(run) > 2 * self.RUN:
+            half = len(run) // 2
+            self.runs[position:position + 1] = [run[:half], run[half:]]
+            maxes[position:position + 1] = [run[half - 1], run[-1]]
+
+    def remove(self, value):
+        """Delete an item, which must be present"""
+        position = bisect_left(self.maxes, value)
+        run = self.runs[position]
+        del run[bisect_left(run, value)]
+        if run:
+            self.maxes[position] = run[-1]
+        else:
+            del self.runs[position]
+            del self.maxes[position]
+
+
+class SizeIndex:
+    """
+    Blocks kept sorted by (remaining size, block index)
+
+    Best fit is the first entry at or above the request; worst fit is the
+    first entry of the largest size. Both prefer the lowest block index
+    among equal sizes. Shrinking a block moves its entry within the
+    sorted runs in O(log blocks) searches.
+    """
+
+    def __init__(self, sizes, largest=False):
+        """
+        Args:
+            sizes: Remaining size of every block
+            largest: Find the largest fitting block (worst fit) instead of
+                the smallest (best fit)
+        """
+        self.sizes = list(sizes)
+        self.entries = SortedRuns((size, index) for index, size in enumerate(self.sizes))
+        self.largest = largest
+
+    def find(self, size):
+        """Index of the fitting block, or None if no block is large enough"""
+        last = self.entries.last()
+        if last is None or last[0] < size:
+            return None
+        if self.largest:
+            return self.entries.ceiling((last[0], -1))[1]
+        return self.entries.ceiling((size, -1))[1]
+
+    def resize(self, index, size):
+        """Change the remaining size of a block"""
+        self.entries.remove((self.sizes[index], index))
+        self.entries.add((size, index))
+        self.sizes[index] = size
+
+
+class MaxSegmentTree:
+    """
+    Segment tree of the largest remaining size in every range of blocks
+
+    First fit descends from the root, always into the left child when it
+    holds a large enough block, so it reaches the lowest-index fitting
+    block in O(log blocks).
+    """
+
+    def __init__(self, sizes):
+        """
+        Args:
+            sizes: Remaining size of every block
+        """
+        sizes = list(sizes)
+        leaves = 1
+        while leaves < len(sizes):
+            leaves *= 2
+        # Padding leaves hold -1 so that they never fit, even a zero-size request
+        tree = [-1] * (2 * leaves)
+        tree[leaves:leaves + len(sizes)] = sizes
+        for node in range(leaves - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.leaves = leaves
+        self.tree = tree
+
+    def find(self, size):
+        """Index of the first block large enough, or None"""
+        tree = self.tree
+        if tree[1] < size:
+            return None
+        node = 1
+        while node < self.leaves:
+            node *= 2
+            if tree[node] < size:
+                node += 1
+        return node - self.leaves
+
+    def resize(self, index, size):
+        """Change the remaining size of a block"""
+        tree = self.tree
+        node = index + self.leaves
+        tree[node] = size
+        node //= 2
+        while node:
+            left, right = tree[2 * node], tree[2 * node + 1]
+            largest = left if left > right else right
+            if tree[node] == largest:
+                # Ancestors already hold the right maxima
+                break
+            tree[node] = largest
+            node //= 2
+
+
+class FreeList:
+    """
+    Free extents of one region of memory, in address order
+
+    Extents are kept as short sorted runs of start addresses, each run
+    with a parallel list of extent sizes. Neighbours of a freed range are
+    found by binary search, so freeing merges it with the extents on
+    either side in O(log extents). A segment tree over the largest
+    extent of every run finds the lowest-address fitting extent (first
+    fit) and sorted (size, start) entries find the best and worst fit.
+    """
+
+    RUN = 64
+
+    def __init__(self, size, metrics=None):
+        """
+        Args:
+            size: Size of the region, free as one extent
+            metrics: Optional FragmentationMetrics told about every
+                free extent added or removed
+        """
+        self.metrics = metrics
+        self.starts = []  # Runs of extent start addresses
+        self.sizes = []  # Extent sizes, parallel to starts
+        self.maxes = []  # Last start address of every run
+        self.tops = []  # Largest extent of every run
+        self.by_size = SortedRuns()
+        self.free_units = 0
+        if size > 0:
+            self._insert(0, size)
+            self.free_units = size
+        self._rebuild()
+
+    def __len__(self):
+        return sum(len(run) for run in self.starts)
+
+    def __iter__(self):
+        """Free extents as (start, size) pairs in address order"""
+        for starts, sizes in zip(self.starts, self.sizes):
+            yield from zip(starts, sizes)
+
+    def largest(self):
+        """Size of the largest free extent, or 0 if memory is full"""
+        last = self.by_size.last()
+        return last[0] if last else 0
+
+    def find(self, size, strategy='first'):
+        """
+        Start address of the free extent a request should take
+
+        Args:
+            size: Requested size
+            strategy: "first" (lowest address), "best" (smallest) or
+                "worst" (largest) fitting extent; ties go to the lowest address
+
+        Returns:
+            Start address of the extent, or None if no extent is large enough
+        """
+        if strategy == 'first':
+            run = self.tree.find(size)
+            if run is None:
+                return None
+            # First extent of the run that fits, scanned without a Python loop
+            position = next(compress(count(), map(size.__le__, self.sizes[run])))
+            return self.starts[run][position]
+        last = self.by_size.last()
+        if last is None or last[0] < size:
+            return None
+        if strategy == 'worst':
+            return self.by_size.ceiling((last[0], -1))[1]
+        return self.by_size.ceiling((size, -1))[1]
+
+    def take(self, start, size):
+        """Allocate size units from the front of the free extent at start"""
+        run, position = self._locate(start)
+        extent = self.sizes[run][position]
+        if extent < size:
+            raise ValueError(f'Free extent at {start} is smaller than {size}')
+        self.free_units -= size
+        if extent == size:
+            self._delete(run, position)
+            return
+
+        # The rest of the extent keeps its place in address order
+        starts = self.starts[run]
+        sizes = self.sizes[run]
+        starts[position] = start + size
+        sizes[position] = extent - size
+        self.maxes[run] = starts[-1]
+        self.by_size.remove((extent, start))
+        self.by_size.add((extent - size, start + size))
+        if self.metrics is not None:
+            self.metrics.remove(extent)
+            self.metrics.add(extent - size)
+        if extent == self.tops[run]:
+            self.tops[run] = max(sizes)
+            self.tree.resize(run, self.tops[run])
+
+    def release(self, start, size):
+        """
+        Free size units at start, merging them with adjacent free extents
+
+        Returns:
+            Tuple of (start, size) of the free extent after merging
+
+        Raises:
+            ValueError: If the range overlaps free memory
+        """
+        end = start + size
+        run = bisect_left(self.maxes, start)
+        if run == len(self.maxes):
+            run -= 1
+        position = bisect_left(self.starts[run], start) if run >= 0 else 0
+
+        # Neighbours: the last extent before start and the first one from it
+        before = None
+        if position > 0:
+            before = (run, position - 1)
+        elif run > 0:
+            before = (run - 1, len(self.starts[run - 1]) - 1)
+        after = (run, position) if run >= 0 and position < len(self.starts[run]) else None
+
+        if after is not None and self.starts[after[0]][after[1]] < end:
+            raise ValueError(f'Range {start}-{end} overlaps free memory')
+        if before is not None:
+            before_start = self.starts[before[0]][before[1]]
+            before_end = before_start + self.sizes[before[0]][before[1]]
+            if before_end > start:
+                raise ValueError(f'Range {start}-{end} overlaps free memory')
+
+        self.free_units += size
+        # Delete the right neighbour first, so the left one's position stays valid
+        if after is not None and self.starts[after[0]][after[1]] == end:
+            size += self.sizes[after[0]][after[1]]
+            self._delete(*after)
+        if before is not None and before_end == start:
+            start = before_start
+            size += self.sizes[before[0]][before[1]]
+            self._delete(*before)
+        self._insert(start, size)
+        return start, size
+
+    def _locate(self, start):
+        """Run and position of the extent starting at start"""
+        run = bisect_left(self.maxes, start)
+        if run < len(self.maxes):
+            position = bisect_left(self.starts[run], start)
+            if self.starts[run][position] == start:
+                return run, position
+        raise ValueError(f'No free extent starts at {start}')
+
+    def _delete(self, run, position):
+        starts = self.starts[run]
+        sizes = self.sizes[run]
+        start = starts.pop(position)
+        size = sizes.pop(position)
+        self.by_size.remove((size, start))
+        if self.metrics is not None:
+            self.metrics.remove(size)
+        if not starts:
+            del self.starts[run], self.sizes[run], self.maxes[run], self.tops[run]
+            self._rebuild()
+            return
+        self.maxes[run] = starts[-1]
+        if size == self.tops[run]:
+            self.tops[run] = max(sizes)
+            self.tree.resize(run, self.tops[run])
+
+    def _insert(self, start, size):
+        self.by_size.add((size, start))
+        if self.metrics is not None:
+            self.metrics.add(size)
+        if not self.starts:
+            self.starts.append([start])
+            self.sizes.append([size])
+            self.maxes.append(start)
+            self.tops.append(size)
+            self._rebuild()
+            return
+
+        run = bisect_left(self.maxes, start)
+        if run == len(self.maxes):
+            run -= 1
+        starts = self.starts[run]
+        sizes = self.sizes[run]
+        position = bisect_left(starts, start)
+        starts.insert(position, start)
+        sizes.insert(position, size)
+        self.maxes[run] = starts[-1]
+
+        if len(starts) > 2 * self.RUN:
+            half = len(starts) // 2
+            self.starts[run:run + 1] = [starts[:half], starts[half:]]
+            self.sizes[run:run + 1] = [sizes[:half], sizes[half:]]
+            self.maxes[run:run + 1] = [starts[half - 1], starts[-1]]
+            self.tops[run:run + 1] = [max(sizes[:half]), max(sizes[half:])]
+            self._rebuild()
+        elif size > self.tops[run]:
+            self.tops[run] = size
+            self.tree.resize(run, size)
+
+    def _rebuild(self):
+        # Runs are split or dropped only every RUN or so changes, so the
+        # O(runs) rebuild is cheap spread over them
+        self.tree = MaxSegmentTree(self.tops)
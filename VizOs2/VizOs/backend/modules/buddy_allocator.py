@@ -0,0 +1,147 @@
+"""
+Buddy Allocator
+Binary buddy system with per-order free lists and free bitmaps
+"""
+
+from collections import OrderedDict
+
+
+class BuddyAllocator:
+    """
+    Binary buddy allocator over one region of memory
+
+    Memory is handed out in power-of-two chunks. A chunk of order k
+    (2 ** k units) lies at an address that is a multiple of its size, and
+    its buddy is the chunk at address ^ 2 ** k. An allocation splits the
+    smallest free chunk that fits; a free merges the chunk with its buddy
+    for as long as the buddy is free too.
+
+    Every order has a free list and a bitmap with one bit per chunk
+    position, so "is my buddy free" is one bit test. A mask of the
+    orders whose free lists are non-empty finds the smallest usable
+    order without scanning. Allocation and free are O(max_order).
+
+    A region whose size is not a power of two starts out as the aligned
+    power-of-two chunks that make it up, largest first. Their buddies
+    past the end are never free, so chunks never merge across the end.
+    """
+
+    def __init__(self, size, min_order=0, metrics=None):
+        """
+        Args:
+            size: Size of the region in units
+            min_order: Order of the smallest chunk handed out
+            metrics: Optional FragmentationMetrics told about every free
+                chunk added or removed
+        """
+        self.metrics = metrics
+        self.size = size
+        self.min_order = min_order
+        self.max_order = max(size - 1, 1).bit_length()
+        self.free_lists = [OrderedDict() for _ in range(self.max_order + 1)]
+        self.free_bits = [bytearray(((1 << self.max_order >> order) + 7) // 8)
+                          for order in range(self.max_order + 1)]
+        self.available = 0  # Bit k is set while free_lists[k] is non-empty
+        self.allocated = {}  # Address -> order of every allocated chunk
+
+        address = 0
+        for order in range(self.max_order, min_order - 1, -1):
+            if size - address >= 1 << order:
+                self._push(address, order)
+                address += 1 << order
+        self.free_units = address
+
+    def order_for(self, size):
+        """Order of the chunk that an allocation of size units takes"""
+        return max(self.min_order, max(size - 1, 0).bit_length())
+
+    def largest_free(self):
+        """Size of the largest free chunk, or 0 if memory is full"""
+        return 1 << (self.available.bit_length() - 1) if self.available else 0
+
+    def alloc(self, size):
+        """
+        Allocate a chunk large enough for size units
+
+        Args:
+            size: Requested size in units
+
+        Returns:
+            Tuple of (address, order) of the chunk, or None if no free chunk fits
+        """
+        order = self.order_for(size)
+        usable = self.available >> order
+        if not usable:
+            return None
+
+        # Smallest order at or above the request with a free chunk
+        current = order + (usable & -usable).bit_length() - 1
+        address = self._pop(current)
+        while current > order:
+            # Split, keeping the lower half and freeing the upper buddy
+            current -= 1
+            self._push(address + (1 << current), current)
+
+        self.allocated[address] = order
+        self.free_units -= 1 << order
+        return address, order
+
+    def free(self, address):
+        """
+        Free an allocated chunk, merging it with free buddies
+
+        Args:
+            address: Address returned by alloc()
+
+        Returns:
+            Tuple of (address, order) of the free chunk after merging
+
+        Raises:
+            KeyError: If no chunk is allocated at the address
+        """
+        order = self.allocated.pop(address)
+        self.free_units += 1 << order
+
+        while order < self.max_order:
+            buddy = address ^ (1 << order)
+            index = buddy >> order
+            if not self.free_bits[order][index >> 3] & (1 << (index & 7)):
+                break
+            self._remove(buddy, order)
+            address = min(address, buddy)
+            order += 1
+
+        self._push(address, order)
+        return address, order
+
+    def free_chunks(self):
+        """Free chunks as (address, size) pairs in address order"""
+        return sorted((address, 1 << order)
+                      for order, free_list in enumerate(self.free_lists)
+                      for address in free_list)
+
+    def _push(self, address, order):
+        index = address >> order
+        self.free_bits[order][index >> 3] |= 1 << (index & 7)
+        self.free_lists[order][address] = None
+        self.available |= 1 << order
+        if self.metrics is not None:
+            self.metrics.add(1 << order)
+
+    def _pop(self, order):
+        free_list = self.free_lists[order]
+        address, _ = free_list.popitem()
+        self._clear(address, order)
+        return address
+
+    def _remove(self, address, order):
+        del self.free_lists[order][address]
+        self._clear(address, order)
+
+    def _clear(self, address, order):
+        index = address >> order
+        self.free_bits[order][index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        if not self.free_lists[order]:
+            self.available &= ~(1 << order)
+        if self.metrics is not None:
+            self.metrics.remove(1 << order)
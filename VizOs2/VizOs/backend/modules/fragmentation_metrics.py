@@ -0,0 +1,81 @@
+"""
+Fragmentation Metrics
+External fragmentation of free memory, kept up to date as extents change
+"""
+
+from backend.modules.allocation_index import SortedRuns
+
+
+class FragmentationMetrics:
+    """
+    Free memory statistics updated one free extent at a time
+
+    The allocators report every free extent they create or remove. The
+    total, the extent count and a histogram of power-of-two size classes
+    change in O(1); the extent sizes are kept sorted, so the largest free
+    extent changes in O(log extents). Nothing is recomputed over all of
+    memory, however often a snapshot is taken.
+    """
+
+    def __init__(self, sizes=()):
+        """
+        Args:
+            sizes: Sizes of the initial free extents
+        """
+        sizes = [size for size in sizes if size > 0]
+        self.total_free = sum(sizes)
+        self.extents = len(sizes)
+        self.sizes = SortedRuns(sizes)
+        # Entry k counts extents from 2 ** k up to 2 ** (k + 1) units; entry 0
+        # also holds extents under one unit, as block sizes need not be integers
+        self.histogram = []
+        for size in sizes:
+            self._count(size, 1)
+
+    def add(self, size):
+        """Record a new free extent"""
+        if size > 0:
+            self.total_free += size
+            self.extents += 1
+            self.sizes.add(size)
+            self._count(size, 1)
+
+    def remove(self, size):
+        """Record that a free extent was allocated or merged away"""
+        if size > 0:
+            self.total_free -= size
+            self.extents -= 1
+            self.sizes.remove(size)
+            self._count(size, -1)
+
+    def largest(self):
+        """Size of the largest free extent, or 0 if memory is full"""
+        return self.sizes.last() or 0
+
+    def fragmentation_index(self):
+        """
+        Share of free memory outside the largest free extent
+
+        0 when all free memory is one extent (or none is free), close to 1
+        when it is scattered over many small extents.
+        """
+        if not self.total_free:
+            return 0
+        return 1 - self.largest() / self.total_free
+
+    def snapshot(self):
+        """Current metrics as a dictionary"""
+        return {
+            'total_free': self.total_free,
+            'largest_free': self.largest(),
+            'free_extents': self.extents,
+            'fragmentation_index': round(self.fragmentation_index(), 4),
+            'histogram': [{'min_size': 1 << k, 'count': count}
+                          for k, count in enumerate(self.histogram) if count]
+        }
+
+    def _count(self, size, delta):
+        size_class = max(int(size).bit_length() - 1, 0)
+        if size_class >= len(self.histogram):
+            self.histogram.extend([0] * (size_class + 1 - len(self.histogram)))
+        self.histogram[size_class] += delta
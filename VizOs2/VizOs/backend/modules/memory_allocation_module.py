@@ -1,31 +1,59 @@
 """
 Memory Allocation Module
-Implements Best Fit, First Fit, and Worst Fit memory allocation strategies
+Implements Best Fit, First Fit, Worst Fit and Buddy System memory allocation strategies,
+and a timeline of allocations and frees in one region of memory (including TLSF)
 """
 
-from typing import List, Dict, Any, Optional
+from time import perf_counter_ns
+from typing import List, Dict, Any, Iterable, Sequence
+
+from backend.modules.allocation_index import SizeIndex, MaxSegmentTree, FreeList
+from backend.modules.buddy_allocator import BuddyAllocator
+from backend.modules.fragmentation_metrics import FragmentationMetrics
+from backend.modules.tlsf_allocator import TLSFAllocator
 
 class MemoryAllocationModule:
     def __init__(self):
         pass
 
-    def allocate_memory(self, blocks: List[int], processes: List[int], strategy: str = "best") -> Dict[str, Any]:
+    def allocate_memory(self, blocks: List[int], processes: List[int], strategy: str = "best",
+                        sample_interval: int = 1) -> Dict[str, Any]:
         """
         Allocate memory to processes using the specified strategy
         
         Args:
             blocks: List of memory block sizes
             processes: List of process memory requirements
-            strategy: "best", "first", or "worst"
-            
+            strategy: "best", "first", "worst", or "buddy"
+            sample_interval: Report fragmentation after every sample_interval-th process
+        
         Returns:
             Dictionary containing allocation results
         """
+        if strategy.lower() == "buddy":
+            return self._allocate_buddy(blocks, processes, sample_interval)
+        
         # Create a copy of blocks to track remaining space
         remaining_blocks = blocks.copy()
         allocation = []
         steps = []
         final_block_status = []
+        # The free part of every block is one free extent
+        metrics = FragmentationMetrics(blocks)
+        fragmentation = []
+        
+        # Search structure for the strategy, shrunk as blocks fill up
+        if strategy.lower() == "best":
+            index = SizeIndex(blocks)
+        elif strategy.lower() == "first":
+            index = MaxSegmentTree(blocks)
+        elif strategy.lower() == "worst":
+            index = SizeIndex(blocks, largest=True)
+        else:
+            return {
+                'success': False,
+                'error': f'Unknown strategy: {strategy}'
+            }
         
         for process_idx, process_size in enumerate(processes):
             step = {
@@ -36,24 +64,14 @@ class MemoryAllocationModule:
                 'description': ''
             }
             
-            allocated_block = None
+            block_idx = index.find(process_size)
             
-            if strategy.lower() == "best":
-                allocated_block = self._best_fit(remaining_blocks, process_size)
-            elif strategy.lower() == "first":
-                allocated_block = self._first_fit(remaining_blocks, process_size)
-            elif strategy.lower() == "worst":
-                allocated_block = self._worst_fit(remaining_blocks, process_size)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unknown strategy: {strategy}'
-                }
-            
-            if allocated_block is not None:
-                block_idx = allocated_block['index']
+            if block_idx is not None:
                 # Update remaining block size
+                metrics.remove(remaining_blocks[block_idx])
                 remaining_blocks[block_idx] -= process_size
+                metrics.add(remaining_blocks[block_idx])
+                index.resize(block_idx, remaining_blocks[block_idx])
                 
                 allocation.append({
                     'process': process_size,
@@ -73,6 +91,7 @@ class MemoryAllocationModule:
                 step['description'] = f'Process {process_size} cannot be allocated - no free block available'
             
             steps.append(step)
+            self._sample_fragmentation(fragmentation, metrics, process_idx + 1, sample_interval)
         
         # Create final block status
         for idx, (original_size, remaining_size) in enumerate(zip(blocks, remaining_blocks)):
@@ -92,68 +111,320 @@ class MemoryAllocationModule:
             'processes': processes,
             'allocation': allocation,
             'steps': steps,
-            'final_block_status': final_block_status
+            'final_block_status': final_block_status,
+            'sample_interval': sample_interval,
+            'fragmentation': fragmentation,
+            'final_fragmentation': metrics.snapshot()
         }
 
-    def _best_fit(self, blocks: List[int], process_size: int) -> Optional[Dict[str, int]]:
+    def _allocate_buddy(self, blocks: List[int], processes: List[int], sample_interval: int) -> Dict[str, Any]:
         """
-        Best Fit: Find the smallest block that can accommodate the process
+        Allocate memory with a buddy system in every block
+        
+        Each request is rounded up to a power-of-two chunk, taken from the
+        first block whose largest free chunk fits it. The rounding is the
+        internal fragmentation reported for every step.
         
         Args:
-            blocks: List of available block sizes
-            process_size: Size of the process
-            
+            blocks: List of memory block sizes
+            processes: List of process memory requirements
+            sample_interval: Report fragmentation after every sample_interval-th process
+        
         Returns:
-            Dictionary with 'index' and 'size' of the best fitting block, or None
+            Dictionary containing allocation results
         """
-        best_idx = None
-        best_size = float('inf')
+        metrics = FragmentationMetrics()
+        allocators = [BuddyAllocator(size, metrics=metrics) for size in blocks]
+        # Largest free chunk per block, to find the first block that fits
+        largest_free = MaxSegmentTree([allocator.largest_free() for allocator in allocators])
+        allocation = []
+        steps = []
+        fragmentation = []
+        total_internal = 0
         
-        for idx, block_size in enumerate(blocks):
-            if block_size >= process_size and block_size < best_size:
-                best_size = block_size
-                best_idx = idx
+        for process_idx, process_size in enumerate(processes):
+            step = {
+                'process_index': process_idx + 1,
+                'process': process_size,
+                'status': 'not_allocated',
+                'block': None,
+                'address': None,
+                'chunk_size': None,
+                'internal_fragmentation': 0,
+                'total_internal_fragmentation': 0,
+                'description': ''
+            }
+            
+            chunk_size = 1 << max(process_size - 1, 0).bit_length()
+            block_idx = largest_free.find(chunk_size)
+            
+            if block_idx is not None:
+                allocator = allocators[block_idx]
+                address, order = allocator.alloc(process_size)
+                largest_free.resize(block_idx, allocator.largest_free())
+                internal = (1 << order) - process_size
+                total_internal += internal
+                
+                allocation.append({
+                    'process': process_size,
+                    'block': block_idx + 1
+                })
+                
+                step['status'] = 'allocated'
+                step['block'] = block_idx + 1
+                step['address'] = address
+                step['chunk_size'] = 1 << order
+                step['internal_fragmentation'] = internal
+                step['description'] = (f'Process {process_size} allocated a {1 << order}-unit chunk at offset {address} '
+                                       f'of block {block_idx + 1} (internal fragmentation: {internal})')
+            else:
+                allocation.append({
+                    'process': process_size,
+                    'block': None
+                })
+                
+                step['description'] = f'Process {process_size} cannot be allocated - no free buddy chunk of {chunk_size} units'
+            
+            step['total_internal_fragmentation'] = total_internal
+            steps.append(step)
+            self._sample_fragmentation(fragmentation, metrics, process_idx + 1, sample_interval)
         
-        if best_idx is not None:
-            return {'index': best_idx, 'size': best_size}
-        return None
+        final_block_status = []
+        for idx, (size, allocator) in enumerate(zip(blocks, allocators)):
+            final_block_status.append({
+                'block_number': idx + 1,
+                'size': size,
+                'allocated': size - allocator.free_units,
+                'remaining': allocator.free_units,
+                'is_free': allocator.free_units == size,
+                'free_chunks': [[address, chunk] for address, chunk in allocator.free_chunks()]
+            })
+        
+        return {
+            'success': True,
+            'strategy': 'buddy',
+            'blocks': blocks,
+            'processes': processes,
+            'allocation': allocation,
+            'steps': steps,
+            'final_block_status': final_block_status,
+            'total_internal_fragmentation': total_internal,
+            'sample_interval': sample_interval,
+            'fragmentation': fragmentation,
+            'final_fragmentation': metrics.snapshot()
+        }
 
-    def _first_fit(self, blocks: List[int], process_size: int) -> Optional[Dict[str, int]]:
+    def simulate_timeline(self, memory_size: int, events: Iterable, strategy: str = "first",
+                          include_steps: bool = True, sample_interval: int = 1,
+                          measure_costs: bool = False) -> Dict[str, Any]:
         """
-        First Fit: Find the first block that can accommodate the process
+        Replay a timeline of allocations and frees in one region of memory
+        
+        Events are {'type': 'alloc', 'id': ..., 'size': ...} and
+        {'type': 'free', 'id': ...}, or the shorter ['alloc', id, size] and
+        ['free', id]. Memory is kept as an address-ordered free list and a
+        freed range is merged with the free extents on either side at once,
+        so fragmentation shows up as it would in a real heap. Every event
+        costs O(log extents), or O(1) with the TLSF allocator.
+        
+        Freeing an id whose allocation failed is skipped; freeing an id
+        that was never allocated is an error.
         
         Args:
-            blocks: List of available block sizes
-            process_size: Size of the process
-            
+            memory_size: Size of the region
+            events: Iterable of alloc and free events, in time order
+            strategy: "best", "first", or "worst" fit over the free extents,
+                or "tlsf" for a two-level segregated fit allocator
+            include_steps: Record every event in 'steps' (turn off for long timelines)
+            sample_interval: Report fragmentation after every sample_interval-th event
+            measure_costs: Time every allocation and free, and report the
+                distribution in 'costs' (with step counts for TLSF). The
+                timings then cover the allocator alone, so fragmentation
+                is not sampled and is only reported for the final state
+        
         Returns:
-            Dictionary with 'index' and 'size' of the first fitting block, or None
+            Dictionary containing timeline results
+        
+        Raises:
+            ValueError: If an event is malformed or frees memory that is not allocated
         """
-        for idx, block_size in enumerate(blocks):
-            if block_size >= process_size:
-                return {'index': idx, 'size': block_size}
-        return None
+        strategy = strategy.lower()
+        if strategy not in ('best', 'first', 'worst', 'tlsf'):
+            return {
+                'success': False,
+                'error': f'Unknown strategy: {strategy}'
+            }
+        
+        metrics = None if measure_costs else FragmentationMetrics()
+        if strategy == 'tlsf':
+            heap = TLSFAllocator(memory_size, metrics)
+        else:
+            heap = FreeList(memory_size, metrics)
+        # Only TLSF counts its steps, each one constant time
+        counts_steps = strategy == 'tlsf'
+        times = {'alloc': [], 'free': []}
+        op_steps = {'alloc': [], 'free': []}
+        live = {}  # Id -> (address, size) of every allocation not yet freed
+        failed = set()  # Ids whose allocation failed and that are not freed yet
+        steps = []
+        fragmentation = []
+        allocations = 0
+        failed_allocations = 0
+        frees = 0
+        total_events = 0
+        
+        for event in events:
+            total_events += 1
+            if isinstance(event, dict):
+                kind, block_id, size = event.get('type'), event.get('id'), event.get('size')
+            else:
+                kind, block_id, *size = event
+                size = size[0] if size else None
+            address = None
+            elapsed = None
+            steps_before = heap.steps if counts_steps else 0
+            
+            if kind == 'alloc':
+                if block_id in live:
+                    raise ValueError(f'Event {total_events}: {block_id} is already allocated')
+                if not isinstance(size, int) or size < 1:
+                    raise ValueError(f'Event {total_events}: allocation size must be a positive integer')
+                started = perf_counter_ns()
+                address = heap.find(size, strategy)
+                if address is not None:
+                    heap.take(address, size)
+                elapsed = perf_counter_ns() - started
+                if address is None:
+                    failed_allocations += 1
+                    failed.add(block_id)
+                    status = 'not_allocated'
+                else:
+                    allocations += 1
+                    live[block_id] = (address, size)
+                    status = 'allocated'
+            elif kind == 'free':
+                if block_id in live:
+                    frees += 1
+                    address, size = live.pop(block_id)
+                    started = perf_counter_ns()
+                    heap.release(address, size)
+                    elapsed = perf_counter_ns() - started
+                    status = 'freed'
+                elif block_id in failed:
+                    failed.discard(block_id)
+                    status = 'skipped'
+                else:
+                    raise ValueError(f'Event {total_events}: {block_id} is not allocated')
+            else:
+                raise ValueError(f'Event {total_events}: unknown event type {kind}')
+            
+            if measure_costs and elapsed is not None:
+                times[kind].append(elapsed)
+                if counts_steps:
+                    op_steps[kind].append(heap.steps - steps_before)
+            
+            if include_steps:
+                steps.append({
+                    'event_index': total_events,
+                    'type': kind,
+                    'id': block_id,
+                    'size': size,
+                    'status': status,
+                    'address': address,
+                    'free_memory': heap.free_units,
+                    'description': self._timeline_description(kind, block_id, size, status, address)
+                })
+            if metrics is not None:
+                self._sample_fragmentation(fragmentation, metrics, total_events, sample_interval)
+        
+        if metrics is None:
+            metrics = FragmentationMetrics(size for _, size in heap)
+        result = {
+            'success': True,
+            'strategy': strategy,
+            'memory_size': memory_size,
+            'total_events': total_events,
+            'allocations': allocations,
+            'failed_allocations': failed_allocations,
+            'frees': frees,
+            'live_allocations': len(live),
+            'allocated_memory': memory_size - heap.free_units,
+            'free_memory': heap.free_units,
+            'largest_free_extent': metrics.largest(),
+            'steps': steps,
+            'sample_interval': sample_interval,
+            'fragmentation': fragmentation,
+            'final_fragmentation': metrics.snapshot(),
+            'free_extents': [[start, size] for start, size in heap]
+        }
+        if measure_costs:
+            result['costs'] = {kind: self._cost_summary(times[kind], op_steps[kind]) for kind in times}
+        return result
 
-    def _worst_fit(self, blocks: List[int], process_size: int) -> Optional[Dict[str, int]]:
+    def compare_costs(self, memory_size: int, events: Sequence, strategies: Sequence[str] = ('tlsf', 'best')) -> Dict[str, Any]:
         """
-        Worst Fit: Find the largest block that can accommodate the process
+        Replay the same timeline with several strategies and compare their costs
         
         Args:
-            blocks: List of available block sizes
-            process_size: Size of the process
-            
+            memory_size: Size of the region
+            events: Alloc and free events (see simulate_timeline), replayed once per strategy
+            strategies: Timeline strategies to compare
+        
         Returns:
-            Dictionary with 'index' and 'size' of the worst fitting block, or None
-        """
-        worst_idx = None
-        worst_size = -1
+            Dictionary containing the per-operation costs, failed
+            allocations and final fragmentation of every strategy
         
-        for idx, block_size in enumerate(blocks):
-            if block_size >= process_size and block_size > worst_size:
-                worst_size = block_size
-                worst_idx = idx
+        Raises:
+            ValueError: If an event is malformed or frees memory that is not allocated
+        """
+        results = {}
+        for strategy in strategies:
+            result = self.simulate_timeline(memory_size, events, strategy, include_steps=False,
+                                            measure_costs=True)
+            if not result['success']:
+                return result
+            results[strategy] = {
+                'costs': result['costs'],
+                'failed_allocations': result['failed_allocations'],
+                'final_fragmentation': result['final_fragmentation']
+            }
         
-        if worst_idx is not None:
-            return {'index': worst_idx, 'size': worst_size}
-        return None
+        return {
+            'success': True,
+            'memory_size': memory_size,
+            'total_events': len(events),
+            'results': results
+        }
+
+    def _timeline_description(self, kind, block_id, size, status, address) -> str:
+        """Describe one timeline event"""
+        if status == 'allocated':
+            return f'{block_id} allocated {size} units at address {address}'
+        if status == 'not_allocated':
+            return f'{block_id} cannot be allocated - no free extent of {size} units'
+        if status == 'freed':
+            return f'{block_id} freed {size} units at address {address}'
+        return f'{block_id} was never allocated - nothing to free'
+
+    def _sample_fragmentation(self, fragmentation: List[Dict[str, Any]], metrics: FragmentationMetrics,
+                              step: int, sample_interval: int):
+        """Append a fragmentation snapshot after every sample_interval-th step"""
+        if step % sample_interval == 0:
+            fragmentation.append({'step': step, **metrics.snapshot()})
+
+    def _cost_summary(self, times: List[int], steps: List[int]) -> Dict[str, Any]:
+        """Distribution of per-operation times (ns) and, if counted, steps"""
+        if not times:
+            return {'operations': 0}
+        ordered = sorted(times)
+        summary = {
+            'operations': len(ordered),
+            'mean_ns': round(sum(ordered) / len(ordered)),
+            'p99_ns': ordered[(len(ordered) - 1) * 99 // 100],
+            'max_ns': ordered[-1]
+        }
+        if steps:
+            summary['mean_steps'] = round(sum(steps) / len(steps), 2)
+            summary['max_steps'] = max(steps)
+        return summary
 
@@ -0,0 +1,114 @@
+"""
+Multi-Level Feedback Queue (MLFQ) CPU Scheduling Algorithm Module
+"""
+
+from backend.modules.process_table import ProcessTable
+from backend.modules.scheduling_engine import run_mlfq
+from backend.modules import schedule_stream
+
+class MLFQModule:
+    def __init__(self):
+        self.name = "Multi-Level Feedback Queue"
+        self.description = "Processes move between priority levels based on how much of their quantum they use"
+
+    def simulate(self, processes, num_levels=3, quanta=None, boost_interval=None, max_segments=None):
+        """
+        Simulate MLFQ CPU scheduling algorithm
+
+        Args:
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
+            num_levels: Number of priority levels
+            quanta: Time quantum per level, highest priority first
+                (defaults to 2, 4, 8, ...)
+            boost_interval: Time between priority boosts, or None to disable
+            max_segments: Cap on Gantt segments; longer charts are summarized
+                per time bucket by their dominant process
+
+        Returns:
+            Dictionary containing simulation results
+        """
+        return schedule_stream.collect(self.stream(processes, num_levels, quanta, boost_interval, max_segments))
+
+    def stream(self, processes, num_levels=3, quanta=None, boost_interval=None, max_segments=None):
+        """
+        Simulate MLFQ lazily, yielding the schedule as it is produced
+
+        Args:
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
+            num_levels: Number of priority levels
+            quanta: Time quantum per level, highest priority first
+                (defaults to 2, 4, 8, ...)
+            boost_interval: Time between priority boosts, or None to disable
+            max_segments: Cap on Gantt segments; longer charts are summarized
+                per time bucket by their dominant process
+
+        Yields:
+            (kind, record) pairs: a 'header', then 'segment', 'step' and
+            'process' records in schedule order, and a closing 'summary'
+        """
+        if quanta is None:
+            quanta = [2 ** (level + 1) for level in range(num_levels)]
+        if len(quanta) != num_levels:
+            raise ValueError('Expected one time quantum per level')
+
+        table = ProcessTable.of(processes)
+        table.reset_times(*quanta)
+        return schedule_stream.compact(self._schedule(table, quanta, boost_interval), table, max_segments)
+
+    def _schedule(self, table, quanta, boost_interval):
+        """Yield the MLFQ schedule of a process table"""
+        yield 'header', {
+            'algorithm': 'MLFQ',
+            'levels': len(quanta),
+            'timeQuanta': quanta,
+            'boostInterval': boost_interval
+        }
+
+        current_time = 0
+
+        # Slices of a process that keeps the CPU are merged by the compaction stage
+        for index, start_time, end_time, remaining, level in run_mlfq(table.arrival, table.burst, quanta, boost_interval):
+            process_id = table.ids[index]
+
+            if table.start[index] == -1:
+                table.start[index] = start_time
+
+            yield 'segment', {
+                'name': process_id,
+                'startTime': start_time,
+                'duration': end_time - start_time
+            }
+            yield 'step', {
+                'event': 'timeslice',
+                'process': process_id,
+                'level': level,
+                'quantum': quanta[level],
+                'ran': end_time - start_time,
+                'start': start_time,
+                'end': end_time
+            }
+
+            current_time = end_time
+
+            if remaining == 0:
+                # Process is completed
+                arrival = table.arrival[index]
+                burst = table.burst[index]
+                turnaround_time = end_time - arrival
+                table.completion[index] = end_time
+
+                yield 'process', {
+                    'id': process_id,
+                    'arrivalTime': arrival,
+                    'burstTime': burst,
+                    'startTime': table.start[index],
+                    'completionTime': end_time,
+                    'turnaroundTime': turnaround_time,
+                    'waitingTime': turnaround_time - burst,
+                    'responseTime': table.start[index] - arrival,
+                    'finalLevel': level
+                }
+
+        yield 'summary', schedule_stream.summarize(table, current_time)
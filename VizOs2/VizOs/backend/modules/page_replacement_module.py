@@ -1,12 +1,51 @@
 """
 Page Replacement Module
-Implements FIFO and LRU page replacement algorithms
+Implements FIFO, LRU, OPT, CLOCK, Second Chance, LFU, ARC and 2Q page replacement algorithms
 """
 
 from typing import List, Dict, Any, Optional
-from collections import deque, OrderedDict
+
+from backend.modules.paging_engine import (
+    run_fifo, run_lru, run_opt, run_clock, run_second_chance, run_lfu, run_arc, run_2q,
+    lru_fault_curve, run_working_set, run_pff
+)
+from backend.modules.paging_trace import CompactTrace
+from backend.modules.page_trace import trace_length, mapped_trace, iter_trace
+from backend.modules.paging_sweep import fifo_fault_curve, belady_anomalies
 
 class PageReplacementModule:
+    # Step descriptions per algorithm: (page hit, page replaced)
+    DESCRIPTIONS = {
+        'FIFO': ('Page {page} already in memory, no page fault',
+                 'Page fault: Replaced page {victim} with page {page} (FIFO)'),
+        'LRU': ('Page {page} already in memory, updated access time',
+                'Page fault: Replaced page {victim} (LRU) with page {page}'),
+        'OPT': ('Page {page} already in memory, no page fault',
+                'Page fault: Replaced page {victim} (OPT, used farthest in the future) with page {page}'),
+        'CLOCK': ('Page {page} already in memory, reference bit set',
+                  'Page fault: Clock hand replaced page {victim} with page {page} (CLOCK)'),
+        'Second Chance': ('Page {page} already in memory, reference bit set',
+                          'Page fault: Replaced page {victim} with page {page} (Second Chance)'),
+        'LFU': ('Page {page} already in memory, use count incremented',
+                'Page fault: Replaced page {victim} (LFU) with page {page}'),
+        'ARC': ('Page {page} already in memory, no page fault',
+                'Page fault: Replaced page {victim} (ARC) with page {page}'),
+        '2Q': ('Page {page} already in memory, no page fault',
+               'Page fault: Replaced page {victim} (2Q) with page {page}')
+    }
+
+    # Algorithm identifier -> (algorithm name, paging engine)
+    ENGINES = {
+        'fifo': ('FIFO', run_fifo),
+        'lru': ('LRU', run_lru),
+        'opt': ('OPT', run_opt),
+        'clock': ('CLOCK', run_clock),
+        'second_chance': ('Second Chance', run_second_chance),
+        'lfu': ('LFU', run_lfu),
+        'arc': ('ARC', run_arc),
+        '2q': ('2Q', run_2q)
+    }
+
     def __init__(self):
         pass
 
@@ -17,154 +56,327 @@ class PageReplacementModule:
         Args:
             frames: Number of frames available in memory
             page_requests: List of page requests
-            
+        
+        Returns:
+            Dictionary containing simulation results
+        """
+        return self._simulate('FIFO', run_fifo, frames, page_requests)
+
+    def simulate_lru(self, frames: int, page_requests: List[int]) -> Dict[str, Any]:
+        """
+        Simulate LRU (Least Recently Used) page replacement algorithm
+        
+        Args:
+            frames: Number of frames available in memory
+            page_requests: List of page requests
+        
+        Returns:
+            Dictionary containing simulation results
+        """
+        return self._simulate('LRU', run_lru, frames, page_requests)
+
+    def simulate_opt(self, frames: int, page_requests: List[int]) -> Dict[str, Any]:
+        """
+        Simulate OPT (Belady's optimal) page replacement algorithm
+        
+        Evicts the page whose next use is farthest in the future, which
+        gives the fewest possible page faults: the lower bound for every
+        other algorithm.
+        
+        Args:
+            frames: Number of frames available in memory
+            page_requests: List of page requests
+        
+        Returns:
+            Dictionary containing simulation results
+        """
+        return self._simulate('OPT', run_opt, frames, page_requests)
+
+    def _simulate(self, algorithm: str, engine, frames: int, page_requests: List[int],
+                  trace: str = 'full', keyframe_interval: int = 100) -> Dict[str, Any]:
+        """
+        Replay page requests through a paging engine, recording every step
+        
+        Args:
+            algorithm: Algorithm name reported in results
+            engine: Paging engine function, e.g. run_fifo
+            frames: Number of frames available in memory
+            page_requests: List of page requests
+            trace: 'full' for self-describing steps, or 'compact' for
+                [page, fault, victim, slot] rows plus memory keyframes
+            keyframe_interval: Steps between keyframes of a compact trace
+        
         Returns:
             Dictionary containing simulation results
         """
-        memory = []  # Current pages in memory (FIFO queue)
-        page_faults = 0
+        result = {
+            'success': True,
+            'algorithm': algorithm,
+            'frames': frames,
+            'page_requests': page_requests
+        }
+        
+        if trace == 'compact':
+            recorder = CompactTrace(keyframe_interval)
+            page_faults, final_memory = engine(frames, page_requests, recorder.record)
+            result['total_page_faults'] = page_faults
+            result['trace'] = 'compact'
+            result.update(recorder.to_dict())
+            result['final_memory'] = final_memory
+            return result
+        
+        memory = []  # Current pages in memory, in load order
         steps = []
         
-        for i, page in enumerate(page_requests):
-            step = {
-                'step': i + 1,
-                'requested_page': page,
-                'memory_before': memory.copy(),
-                'page_fault': False,
-                'replaced_page': None,
-                'memory_after': None,
-                'description': ''
+        def record(page, fault, victim, slot):
+            memory_before = memory.copy()
+            if victim is not None:
+                memory.remove(victim)
+            if fault:
+                memory.append(page)
+            steps.append(self._step(algorithm, len(steps) + 1, page, fault, victim, memory_before, memory.copy()))
+        
+        page_faults, final_memory = engine(frames, page_requests, record)
+        
+        result['total_page_faults'] = page_faults
+        result['steps'] = steps
+        result['final_memory'] = final_memory
+        return result
+
+    def _step(self, algorithm: str, number: int, page: int, fault: bool, victim: Optional[int],
+              memory_before: List[int], memory_after: List[int]) -> Dict[str, Any]:
+        """Build one self-describing step of a full trace"""
+        hit_text, replace_text = self.DESCRIPTIONS[algorithm]
+        if not fault:
+            description = hit_text.format(page=page)
+        elif victim is None:
+            # Memory not full, just add the page
+            description = f'Page {page} added to memory (memory not full)'
+        else:
+            description = replace_text.format(page=page, victim=victim)
+        
+        return {
+            'step': number,
+            'requested_page': page,
+            'memory_before': memory_before,
+            'page_fault': fault,
+            'replaced_page': victim,
+            'memory_after': memory_after,
+            'description': description
+        }
+
+    def expand_step(self, result: Dict[str, Any], step: int) -> Dict[str, Any]:
+        """
+        Rebuild one step of a compact trace in the full trace format
+        
+        Args:
+            result: Simulation result produced with trace='compact'
+            step: Step number, starting at 1
+        
+        Returns:
+            The step exactly as a full trace would have reported it
+        """
+        memory_before, memory_after, (page, fault, victim, slot) = CompactTrace.from_dict(result).replay(step)
+        return self._step(result['algorithm'], step, page, bool(fault), victim, memory_before, memory_after)
+
+    def simulate_file(self, algorithm: str, frames: int, path: str, dtype: str = 'uint32') -> Dict[str, Any]:
+        """
+        Simulate page replacement over a binary trace file
+        
+        The trace is streamed through the paging engine via mmap, so memory
+        use depends on the number of frames, not the length of the trace.
+        OPT looks ahead and maps the whole trace instead.
+        
+        Args:
+            algorithm: Algorithm identifier, as for simulate()
+            frames: Number of frames available in memory
+            path: Flat binary file of page numbers (see page_trace)
+            dtype: 'uint32' or 'uint64'
+        
+        Returns:
+            Dictionary containing the fault summary (no steps)
+        """
+        if algorithm.lower() not in self.ENGINES:
+            return {
+                'success': False,
+                'error': f'Unknown algorithm: {algorithm}'
             }
-            
-            if page not in memory:
-                page_fault = True
-                page_faults += 1
-                
-                if len(memory) < frames:
-                    # Memory not full, just add the page
-                    memory.append(page)
-                    step['description'] = f'Page {page} added to memory (memory not full)'
-                else:
-                    # Memory full, replace oldest page (FIFO)
-                    replaced = memory.pop(0)  # Remove first (oldest) page
-                    memory.append(page)  # Add new page at end
-                    step['replaced_page'] = replaced
-                    step['description'] = f'Page fault: Replaced page {replaced} with page {page} (FIFO)'
-                
-                step['page_fault'] = True
-            else:
-                # Page already in memory, no page fault
-                step['description'] = f'Page {page} already in memory, no page fault'
-            
-            step['memory_after'] = memory.copy()
-            steps.append(step)
+        
+        name, engine = self.ENGINES[algorithm.lower()]
+        total = trace_length(path, dtype)
+        if engine is run_opt:
+            with mapped_trace(path, dtype) as pages:
+                page_faults, final_memory = engine(frames, pages)
+        else:
+            page_faults, final_memory = engine(frames, iter_trace(path, dtype))
         
         return {
             'success': True,
-            'algorithm': 'FIFO',
+            'algorithm': name,
             'frames': frames,
-            'page_requests': page_requests,
+            'total_requests': total,
             'total_page_faults': page_faults,
-            'steps': steps,
-            'final_memory': memory
+            'fault_rate': round(page_faults / total, 4) if total else 0
         }
 
-    def simulate_lru(self, frames: int, page_requests: List[int]) -> Dict[str, Any]:
+    def miss_ratio_curve(self, page_requests: List[int], max_frames: Optional[int] = None) -> Dict[str, Any]:
         """
-        Simulate LRU (Least Recently Used) page replacement algorithm
+        Compute the LRU miss-ratio curve for every frame count at once
         
         Args:
-            frames: Number of frames available in memory
             page_requests: List of page requests
-            
+            max_frames: Largest frame count on the curve (defaults to the
+                number of distinct pages, beyond which the curve is flat)
+        
         Returns:
-            Dictionary containing simulation results
+            Dictionary containing the page faults and miss ratio per frame count
         """
-        memory = []  # Current pages in memory
-        page_access_order = {}  # Track when each page was last accessed
-        page_faults = 0
-        steps = []
+        unique_pages = len(set(page_requests))
+        if max_frames is None:
+            max_frames = max(unique_pages, 1)
+        
+        return {
+            'success': True,
+            'algorithm': 'LRU',
+            'total_requests': len(page_requests),
+            'unique_pages': unique_pages,
+            'curve': self._curve(lru_fault_curve(page_requests, max_frames), len(page_requests))
+        }
+
+    def fifo_sweep(self, page_requests: List[int], max_frames: Optional[int] = None,
+                   workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compute the FIFO fault curve for every frame count and find Belady's anomalies
+        
+        FIFO is not a stack algorithm, so the frame counts are simulated
+        separately, in parallel worker processes sharing one copy of the
+        trace. No step traces are built.
+        
+        Args:
+            page_requests: List of page requests (non-negative page numbers)
+            max_frames: Largest frame count on the curve (defaults to the
+                number of distinct pages, beyond which the curve is flat)
+            workers: Number of worker processes (defaults to the CPU count)
+        
+        Returns:
+            Dictionary containing the page faults and miss ratio per frame
+            count, and every frame count that faults more than the one before
+        """
+        unique_pages = len(set(page_requests))
+        if max_frames is None:
+            max_frames = max(unique_pages, 1)
         
-        for i, page in enumerate(page_requests):
-            step = {
-                'step': i + 1,
-                'requested_page': page,
-                'memory_before': memory.copy(),
-                'page_fault': False,
-                'replaced_page': None,
-                'memory_after': None,
-                'description': ''
+        faults = fifo_fault_curve(page_requests, max_frames, workers)
+        
+        return {
+            'success': True,
+            'algorithm': 'FIFO',
+            'total_requests': len(page_requests),
+            'unique_pages': unique_pages,
+            'curve': self._curve(faults, len(page_requests)),
+            'anomalies': belady_anomalies(faults)
+        }
+
+    def _curve(self, faults: List[int], total: int) -> List[Dict[str, Any]]:
+        """Fault curve points from fault counts for 1, 2, ... frames"""
+        return [
+            {
+                'frames': frames,
+                'page_faults': page_faults,
+                'miss_ratio': round(page_faults / total, 4) if total else 0
             }
-            
-            if page not in memory:
-                page_fault = True
-                page_faults += 1
-                
-                if len(memory) < frames:
-                    # Memory not full, just add the page
-                    memory.append(page)
-                    step['description'] = f'Page {page} added to memory (memory not full)'
-                else:
-                    # Memory full, find LRU page (least recently accessed)
-                    lru_page = None
-                    lru_time = float('inf')
-                    
-                    for mem_page in memory:
-                        if mem_page in page_access_order:
-                            if page_access_order[mem_page] < lru_time:
-                                lru_time = page_access_order[mem_page]
-                                lru_page = mem_page
-                    
-                    # If no access order found, use first page as fallback
-                    if lru_page is None:
-                        lru_page = memory[0]
-                    
-                    # Replace LRU page
-                    memory.remove(lru_page)
-                    memory.append(page)
-                    step['replaced_page'] = lru_page
-                    step['description'] = f'Page fault: Replaced page {lru_page} (LRU) with page {page}'
-                
-                step['page_fault'] = True
-            else:
-                # Page already in memory, update access time
-                step['description'] = f'Page {page} already in memory, updated access time'
-            
-            # Update access order for current page
-            page_access_order[page] = i
-            
-            step['memory_after'] = memory.copy()
-            steps.append(step)
+            for frames, page_faults in enumerate(faults, 1)
+        ]
+
+    def working_set(self, page_requests: List[int], window: int, pff_threshold: Optional[int] = None,
+                    sample_interval: int = 1) -> Dict[str, Any]:
+        """
+        Simulate variable allocation: the working-set model and page-fault frequency
+        
+        Args:
+            page_requests: List of page requests
+            window: Working-set window (tau), in references
+            pff_threshold: Inter-fault time above which PFF releases pages
+                not referenced since the previous fault (defaults to window)
+            sample_interval: Report sizes after every sample_interval-th reference
+        
+        Returns:
+            Dictionary containing faults and size over time for both models
+        """
+        if pff_threshold is None:
+            pff_threshold = window
+        
+        total = len(page_requests)
+        page_faults, total_size, max_size, sizes = self._sample_sizes(run_working_set, window,
+                                                                      page_requests, sample_interval)
+        pff_faults, total_frames, max_frames, frames = self._sample_sizes(run_pff, pff_threshold,
+                                                                          page_requests, sample_interval)
         
         return {
             'success': True,
-            'algorithm': 'LRU',
-            'frames': frames,
-            'page_requests': page_requests,
-            'total_page_faults': page_faults,
-            'steps': steps,
-            'final_memory': memory
+            'window': window,
+            'total_requests': total,
+            'sample_interval': sample_interval,
+            'working_set': {
+                'page_faults': page_faults,
+                'avg_size': round(total_size / total, 2) if total else 0,
+                'max_size': max_size,
+                'sizes': sizes
+            },
+            'pff': {
+                'threshold': pff_threshold,
+                'page_faults': pff_faults,
+                'avg_frames': round(total_frames / total, 2) if total else 0,
+                'max_frames': max_frames,
+                'frames': frames
+            }
         }
 
-    def simulate(self, algorithm: str, frames: int, page_requests: List[int]) -> Dict[str, Any]:
+    def _sample_sizes(self, engine, parameter: int, page_requests: List[int], sample_interval: int):
+        """Run a variable-allocation engine, keeping the size after every sample_interval-th reference"""
+        sizes = []
+        countdown = sample_interval
+        
+        def sample(page, fault, size):
+            nonlocal countdown
+            countdown -= 1
+            if countdown == 0:
+                countdown = sample_interval
+                sizes.append(size)
+        
+        page_faults, total_size, max_size = engine(parameter, page_requests, sample)
+        return page_faults, total_size, max_size, sizes
+
+    def simulate(self, algorithm: str, frames: int, page_requests: List[int],
+                 trace: str = 'full', keyframe_interval: int = 100) -> Dict[str, Any]:
         """
         Simulate page replacement algorithm
         
         Args:
-            algorithm: 'fifo' or 'lru'
+            algorithm: 'fifo', 'lru', 'opt', 'clock', 'second_chance',
+                'lfu', 'arc' or '2q'
             frames: Number of frames available in memory
             page_requests: List of page requests
-            
+            trace: 'full' for self-describing steps, or 'compact' for
+                [page, fault, victim, slot] rows plus a memory keyframe every
+                keyframe_interval steps (see expand_step)
+            keyframe_interval: Steps between keyframes of a compact trace
+        
         Returns:
             Dictionary containing simulation results
         """
-        if algorithm.lower() == 'fifo':
-            return self.simulate_fifo(frames, page_requests)
-        elif algorithm.lower() == 'lru':
-            return self.simulate_lru(frames, page_requests)
-        else:
+        if algorithm.lower() not in self.ENGINES:
             return {
                 'success': False,
                 'error': f'Unknown algorithm: {algorithm}'
             }
+        
+        if trace not in ('full', 'compact'):
+            return {
+                'success': False,
+                'error': f'Unknown trace mode: {trace}'
+            }
+        
+        name, engine = self.ENGINES[algorithm.lower()]
+        return self._simulate(name, engine, frames, page_requests, trace, keyframe_interval)
 
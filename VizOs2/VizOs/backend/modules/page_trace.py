@@ -0,0 +1,122 @@
+"""
+Page Trace
+Flat binary page traces, read through mmap so large traces never load into memory
+
+A trace file is a bare array of page numbers, either uint32 or uint64,
+in native byte order (little-endian on x86 and ARM).
+
+Usage:
+    python -m backend.modules.page_trace TRACE --algorithm lru --frames 1024 [--dtype uint64]
+"""
+
+import argparse
+import json
+import mmap
+import os
+from contextlib import contextmanager
+
+# Trace element type -> memoryview format
+TRACE_TYPES = {'uint32': 'I', 'uint64': 'Q'}
+
+def trace_length(path, dtype='uint32'):
+    """
+    Number of page references in a trace file
+
+    Args:
+        path: Trace file path
+        dtype: 'uint32' or 'uint64'
+
+    Returns:
+        Number of references
+
+    Raises:
+        ValueError: If the type is unknown or the file size does not match it
+    """
+    if dtype not in TRACE_TYPES:
+        raise ValueError(f'Unknown trace type: {dtype}')
+    itemsize = 8 if dtype == 'uint64' else 4
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(f'Trace size {size} is not a multiple of {itemsize} bytes')
+    return size // itemsize
+
+@contextmanager
+def mapped_trace(path, dtype='uint32'):
+    """
+    Map a whole trace file as a read-only sequence of page numbers
+
+    Pages of the file are read in on access, but stay resident once
+    touched; use iter_trace() for a single streaming pass.
+
+    Args:
+        path: Trace file path
+        dtype: 'uint32' or 'uint64'
+
+    Yields:
+        memoryview of page numbers
+    """
+    if trace_length(path, dtype) == 0:
+        yield memoryview(b'').cast(TRACE_TYPES[dtype])
+        return
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        pages = memoryview(mapped).cast(TRACE_TYPES[dtype])
+        try:
+            yield pages
+        finally:
+            pages.release()
+
+def iter_trace(path, dtype='uint32', chunk_size=1 << 20):
+    """
+    Stream the page numbers of a trace file
+
+    The file is mapped once and walked chunk by chunk; each chunk is
+    dropped from the process's memory after it has been read, so resident
+    memory stays flat however long the trace is.
+
+    Args:
+        path: Trace file path
+        dtype: 'uint32' or 'uint64'
+        chunk_size: References per chunk
+
+    Yields:
+        Page numbers in trace order
+    """
+    if trace_length(path, dtype) == 0:
+        return
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        pages = memoryview(mapped).cast(TRACE_TYPES[dtype])
+        itemsize = pages.itemsize
+        # Chunks must start on a memory page boundary to be released
+        step = max(1, chunk_size * itemsize // mmap.PAGESIZE) * mmap.PAGESIZE // itemsize
+        try:
+            for start in range(0, len(pages), step):
+                with pages[start:start + step] as chunk:
+                    yield from chunk
+                    length = len(chunk) * itemsize
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_DONTNEED, start * itemsize, length)
+        finally:
+            pages.release()
+
+def main(argv=None):
+    """Replay a binary trace file and print the fault summary as JSON"""
+    from backend.modules.page_replacement_module import PageReplacementModule
+
+    parser = argparse.ArgumentParser(description='Replay a binary page trace through a page replacement algorithm')
+    parser.add_argument('trace', help='Flat binary file of page numbers')
+    parser.add_argument('--algorithm', default='fifo', help='fifo, lru, opt, clock, second_chance, lfu, arc or 2q')
+    parser.add_argument('--frames', type=int, default=3, help='Number of page frames')
+    parser.add_argument('--dtype', choices=sorted(TRACE_TYPES), default='uint32', help='Page number type')
+    args = parser.parse_args(argv)
+
+    if args.frames < 1:
+        parser.error('Number of frames must be at least 1')
+
+    result = PageReplacementModule().simulate_file(args.algorithm, args.frames, args.trace, args.dtype)
+    print(json.dumps(result, indent=2))
+    return 0 if result['success'] else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,684 @@
+"""
+Paging Engine
+Constant-time page replacement cores shared by the page replacement module
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict
+
+
+def run_fifo(frames, pages, observer=None):
+    """
+    Replay a reference string under FIFO replacement
+
+    Resident pages sit in a ring of frame slots and the hand points at the
+    oldest one, so a hit is one hash lookup and a miss or eviction is O(1).
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference with the evicted page (or None) and the frame
+            slot holding the page
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    where = {}  # Resident page -> frame slot
+    slots = []
+    hand = 0
+    faults = 0
+
+    for page in pages:
+        if page in where:
+            if observer is not None:
+                observer(page, False, None, where[page])
+            continue
+
+        faults += 1
+        victim = None
+        if len(slots) < frames:
+            slot = len(slots)
+            slots.append(page)
+        else:
+            # The hand always rests on the oldest page
+            slot = hand
+            victim = slots[slot]
+            del where[victim]
+            slots[slot] = page
+            hand += 1
+            if hand == frames:
+                hand = 0
+        where[page] = slot
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, slots[hand:] + slots[:hand]
+
+
+def run_lru(frames, pages, observer=None):
+    """
+    Replay a reference string under LRU replacement
+
+    Resident pages are kept in an insertion-ordered hash map from least to
+    most recently used, so a hit moves one entry to the end and the victim
+    is always the first entry: O(1) for hits, misses and evictions.
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    recency = OrderedDict()  # Resident page -> frame slot, least recent first
+    loaded_at = []  # Frame slot -> fault number that filled it
+    faults = 0
+
+    for page in pages:
+        if page in recency:
+            recency.move_to_end(page)
+            if observer is not None:
+                observer(page, False, None, recency[page])
+            continue
+
+        faults += 1
+        victim = None
+        if len(loaded_at) < frames:
+            slot = len(loaded_at)
+            loaded_at.append(faults)
+        else:
+            victim, slot = recency.popitem(last=False)
+            loaded_at[slot] = faults
+        recency[page] = slot
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order(recency, loaded_at)
+
+
+def run_clock(frames, pages, observer=None):
+    """
+    Replay a reference string under CLOCK replacement
+
+    Frame slots form a circle with one reference bit each, set whenever
+    the page is loaded or referenced. On a fault the hand clears set bits
+    as it sweeps and evicts the first page whose bit is already clear.
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    where = {}  # Resident page -> frame slot
+    slots = []
+    referenced = bytearray(frames)
+    loaded_at = []  # Frame slot -> fault number that filled it
+    hand = 0
+    faults = 0
+
+    for page in pages:
+        slot = where.get(page)
+        if slot is not None:
+            referenced[slot] = 1
+            if observer is not None:
+                observer(page, False, None, slot)
+            continue
+
+        faults += 1
+        victim = None
+        if len(slots) < frames:
+            slot = len(slots)
+            slots.append(page)
+            loaded_at.append(faults)
+        else:
+            while referenced[hand]:
+                referenced[hand] = 0
+                hand += 1
+                if hand == frames:
+                    hand = 0
+            slot = hand
+            victim = slots[slot]
+            del where[victim]
+            slots[slot] = page
+            loaded_at[slot] = faults
+            hand += 1
+            if hand == frames:
+                hand = 0
+        where[page] = slot
+        referenced[slot] = 1
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order(where, loaded_at)
+
+
+def run_second_chance(frames, pages, observer=None):
+    """
+    Replay a reference string under second-chance replacement
+
+    The queue formulation of CLOCK: the oldest page is evicted unless its
+    reference bit is set, in which case the bit is cleared and the page
+    moves to the back of the queue. It makes the same choices as
+    run_clock.
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    queue = OrderedDict()  # Resident page -> frame slot, next candidate first
+    referenced = bytearray(frames)
+    loaded_at = []  # Frame slot -> fault number that filled it
+    faults = 0
+
+    for page in pages:
+        slot = queue.get(page)
+        if slot is not None:
+            referenced[slot] = 1
+            if observer is not None:
+                observer(page, False, None, slot)
+            continue
+
+        faults += 1
+        victim = None
+        if len(loaded_at) < frames:
+            slot = len(loaded_at)
+            loaded_at.append(faults)
+        else:
+            victim, slot = queue.popitem(last=False)
+            while referenced[slot]:
+                # Second chance: clear the bit and requeue the page
+                referenced[slot] = 0
+                queue[victim] = slot
+                victim, slot = queue.popitem(last=False)
+            loaded_at[slot] = faults
+        queue[page] = slot
+        referenced[slot] = 1
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order(queue, loaded_at)
+
+
+def run_lfu(frames, pages, observer=None):
+    """
+    Replay a reference string under LFU replacement
+
+    Resident pages are grouped into buckets by use count, each ordered
+    from least to most recently used, and the smallest non-empty count is
+    tracked. A hit moves a page up one bucket and a fault evicts the least
+    recently used page of the lowest bucket, so both are O(1). Counts
+    start over when a page is evicted.
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    counts = {}  # Resident page -> use count
+    buckets = {}  # Use count -> OrderedDict of page -> frame slot
+    loaded_at = []  # Frame slot -> fault number that filled it
+    min_count = 0
+    faults = 0
+
+    for page in pages:
+        count = counts.get(page)
+        if count is not None:
+            bucket = buckets[count]
+            slot = bucket.pop(page)
+            if not bucket:
+                del buckets[count]
+                if min_count == count:
+                    min_count = count + 1
+            counts[page] = count + 1
+            if count + 1 in buckets:
+                buckets[count + 1][page] = slot
+            else:
+                buckets[count + 1] = OrderedDict(((page, slot),))
+            if observer is not None:
+                observer(page, False, None, slot)
+            continue
+
+        faults += 1
+        victim = None
+        if len(loaded_at) < frames:
+            slot = len(loaded_at)
+            loaded_at.append(faults)
+        else:
+            bucket = buckets[min_count]
+            victim, slot = bucket.popitem(last=False)
+            if not bucket:
+                del buckets[min_count]
+            del counts[victim]
+            loaded_at[slot] = faults
+        counts[page] = 1
+        if 1 in buckets:
+            buckets[1][page] = slot
+        else:
+            buckets[1] = OrderedDict(((page, slot),))
+        min_count = 1
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    resident = {}
+    for bucket in buckets.values():
+        resident.update(bucket)
+    return faults, _in_load_order(resident, loaded_at)
+
+
+def run_arc(frames, pages, observer=None):
+    """
+    Replay a reference string under ARC (Adaptive Replacement Cache)
+
+    Resident pages seen once (T1) and seen again (T2) are kept in two LRU
+    lists, each shadowed by a ghost list of pages it recently evicted (B1,
+    B2). A fault on a ghost page shifts the target size of T1 towards the
+    list that would have kept it, so the policy adapts between recency and
+    frequency. Every operation is O(1).
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    t1 = OrderedDict()  # Resident pages seen once -> frame slot, LRU first
+    t2 = OrderedDict()  # Resident pages seen again -> frame slot, LRU first
+    b1 = OrderedDict()  # Ghosts evicted from T1, LRU first
+    b2 = OrderedDict()  # Ghosts evicted from T2, LRU first
+    loaded_at = []  # Frame slot -> fault number that filled it
+    target = 0  # Adaptive target size of T1
+    faults = 0
+
+    def replace(in_b2):
+        # Evict from T1 while it is over target, otherwise from T2
+        if t1 and (len(t1) > target or (in_b2 and len(t1) == target)):
+            victim, slot = t1.popitem(last=False)
+            b1[victim] = None
+        else:
+            victim, slot = t2.popitem(last=False)
+            b2[victim] = None
+        return victim, slot
+
+    for page in pages:
+        if page in t1:
+            slot = t1.pop(page)
+            t2[page] = slot
+            if observer is not None:
+                observer(page, False, None, slot)
+            continue
+        if page in t2:
+            t2.move_to_end(page)
+            if observer is not None:
+                observer(page, False, None, t2[page])
+            continue
+
+        faults += 1
+        victim = None
+        if page in b1:
+            target = min(frames, target + max(len(b2) / len(b1), 1))
+            del b1[page]
+            victim, slot = replace(False)
+            t2[page] = slot
+        elif page in b2:
+            target = max(0, target - max(len(b1) / len(b2), 1))
+            del b2[page]
+            victim, slot = replace(True)
+            t2[page] = slot
+        else:
+            if len(t1) + len(b1) == frames:
+                if len(t1) < frames:
+                    b1.popitem(last=False)
+                    victim, slot = replace(False)
+                else:
+                    victim, slot = t1.popitem(last=False)
+            elif len(t1) + len(t2) < frames:
+                slot = len(loaded_at)
+                loaded_at.append(faults)
+            else:
+                if len(t1) + len(t2) + len(b1) + len(b2) == 2 * frames:
+                    b2.popitem(last=False)
+                victim, slot = replace(False)
+            t1[page] = slot
+        loaded_at[slot] = faults
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order({**t1, **t2}, loaded_at)
+
+
+def run_2q(frames, pages, observer=None):
+    """
+    Replay a reference string under 2Q replacement
+
+    First-time pages enter a FIFO queue (A1in) holding about a quarter of
+    the frames. Pages it evicts are remembered in a ghost queue (A1out)
+    sized at half the frames, and a fault on a remembered page promotes it
+    to the main LRU list (Am). Pages touched only once therefore never
+    push hot pages out of Am. Every operation is O(1).
+
+    Args:
+        frames: Number of page frames
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    in_size = max(1, frames // 4)
+    out_size = max(1, frames // 2)
+    a1in = OrderedDict()  # First-time resident pages -> frame slot, oldest first
+    a1out = OrderedDict()  # Ghosts evicted from A1in, oldest first
+    am = OrderedDict()  # Hot resident pages -> frame slot, LRU first
+    loaded_at = []  # Frame slot -> fault number that filled it
+    faults = 0
+
+    for page in pages:
+        if page in am:
+            am.move_to_end(page)
+            if observer is not None:
+                observer(page, False, None, am[page])
+            continue
+        if page in a1in:
+            if observer is not None:
+                observer(page, False, None, a1in[page])
+            continue
+
+        faults += 1
+        victim = None
+        remembered = page in a1out
+        if remembered:
+            del a1out[page]
+
+        if len(loaded_at) < frames:
+            slot = len(loaded_at)
+            loaded_at.append(faults)
+        else:
+            if a1in and (len(a1in) > in_size or not am):
+                victim, slot = a1in.popitem(last=False)
+                a1out[victim] = None
+                if len(a1out) > out_size:
+                    a1out.popitem(last=False)
+            else:
+                victim, slot = am.popitem(last=False)
+            loaded_at[slot] = faults
+
+        if remembered:
+            am[page] = slot
+        else:
+            a1in[page] = slot
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order({**a1in, **am}, loaded_at)
+
+
+def _in_load_order(slot_of, loaded_at):
+    """Resident pages (a page -> frame slot map) ordered by load time"""
+    return sorted(slot_of, key=lambda page: loaded_at[slot_of[page]])
+
+
+def next_uses(pages):
+    """
+    Index of the next reference to the same page, for every reference
+
+    Built in one backward pass. A page that is never referenced again
+    gets len(pages).
+
+    Args:
+        pages: Sequence of page numbers
+
+    Returns:
+        array of next-use indices, parallel to pages
+    """
+    n = len(pages)
+    nexts = array('q', bytes(8 * n))
+    seen = {}  # Page -> index of its earliest reference after the cursor
+    for i in range(n - 1, -1, -1):
+        page = pages[i]
+        nexts[i] = seen.get(page, n)
+        seen[page] = i
+    return nexts
+
+
+def run_opt(frames, pages, observer=None):
+    """
+    Replay a reference string under OPT (Belady's optimal) replacement
+
+    The victim is the resident page whose next use is farthest away,
+    popped from a max-heap keyed on next use. Pages that are never used
+    again tie, and the one loaded first is evicted. A hit pushes the
+    page's new next use; the superseded entry keys a reference already
+    made, so it sinks below every live entry and is dropped when the
+    heap is rebuilt. Each reference costs O(log frames) amortized.
+
+    Args:
+        frames: Number of page frames
+        pages: Sequence of page numbers (read twice)
+        observer: Optional callable(page, fault, victim, slot), called after
+            every reference
+
+    Returns:
+        Tuple of (page_faults, resident pages in load order)
+    """
+    nexts = next_uses(pages)
+    where = {}  # Resident page -> frame slot
+    loaded_at = []  # Frame slot -> fault number that filled it
+    heap = []  # (-next use, fault number, page) per resident page, plus stale entries
+    faults = 0
+
+    for i, page in enumerate(pages):
+        next_use = nexts[i]
+
+        if page in where:
+            slot = where[page]
+            heapq.heappush(heap, (-next_use, loaded_at[slot], page))
+            if len(heap) > 2 * frames:
+                # Drop the stale entries: each live page keys its next use
+                heap = [entry for entry in heap if -entry[0] > i]
+                heapq.heapify(heap)
+            if observer is not None:
+                observer(page, False, None, slot)
+            continue
+
+        faults += 1
+        victim = None
+        if len(loaded_at) < frames:
+            slot = len(loaded_at)
+            loaded_at.append(faults)
+        else:
+            # Live entries key future references, stale ones past ones,
+            # so the top of the heap is always a resident page
+            victim = heapq.heappop(heap)[2]
+            slot = where.pop(victim)
+            loaded_at[slot] = faults
+        where[page] = slot
+        heapq.heappush(heap, (-next_use, faults, page))
+
+        if observer is not None:
+            observer(page, True, victim, slot)
+
+    return faults, _in_load_order(where, loaded_at)
+
+
+def lru_fault_curve(pages, max_frames):
+    """
+    LRU page faults for every frame count from 1 to max_frames in one pass
+
+    LRU is a stack algorithm: a reference hits with f frames exactly when
+    its stack distance (the number of distinct pages referenced since the
+    last use of the same page, itself included) is at most f. Distances
+    come from a Fenwick tree over reference positions that marks the
+    latest reference of every page, so the whole curve costs O(n log n).
+
+    Args:
+        pages: Sequence of page numbers
+        max_frames: Largest frame count on the curve
+
+    Returns:
+        List of page fault counts, where entry f - 1 is the count for f frames
+    """
+    n = len(pages)
+    tree = array('q', bytes(8 * (n + 1)))  # Fenwick tree of latest-reference marks
+    hits = array('q', bytes(8 * (max_frames + 1)))  # Stack distance -> references
+    last = {}  # Page -> position of its latest reference (1-based)
+    marked = 0  # Marks in the tree: the number of distinct pages so far
+
+    for position, page in enumerate(pages, 1):
+        previous = last.get(page)
+        if previous is not None:
+            # Marks after the previous reference, plus the page itself
+            before = 0
+            i = previous
+            while i:
+                before += tree[i]
+                i &= i - 1
+            distance = marked - before + 1
+            if distance <= max_frames:
+                hits[distance] += 1
+
+            i = previous
+            while i <= n:
+                tree[i] -= 1
+                i += i & -i
+        else:
+            marked += 1
+
+        i = position
+        while i <= n:
+            tree[i] += 1
+            i += i & -i
+        last[page] = position
+
+    faults = []
+    misses = n
+    for frames in range(1, max_frames + 1):
+        misses -= hits[frames]
+        faults.append(misses)
+    return faults
+
+
+def run_working_set(window, pages, observer=None):
+    """
+    Replay a reference string under Denning's working-set model
+
+    The working set at time t is the set of distinct pages among the last
+    window references. A reference faults when its page is not in the
+    working set just before it. Occurrence counts of the pages in the
+    window are updated as it slides, one reference in and one out, so
+    each reference is O(1) whatever the window size.
+
+    Args:
+        window: Working-set window (tau), in references
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, size), called after every
+            reference with the working-set size
+
+    Returns:
+        Tuple of (page_faults, sum of working-set sizes, largest working-set size)
+    """
+    ring = [None] * window  # Last window references, oldest at the cursor
+    counts = {}  # Page -> occurrences in the window
+    faults = 0
+    total_size = 0
+    max_size = 0
+
+    for t, page in enumerate(pages):
+        fault = page not in counts
+        if fault:
+            faults += 1
+
+        cursor = t % window
+        if t >= window:
+            leaving = ring[cursor]
+            if counts[leaving] == 1:
+                del counts[leaving]
+            else:
+                counts[leaving] -= 1
+        ring[cursor] = page
+        counts[page] = counts.get(page, 0) + 1
+
+        size = len(counts)
+        total_size += size
+        if size > max_size:
+            max_size = size
+        if observer is not None:
+            observer(page, fault, size)
+
+    return faults, total_size, max_size
+
+
+def run_pff(threshold, pages, observer=None):
+    """
+    Replay a reference string under page-fault-frequency frame allocation
+
+    A process holds as many frames as it needs. When a fault comes more
+    than threshold references after the previous one, faults are rare and
+    every page not referenced since the previous fault is released before
+    the new page is loaded; otherwise the allocation just grows. Resident
+    pages are kept from least to most recently used, so the released
+    pages are always a prefix and each is released in O(1).
+
+    Args:
+        threshold: Inter-fault time, in references, above which the
+            allocation shrinks
+        pages: Iterable of page numbers
+        observer: Optional callable(page, fault, size), called after every
+            reference with the number of frames held
+
+    Returns:
+        Tuple of (page_faults, sum of frames held, most frames held)
+    """
+    recency = OrderedDict()  # Resident page -> time of last use, least recent first
+    last_fault = 0
+    faults = 0
+    total_size = 0
+    max_size = 0
+
+    for t, page in enumerate(pages):
+        fault = page not in recency
+        if fault:
+            faults += 1
+            if t - last_fault > threshold:
+                while next(iter(recency.values())) < last_fault:
+                    recency.popitem(last=False)
+            last_fault = t
+        else:
+            recency.move_to_end(page)
+        recency[page] = t
+
+        size = len(recency)
+        total_size += size
+        if size > max_size:
+            max_size = size
+        if observer is not None:
+            observer(page, fault, size)
+
+    return faults, total_size, max_size
@@ -0,0 +1,100 @@
+"""
+Paging Sweep
+FIFO fault counts over a range of frame counts, computed in parallel
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from backend.modules.paging_engine import run_fifo
+
+# Below this many page references times frame counts a pool costs more to start than it saves
+SWEEP_POOL_MIN_WORK = 1000000
+
+# Trace attached by each worker process: (shared memory block, page view)
+_shared_trace = None
+
+
+def fifo_fault_curve(pages, max_frames, workers=None):
+    """
+    FIFO page faults for every frame count from 1 to max_frames
+
+    FIFO is not a stack algorithm, so each frame count needs its own run.
+    The runs are spread over a process pool; the trace is copied once into
+    a shared memory block that every worker maps, instead of being pickled
+    for each task. Small sweeps, sweeps without more than one worker, and
+    sweeps where shared memory is unavailable run in this process.
+
+    Args:
+        pages: Sequence of non-negative page numbers below 2 ** 63
+        max_frames: Largest frame count on the curve
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        List of page fault counts, where entry f - 1 is the count for f frames
+
+    Raises:
+        ValueError: If a page number is not an integer from 0 to 2 ** 63 - 1
+    """
+    # Every path takes the same pages, whichever one the machine ends up on
+    try:
+        trace = array('q', pages)
+    except (TypeError, OverflowError):
+        raise ValueError('Page numbers must be integers below 2 ** 63')
+    if trace and min(trace) < 0:
+        raise ValueError('Page numbers must be non-negative')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, max_frames)
+    if workers <= 1 or len(trace) * max_frames < SWEEP_POOL_MIN_WORK:
+        return [run_fifo(frames, trace)[0] for frames in range(1, max_frames + 1)]
+
+    try:
+        block = shared_memory.SharedMemory(create=True, size=len(trace) * trace.itemsize)
+    except OSError:
+        return [run_fifo(frames, trace)[0] for frames in range(1, max_frames + 1)]
+
+    try:
+        block.buf[:len(trace) * trace.itemsize] = trace.tobytes()
+        del trace
+
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(block.name, len(pages))) as pool:
+            # Larger frame counts are not much slower, so even chunks balance well
+            chunksize = max(1, max_frames // (4 * workers))
+            return list(pool.map(_fifo_faults, range(1, max_frames + 1), chunksize=chunksize))
+    finally:
+        block.close()
+        block.unlink()
+
+
+def belady_anomalies(faults):
+    """
+    Frame counts at which adding a frame increased the page faults
+
+    Args:
+        faults: Page fault counts, where entry f - 1 is the count for f frames
+
+    Returns:
+        List of dictionaries with the frame count, its faults and the
+        faults with one frame fewer
+    """
+    return [
+        {'frames': frames, 'page_faults': faults[frames - 1], 'previous_page_faults': faults[frames - 2]}
+        for frames in range(2, len(faults) + 1)
+        if faults[frames - 1] > faults[frames - 2]
+    ]
+
+
+def _attach(name, length):
+    """Worker initializer: map the shared trace"""
+    global _shared_trace
+    block = shared_memory.SharedMemory(name=name)
+    _shared_trace = (block, block.buf.cast('q')[:length])
+
+
+def _fifo_faults(frames):
+    """Worker task: FIFO faults of the shared trace with the given frames"""
+    return run_fifo(frames, _shared_trace[1])[0]
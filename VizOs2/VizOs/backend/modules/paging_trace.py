@@ -0,0 +1,93 @@
+"""
+Paging Trace
+Compact step trace of a page replacement run, with periodic keyframes
+"""
+
+from collections import OrderedDict
+
+
+class CompactTrace:
+    """
+    Step trace that stores only what changed at each reference
+
+    Every step is one [page, fault, victim, slot] row (fault is 1 or 0,
+    victim is None when nothing was evicted), so the trace grows with the
+    number of references instead of references x frames. Every
+    keyframe_interval steps the full memory, in load order, is saved as
+    a keyframe; the memory at any step is rebuilt by replaying at most
+    keyframe_interval rows from the nearest keyframe.
+
+    Use record() as the observer of a paging engine.
+    """
+
+    def __init__(self, keyframe_interval=100):
+        if keyframe_interval < 1:
+            raise ValueError('keyframe_interval must be at least 1')
+        self.keyframe_interval = keyframe_interval
+        self.steps = []
+        self.keyframes = []  # Memory before steps 1, K + 1, 2K + 1, ...
+        self._memory = OrderedDict()  # Resident pages in load order
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a trace from its to_dict() form, for replaying steps"""
+        trace = cls(data['keyframe_interval'])
+        trace.steps = data['steps']
+        trace.keyframes = data['keyframes']
+        return trace
+
+    def record(self, page, fault, victim, slot):
+        """Append one step, saving a keyframe first when one is due"""
+        if len(self.steps) % self.keyframe_interval == 0:
+            self.keyframes.append(list(self._memory))
+        if victim is not None:
+            del self._memory[victim]
+        if fault:
+            self._memory[page] = None
+        self.steps.append([page, int(fault), victim, slot])
+
+    def to_dict(self):
+        """
+        JSON-ready form of the trace
+
+        Returns:
+            Dictionary with the keyframe interval, the keyframes and the step rows
+        """
+        return {
+            'keyframe_interval': self.keyframe_interval,
+            'keyframes': self.keyframes,
+            'steps': self.steps
+        }
+
+    def replay(self, step):
+        """
+        Rebuild memory around one step
+
+        Args:
+            step: Step number, starting at 1
+
+        Returns:
+            Tuple of (memory_before, memory_after, step row), memory in load order
+
+        Raises:
+            IndexError: If the step is out of range
+        """
+        if not 1 <= step <= len(self.steps):
+            raise IndexError(f'Step {step} out of range')
+
+        index = step - 1
+        start = index - index % self.keyframe_interval
+        memory = OrderedDict.fromkeys(self.keyframes[start // self.keyframe_interval])
+        for page, fault, victim, slot in self.steps[start:index]:
+            if victim is not None:
+                del memory[victim]
+            if fault:
+                memory[page] = None
+
+        memory_before = list(memory)
+        page, fault, victim, slot = self.steps[index]
+        if victim is not None:
+            del memory[victim]
+        if fault:
+            memory[page] = None
+        return memory_before, list(memory), self.steps[index]
@@ -0,0 +1,129 @@
+"""
+Process Table
+Columnar (struct-of-arrays) representation of a scheduling workload
+"""
+
+from array import array
+
+
+def _column(values):
+    """Pack values into a compact array, keeping integers exact"""
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        return array('d', values)
+
+
+class ProcessTable:
+    """
+    Workload stored as parallel arrays, sorted by arrival time
+
+    Rows are kept in stable arrival order, which is the order every
+    scheduling engine expects. Row i describes one process through
+    ids[i], arrival[i], burst[i] and priority[i], while order[i] is its
+    position in the caller's original input. The start and completion
+    columns are filled in by a simulation, after which the totals are
+    summed over whole columns instead of per-process dictionaries.
+    """
+
+    def __init__(self, ids, arrivals, bursts, priorities):
+        """
+        Build a table from unsorted columns
+
+        Args:
+            ids: Process identifiers
+            arrivals: Arrival times
+            bursts: CPU burst times
+            priorities: Priorities (lower number = higher priority)
+        """
+        n = len(ids)
+        order = range(n)
+        if any(arrivals[i] > arrivals[i + 1] for i in range(n - 1)):
+            order = sorted(order, key=arrivals.__getitem__)
+            ids = [ids[i] for i in order]
+            arrivals = [arrivals[i] for i in order]
+            bursts = [bursts[i] for i in order]
+            priorities = [priorities[i] for i in order]
+
+        self.ids = list(ids)
+        self.order = array('q', order)
+        self.arrival = _column(arrivals)
+        self.burst = _column(bursts)
+        self.priority = _column(priorities)
+        self.reset_times()
+
+    @classmethod
+    def from_processes(cls, processes, arrival_key='arrival', burst_key='burst', id_key='id', priority_key='priority'):
+        """
+        Build a table from a list of process dictionaries
+
+        Args:
+            processes: List of process dictionaries
+            arrival_key: Key holding the arrival time
+            burst_key: Key holding the burst time
+            id_key: Key holding the process id
+            priority_key: Key holding the priority (defaults to 0 when absent or null)
+
+        Returns:
+            ProcessTable sorted by arrival time
+        """
+        return cls(
+            [p[id_key] for p in processes],
+            [p[arrival_key] for p in processes],
+            [p[burst_key] for p in processes],
+            [p.get(priority_key) or 0 for p in processes]
+        )
+
+    @classmethod
+    def of(cls, processes, arrival_key='arrival', burst_key='burst'):
+        """Return processes as a table, building one only when needed"""
+        if isinstance(processes, cls):
+            return processes
+        return cls.from_processes(processes, arrival_key, burst_key)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def reset_times(self, *steps):
+        """
+        Clear the start and completion columns before a simulation
+
+        Args:
+            *steps: Extra time steps the simulation adds (e.g. time quanta);
+                a non-integer step switches the columns to floating point,
+                while None is ignored
+        """
+        exact = (self.arrival.typecode == 'q' and self.burst.typecode == 'q'
+                 and all(step is None or isinstance(step, int) for step in steps))
+        typecode = 'q' if exact else 'd'
+        self.start = array(typecode, [-1]) * len(self)
+        self.completion = array(typecode, [0]) * len(self)
+
+    def makespan(self):
+        """
+        Time at which the last process finishes
+
+        Every single-CPU policy here keeps the CPU busy whenever a process
+        is ready, so the makespan is the same for all of them and can be
+        found before simulating.
+        """
+        current_time = 0
+        for arrival, burst in zip(self.arrival, self.burst):
+            current_time = max(current_time, arrival) + burst
+        return current_time
+
+    def total_burst(self):
+        """Total CPU burst time"""
+        return sum(self.burst)
+
+    def total_turnaround(self):
+        """Total turnaround time (completion - arrival)"""
+        return sum(self.completion) - sum(self.arrival)
+
+    def total_waiting(self):
+        """Total waiting time (turnaround - burst)"""
+        return self.total_turnaround() - self.total_burst()
+
+    def total_response(self):
+        """Total response time (first start - arrival)"""
+        return sum(self.start) - sum(self.arrival)
@@ -2,143 +2,147 @@
 Round Robin CPU Scheduling Algorithm Module
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from backend.modules.process_table import ProcessTable
+from backend.modules.scheduling_engine import run_round_robin, summarize_round_robin
+from backend.modules.scheduling_policies import RoundRobinPolicy
+from backend.modules import schedule_stream
+
+# Below this many processes a pool costs more to start than it saves
+SWEEP_POOL_MIN_PROCESSES = 1000
+
+# Per-worker copy of the sweep workload, shipped once by the pool initializer
+_sweep_workload = None
+
+def _init_sweep_worker(arrivals, bursts, ids):
+    """Store the sorted workload in a sweep worker process"""
+    global _sweep_workload
+    _sweep_workload = (arrivals, bursts, ids)
+
+def _sweep_worker(time_quantum, include_gantt):
+    """Evaluate one quantum against the worker's stored workload"""
+    arrivals, bursts, ids = _sweep_workload
+    return _sweep_quantum(arrivals, bursts, ids, time_quantum, include_gantt)
+
+def _sweep_quantum(arrivals, bursts, ids, time_quantum, include_gantt):
+    """
+    Evaluate Round Robin for a single time quantum
+    
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        ids: Process ids, aligned with arrivals
+        time_quantum: Time quantum to evaluate
+        include_gantt: Whether to build the Gantt chart as well
+        
+    Returns:
+        Dictionary with the quantum, its metrics and optional Gantt chart
+    """
+    start_times, completion_times, context_switches, total_time = summarize_round_robin(arrivals, bursts, time_quantum)
+    
+    n = len(arrivals)
+    total_arrival = sum(arrivals)
+    total_burst = sum(bursts)
+    total_turnaround = sum(completion_times) - total_arrival
+    total_waiting = total_turnaround - total_burst
+    total_response = sum(start_times) - total_arrival
+    
+    result = {
+        'timeQuantum': time_quantum,
+        'totalTime': total_time,
+        'metrics': {
+            'avgWaitingTime': round(total_waiting / n, 2),
+            'avgTurnaroundTime': round(total_turnaround / n, 2),
+            'avgResponseTime': round(total_response / n, 2),
+            'cpuUtilization': round(total_burst / total_time, 4) if total_time > 0 else 0,
+            'contextSwitches': context_switches
+        }
+    }
+    
+    if include_gantt:
+        result['ganttChart'] = {
+            'processes': [
+                {'name': ids[index], 'startTime': start, 'duration': end - start}
+                for index, start, end, _ in run_round_robin(arrivals, bursts, time_quantum)
+            ],
+            'totalTime': total_time
+        }
+    
+    return result
+
 class RoundRobinModule:
     def __init__(self):
         self.name = "Round Robin"
         self.description = "Processes are executed in time slices (quantum) in circular order"
     
-    def simulate(self, processes, time_quantum):
+    def simulate(self, processes, time_quantum, max_segments=None):
         """
         Simulate Round Robin CPU scheduling algorithm
         
         Args:
-            processes: List of process dictionaries with keys: id, arrival, burst, priority
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
             time_quantum: Time quantum for round robin scheduling
+            max_segments: Cap on Gantt segments; longer charts are summarized
+                per time bucket by their dominant process
             
         Returns:
             Dictionary containing simulation results
         """
-        # Sort processes by arrival time
-        sorted_processes = sorted(processes, key=lambda x: x['arrival'])
+        return schedule_stream.collect(self.stream(processes, time_quantum, max_segments))
+    
+    def stream(self, processes, time_quantum, max_segments=None):
+        """
+        Simulate Round Robin lazily, yielding the schedule as it is produced
         
-        current_time = 0
-        gantt_chart = []
-        process_results = []
-        ready_queue = []
-        process_index = 0
-        steps = []
+        Args:
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
+            time_quantum: Time quantum for round robin scheduling
+            max_segments: Cap on Gantt segments; longer charts are summarized
+                per time bucket by their dominant process
+            
+        Yields:
+            (kind, record) pairs: a 'header', then 'segment', 'step' and
+            'process' records in schedule order, and a closing 'summary'
+        """
+        return schedule_stream.schedule(processes, RoundRobinPolicy(time_quantum), max_segments)
+    
+    def sweep(self, processes, quanta, include_gantt=False, max_workers=None):
+        """
+        Evaluate Round Robin over several time quanta
         
-        # Initialize process data
-        process_data = []
-        for process in sorted_processes:
-            process_data.append({
-                'id': process['id'],
-                'arrival': process['arrival'],
-                'burst': process['burst'],
-                'remaining_time': process['burst'],
-                'start_time': -1,
-                'completion_time': -1,
-                'turnaround_time': -1,
-                'waiting_time': -1,
-                'response_time': -1
-            })
+        The workload is sorted once and shared by every quantum. Large
+        workloads fan the quanta out across a process pool, with the
+        workload shipped to each worker once rather than once per quantum.
         
-        while process_index < len(process_data) or ready_queue:
-            # Add processes that have arrived to ready queue
-            while (process_index < len(process_data) and 
-                   process_data[process_index]['arrival'] <= current_time):
-                ready_queue.append(process_data[process_index])
-                process_index += 1
-            
-            if not ready_queue:
-                # No processes ready, advance time to next arrival
-                if process_index < len(process_data):
-                    current_time = process_data[process_index]['arrival']
-                    continue
-                else:
-                    break
-            
-            # Get next process from ready queue
-            process = ready_queue.pop(0)
-            
-            # Set start time if this is the first time the process runs
-            if process['start_time'] == -1:
-                process['start_time'] = current_time
-                process['response_time'] = process['start_time'] - process['arrival']
-            
-            # Execute for time quantum or remaining time, whichever is smaller
-            execution_time = min(time_quantum, process['remaining_time'])
-            start_execution = current_time
-            end_execution = start_execution + execution_time
-            
-            # Add to Gantt chart
-            gantt_chart.append({
-                'name': process['id'],
-                'startTime': start_execution,
-                'duration': execution_time
-            })
-            steps.append({
-                'event': 'timeslice',
-                'process': process['id'],
-                'quantum': time_quantum,
-                'ran': execution_time,
-                'start': start_execution,
-                'end': end_execution
-            })
-            
-            # Update remaining time
-            process['remaining_time'] -= execution_time
-            current_time = end_execution
+        Args:
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
+            quanta: List of time quanta to evaluate
+            include_gantt: Whether to return a Gantt chart for each quantum
+            max_workers: Upper bound on pool size (defaults to the CPU count)
             
-            # If process is not finished, add it back to ready queue
-            if process['remaining_time'] > 0:
-                # Add any new processes that arrived during execution
-                while (process_index < len(process_data) and 
-                       process_data[process_index]['arrival'] <= current_time):
-                    ready_queue.append(process_data[process_index])
-                    process_index += 1
-                ready_queue.append(process)
-            else:
-                # Process is completed
-                process['completion_time'] = current_time
-                process['turnaround_time'] = process['completion_time'] - process['arrival']
-                process['waiting_time'] = process['turnaround_time'] - process['burst']
-                
-                process_results.append({
-                    'id': process['id'],
-                    'arrivalTime': process['arrival'],
-                    'burstTime': process['burst'],
-                    'startTime': process['start_time'],
-                    'completionTime': process['completion_time'],
-                    'turnaroundTime': process['turnaround_time'],
-                    'waitingTime': process['waiting_time'],
-                    'responseTime': process['response_time']
-                })
+        Returns:
+            Dictionary containing per-quantum metrics
+        """
+        table = ProcessTable.of(processes)
+        arrivals, bursts, ids = table.arrival, table.burst, table.ids
         
-        # Calculate metrics
-        total_waiting_time = sum(p['waitingTime'] for p in process_results)
-        total_turnaround_time = sum(p['turnaroundTime'] for p in process_results)
-        total_response_time = sum(p['responseTime'] for p in process_results)
-        total_burst_time = sum(p['burstTime'] for p in process_results)
+        workers = min(len(quanta), max_workers or os.cpu_count() or 1)
         
-        avg_waiting_time = total_waiting_time / len(process_results)
-        avg_turnaround_time = total_turnaround_time / len(process_results)
-        avg_response_time = total_response_time / len(process_results)
-        cpu_utilization = total_burst_time / current_time if current_time > 0 else 0
+        if workers <= 1 or len(table) < SWEEP_POOL_MIN_PROCESSES:
+            results = [_sweep_quantum(arrivals, bursts, ids, q, include_gantt) for q in quanta]
+        else:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_sweep_worker,
+                                     initargs=(arrivals, bursts, ids)) as pool:
+                results = list(pool.map(_sweep_worker, quanta, [include_gantt] * len(quanta)))
         
         return {
             'algorithm': 'Round Robin',
-            'timeQuantum': time_quantum,
-            'ganttChart': {
-                'processes': gantt_chart,
-                'totalTime': current_time
-            },
-            'processResults': process_results,
-            'metrics': {
-                'avgWaitingTime': round(avg_waiting_time, 2),
-                'avgTurnaroundTime': round(avg_turnaround_time, 2),
-                'avgResponseTime': round(avg_response_time, 2),
-                'cpuUtilization': round(cpu_utilization, 4)
-            },
-            'steps': steps
+            'processCount': len(table),
+            'sweep': results
         }
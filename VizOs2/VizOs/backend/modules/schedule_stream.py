@@ -0,0 +1,327 @@
+"""
+Schedule Stream
+Incremental form of a scheduling result, shared by the CPU scheduling modules
+"""
+
+import json
+
+from backend.modules.process_table import ProcessTable
+
+def schedule(processes, policy, max_segments=None):
+    """
+    Run a scheduling policy and stream its result
+
+    Args:
+        processes: List of process dictionaries with keys: id, arrival, burst, priority,
+            or a ProcessTable
+        policy: SchedulingPolicy to run
+        max_segments: Cap on Gantt segments; longer charts are summarized
+            per time bucket by their dominant process
+
+    Returns:
+        Iterator of (kind, record) pairs: a 'header', then 'segment', 'step'
+        and 'process' records in schedule order, and a closing 'summary'
+    """
+    table = ProcessTable.of(processes)
+    return compact(_records(table, policy), table, max_segments)
+
+def _records(table, policy):
+    """Shape a policy's runs into result records"""
+    header = {'algorithm': policy.name}
+    if policy.quantum is not None:
+        header['timeQuantum'] = policy.quantum
+    yield 'header', header
+
+    current_time = 0
+
+    for index, start_time, end_time, remaining in policy.run(table):
+        process_id = table.ids[index]
+
+        # Add to Gantt chart
+        yield 'segment', {
+            'name': process_id,
+            'startTime': start_time,
+            'duration': end_time - start_time
+        }
+
+        if policy.quantum is not None:
+            yield 'step', {
+                'event': 'timeslice',
+                'process': process_id,
+                'quantum': policy.quantum,
+                'ran': end_time - start_time,
+                'start': start_time,
+                'end': end_time
+            }
+        else:
+            step = {'event': 'dispatch', 'process': process_id}
+            if policy.reason:
+                step['reason'] = policy.reason
+            step['start'] = start_time
+            step['end'] = end_time
+            yield 'step', step
+
+            if remaining > 0:
+                yield 'step', {
+                    'event': 'preempt',
+                    'process': process_id,
+                    'time': end_time,
+                    'remaining': remaining
+                }
+
+        if remaining == 0:
+            # Store process results on completion
+            arrival = table.arrival[index]
+            burst = table.burst[index]
+            turnaround_time = end_time - arrival
+            result = {
+                'id': process_id,
+                'arrivalTime': arrival,
+                'burstTime': burst
+            }
+            if policy.reports_priority:
+                result['priority'] = table.priority[index]
+            result['startTime'] = table.start[index]
+            result['completionTime'] = end_time
+            result['turnaroundTime'] = turnaround_time
+            result['waitingTime'] = turnaround_time - burst
+            result['responseTime'] = table.start[index] - arrival
+            yield 'process', result
+
+        current_time = end_time
+
+    yield 'summary', summarize(table, current_time)
+
+def summarize(table, total_time):
+    """
+    Build the closing summary record of a schedule
+
+    Args:
+        table: ProcessTable whose start and completion columns are filled in
+        total_time: Time at which the last process finished
+
+    Returns:
+        Dictionary with the total time and the averaged metrics
+    """
+    n = len(table)
+    cpu_utilization = table.total_burst() / total_time if total_time > 0 else 0
+
+    return {
+        'totalTime': total_time,
+        'metrics': {
+            'avgWaitingTime': round(table.total_waiting() / n, 2),
+            'avgTurnaroundTime': round(table.total_turnaround() / n, 2),
+            'avgResponseTime': round(table.total_response() / n, 2),
+            'cpuUtilization': round(cpu_utilization, 4)
+        }
+    }
+
+def collect(events):
+    """
+    Assemble a streamed schedule into the usual simulation result
+
+    Args:
+        events: (kind, record) pairs: one 'header', then 'segment',
+            'step' and 'process' records, and a closing 'summary'
+
+    Returns:
+        Dictionary containing simulation results
+    """
+    result = {}
+    gantt_chart = []
+    process_results = []
+    steps = []
+    append = {'segment': gantt_chart.append, 'process': process_results.append, 'step': steps.append}
+
+    for kind, record in events:
+        if kind in append:
+            append[kind](record)
+        elif kind == 'header':
+            result.update(record)
+        else:
+            result['ganttChart'] = {
+                'processes': gantt_chart,
+                'totalTime': record['totalTime']
+            }
+            result['processResults'] = process_results
+            result['metrics'] = record['metrics']
+            result['steps'] = steps
+
+    return result
+
+def compact(events, table, max_segments=None):
+    """
+    Compact the Gantt segments of a streamed schedule in a single pass
+
+    Back-to-back segments of the same process are always merged, which
+    loses nothing. When max_segments is given and the merged chart is
+    still longer, the timeline is cut into at most max_segments equal
+    buckets and each bucket is summarized by its dominant process: the
+    one that ran longest in it. Summary segments add the dominant
+    process's share of the span and the number of processes that ran.
+    Only max_segments segments are ever buffered.
+
+    Args:
+        events: (kind, record) pairs as yielded by a module's stream method
+        table: ProcessTable being simulated, whose makespan sizes the buckets
+        max_segments: Upper bound on the number of segments, or None
+
+    Yields:
+        The same records, with 'segment' records compacted
+    """
+    merged = _merge_segments(events)
+    if max_segments is None:
+        return merged
+    if max_segments < 1:
+        raise ValueError('max_segments must be at least 1')
+    return _downsample_segments(merged, max_segments, table.makespan())
+
+def _merge_segments(events):
+    """Merge back-to-back segments of the same process"""
+    pending = None
+    for kind, record in events:
+        if kind != 'segment':
+            if kind == 'summary' and pending:
+                yield 'segment', pending
+                pending = None
+            yield kind, record
+        elif (pending and pending['name'] == record['name']
+              and pending['startTime'] + pending['duration'] == record['startTime']):
+            pending['duration'] += record['duration']
+        else:
+            if pending:
+                yield 'segment', pending
+            pending = record
+    if pending:
+        yield 'segment', pending
+
+def _downsample_segments(events, max_segments, total_time):
+    """Replace the segments with bucket summaries once there are too many"""
+    buffered = []
+    buckets = None
+    for kind, record in events:
+        if kind != 'segment':
+            if kind == 'summary':
+                for summary in (buckets.finish() if buckets else buffered):
+                    yield 'segment', summary
+                buffered = []
+                buckets = None
+            yield kind, record
+        elif buckets:
+            for summary in buckets.add(record):
+                yield 'segment', summary
+        else:
+            buffered.append(record)
+            if len(buffered) > max_segments:
+                # Too detailed to send as is, so replay the buffer into buckets
+                buckets = _GanttBuckets(-(-total_time // max_segments), total_time)
+                for segment in buffered:
+                    for summary in buckets.add(segment):
+                        yield 'segment', summary
+                buffered = []
+    for summary in (buckets.finish() if buckets else buffered):
+        yield 'segment', summary
+
+class _GanttBuckets:
+    """
+    Fixed-width time buckets, each summarized by its dominant process
+
+    Segments must arrive in time order. Adjacent buckets with the same
+    dominant process are merged into one summary, and a segment that
+    covers whole buckets is summarized without visiting each of them.
+    """
+
+    def __init__(self, width, total_time):
+        self.width = width
+        self.total_time = total_time
+        self.bucket = None     # Index of the bucket being filled
+        self.run_times = {}    # Process -> run time inside that bucket
+        self.pending = None    # Last summary, held back for merging
+
+    def add(self, segment):
+        """Add a segment, returning the summaries it completes"""
+        done = []
+        name = segment['name']
+        start = segment['startTime']
+        end = start + segment['duration']
+        width = self.width
+
+        while start < end:
+            bucket = int(start // width)
+            if bucket != self.bucket:
+                self._close(done)
+                self.bucket = bucket
+            bucket_end = (bucket + 1) * width
+            piece_end = min(end, bucket_end)
+            self.run_times[name] = self.run_times.get(name, 0) + piece_end - start
+            start = piece_end
+
+            # Whole buckets owned by this one process are summarized at once
+            whole = (end - start) // width
+            if start == bucket_end and whole >= 1:
+                self._close(done)
+                self._emit(done, name, start, whole * width, whole * width, {name})
+                start += whole * width
+        return done
+
+    def finish(self):
+        """Close the last bucket, returning the remaining summaries"""
+        done = []
+        self._close(done)
+        if self.pending:
+            done.append(self._record(self.pending))
+            self.pending = None
+        return done
+
+    def _close(self, done):
+        """Summarize the bucket being filled"""
+        if self.run_times:
+            name = max(self.run_times, key=self.run_times.get)
+            start = self.bucket * self.width
+            duration = min(self.width, self.total_time - start)
+            self._emit(done, name, start, duration, self.run_times[name], set(self.run_times))
+        self.bucket = None
+        self.run_times = {}
+
+    def _emit(self, done, name, start, duration, run_time, names):
+        """Merge a summary into the pending one, or flush the pending one"""
+        pending = self.pending
+        if pending and pending[0] == name and pending[1] + pending[2] == start:
+            pending[2] += duration
+            pending[3] += run_time
+            pending[4] |= names
+            return
+        if pending:
+            done.append(self._record(pending))
+        self.pending = [name, start, duration, run_time, names]
+
+    def _record(self, pending):
+        name, start, duration, run_time, names = pending
+        return {
+            'name': name,
+            'startTime': start,
+            'duration': duration,
+            'share': round(run_time / duration, 4),
+            'processCount': len(names)
+        }
+
+def ndjson(events):
+    """
+    Encode a streamed schedule as newline-delimited JSON
+
+    Each record becomes one line tagged with its kind, so a client can
+    draw segments as they arrive and read the metrics from the last line.
+    An error raised mid-stream is reported as a final 'error' line, since
+    the response status has already been sent.
+
+    Args:
+        events: (kind, record) pairs as yielded by a module's stream method
+
+    Yields:
+        One encoded line per record
+    """
+    try:
+        for kind, record in events:
+            yield json.dumps({'type': kind, **record}) + '\n'
+    except Exception as e:
+        yield json.dumps({'type': 'error', 'error': str(e)}) + '\n'
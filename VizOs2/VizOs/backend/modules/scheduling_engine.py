@@ -0,0 +1,568 @@
+"""
+Scheduling Engine
+Event-driven core shared by the CPU scheduling modules and algorithms
+"""
+
+import heapq
+import random
+from collections import deque
+
+
+def run_nonpreemptive(arrivals, bursts, ranks):
+    """
+    Run a non-preemptive, rank-ordered scheduler (SJF, Priority)
+
+    The ready set is a binary heap keyed on (rank, arrival, index) and new
+    processes are admitted through a cursor over the arrival order, so each
+    dispatch costs O(log n).
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        ranks: Selection key per process (lower runs first)
+
+    Yields:
+        Tuples of (index, start, end) in dispatch order
+    """
+    n = len(arrivals)
+    ready = []
+    cursor = 0
+    current_time = 0
+
+    while cursor < n or ready:
+        # Admit every process that has arrived by now
+        while cursor < n and arrivals[cursor] <= current_time:
+            heapq.heappush(ready, (ranks[cursor], arrivals[cursor], cursor))
+            cursor += 1
+
+        if not ready:
+            # CPU is idle until the next arrival
+            current_time = arrivals[cursor]
+            continue
+
+        _, _, index = heapq.heappop(ready)
+        start = current_time
+        current_time = start + bursts[index]
+        yield index, start, current_time
+
+
+def run_preemptive(arrivals, bursts, ranks=None):
+    """
+    Run a preemptive, rank-ordered scheduler (SRTF, preemptive Priority)
+
+    Time only advances to the next arrival or completion, so the cost
+    depends on the number of processes and never on the burst lengths.
+    A running process is preempted when an arrival has a strictly better
+    (rank, arrival, index) key; ties keep the running process on the CPU.
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        ranks: Static selection key per process (lower runs first), or
+            None to rank by remaining time (SRTF)
+
+    Yields:
+        Tuples of (index, start, end, remaining) for every contiguous run,
+        where remaining is 0 once the process has completed
+    """
+    n = len(arrivals)
+    remaining = list(bursts)
+    ready = []
+    cursor = 0
+    current_time = 0
+
+    while cursor < n or ready:
+        # Admit every process that has arrived by now
+        while cursor < n and arrivals[cursor] <= current_time:
+            rank = remaining[cursor] if ranks is None else ranks[cursor]
+            heapq.heappush(ready, (rank, arrivals[cursor], cursor))
+            cursor += 1
+
+        if not ready:
+            # CPU is idle until the next arrival
+            current_time = arrivals[cursor]
+            continue
+
+        rank, arrival, index = heapq.heappop(ready)
+        start = current_time
+        finish = start + remaining[index]
+        preempted_at = None
+
+        # Only arrivals before the finish time can take the CPU away
+        while cursor < n and arrivals[cursor] < finish:
+            now = arrivals[cursor]
+            while cursor < n and arrivals[cursor] == now:
+                new_rank = remaining[cursor] if ranks is None else ranks[cursor]
+                heapq.heappush(ready, (new_rank, now, cursor))
+                cursor += 1
+            if ranks is None:
+                rank = finish - now
+            if ready[0] < (rank, arrival, index):
+                preempted_at = now
+                break
+
+        if preempted_at is None:
+            remaining[index] = 0
+            current_time = finish
+        else:
+            remaining[index] = finish - preempted_at
+            current_time = preempted_at
+            heapq.heappush(ready, (rank, arrival, index))
+
+        yield index, start, current_time, remaining[index]
+
+
+def run_round_robin(arrivals, bursts, quantum, detail=True):
+    """
+    Run Round Robin scheduling with O(1) work per time slice
+
+    The ready queue is a deque of indices and arrivals are admitted through
+    a cursor. Once the ready set has gone a full round without an arrival
+    or completion, the next k full rounds are computed in one step, where
+    k is bounded by the shortest remaining burst and the next arrival.
+    Back-to-back slices of the same process (a lone ready process) are
+    coalesced into a single run.
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        quantum: Time quantum
+        detail: When False, skipped rounds of several processes are reported
+            as one (None, start, end, slices) tuple instead of per-slice runs
+
+    Yields:
+        Tuples of (index, start, end, remaining) for every contiguous run,
+        where remaining is 0 once the process has completed
+    """
+    n = len(arrivals)
+    remaining = list(bursts)
+    ready = deque()
+    cursor = 0
+    current_time = 0
+    stable = 0  # slices since the ready set last changed
+    pending = None  # run held back so it can absorb the next slice
+
+    while cursor < n or ready:
+        # Admit every process that has arrived by now
+        while cursor < n and arrivals[cursor] <= current_time:
+            ready.append(cursor)
+            cursor += 1
+            stable = 0
+
+        if not ready:
+            # CPU is idle until the next arrival
+            current_time = arrivals[cursor]
+            continue
+
+        size = len(ready)
+        if stable >= size:
+            # The ready set survived a full round, so skip ahead by k rounds
+            # that end before the next arrival and the next completion
+            stable = 0
+            span = size * quantum
+            rounds = -(-min(remaining[i] for i in ready) // quantum) - 1
+            if cursor < n:
+                rounds = min(rounds, -((current_time - arrivals[cursor]) // span) - 1)
+            if rounds > 0:
+                if size == 1:
+                    # A lone process runs all k slices as one coalesced run
+                    index = ready[0]
+                    start = current_time
+                    current_time += rounds * quantum
+                    remaining[index] -= rounds * quantum
+                    if pending is not None and pending[0] == index and pending[2] == start:
+                        pending[2] = current_time
+                        pending[3] = remaining[index]
+                    else:
+                        if pending is not None:
+                            yield tuple(pending)
+                        pending = [index, start, current_time, remaining[index]]
+                    continue
+                if not detail:
+                    # No process starts or finishes inside skipped rounds
+                    if pending is not None:
+                        yield tuple(pending)
+                        pending = None
+                    start = current_time
+                    current_time += rounds * span
+                    for index in ready:
+                        remaining[index] -= rounds * quantum
+                    yield None, start, current_time, rounds * size
+                    continue
+                for _ in range(rounds):
+                    for index in ready:
+                        start = current_time
+                        current_time += quantum
+                        remaining[index] -= quantum
+                        if pending is not None:
+                            yield tuple(pending)
+                        pending = [index, start, current_time, remaining[index]]
+                continue
+
+        index = ready.popleft()
+        start = current_time
+        run = min(quantum, remaining[index])
+        current_time += run
+        remaining[index] -= run
+
+        # Arrivals during the slice queue up ahead of the preempted process
+        while cursor < n and arrivals[cursor] <= current_time:
+            ready.append(cursor)
+            cursor += 1
+            stable = 0
+        if remaining[index] > 0:
+            ready.append(index)
+            stable += 1
+        else:
+            stable = 0
+
+        if pending is not None and pending[0] == index and pending[2] == start:
+            pending[2] = current_time
+            pending[3] = remaining[index]
+        else:
+            if pending is not None:
+                yield tuple(pending)
+            pending = [index, start, current_time, remaining[index]]
+
+    if pending is not None:
+        yield tuple(pending)
+
+
+def summarize_round_robin(arrivals, bursts, quantum):
+    """
+    Compute Round Robin timings without materializing the schedule
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        quantum: Time quantum
+
+    Returns:
+        Tuple of (start_times, completion_times, context_switches, total_time),
+        where a context switch is a dispatch of a different process than the
+        one that ran last
+    """
+    n = len(arrivals)
+    start_times = [-1] * n
+    completion_times = [0] * n
+    context_switches = 0
+    last = None
+    total_time = 0
+
+    for index, start, end, value in run_round_robin(arrivals, bursts, quantum, detail=False):
+        total_time = end
+        if index is None:
+            # Every slice of a skipped multi-process round is a switch
+            context_switches += value
+            last = -1
+            continue
+        if last is not None and index != last:
+            context_switches += 1
+        last = index
+        if start_times[index] == -1:
+            start_times[index] = start
+        if value == 0:
+            completion_times[index] = end
+
+    return start_times, completion_times, context_switches, total_time
+
+
+def run_mlfq(arrivals, bursts, quanta, boost_interval=None):
+    """
+    Run a Multi-Level Feedback Queue scheduler
+
+    New processes enter level 0. A process that uses its whole quantum is
+    demoted one level, and an arrival preempts a process running below
+    level 0. Every boost_interval time units all processes return to
+    level 0. Boosts are applied lazily when the epoch counter
+    (time // boost_interval) moves on: the lower level queues are spliced
+    onto the top queue in O(levels), so no queue is ever walked. The
+    highest non-empty level comes from a bitmask, keeping every queue
+    operation O(1).
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        quanta: Time quantum per level, highest priority first
+        boost_interval: Time between priority boosts, or None to disable
+
+    Yields:
+        Tuples of (index, start, end, remaining, level) for every time slice,
+        where remaining is 0 once the process has completed
+    """
+    n = len(arrivals)
+    bottom = len(quanta) - 1
+    remaining = list(bursts)
+    top = deque([deque()])  # level 0 as a chain of spliced queues
+    queues = [None] + [deque() for _ in range(bottom)]
+    counts = [0] * (bottom + 1)
+    mask = 0  # bit l is set while level l has queued processes
+    epoch = 0
+    cursor = 0
+    current_time = 0
+    requeue = None  # (index, level) of the process that just ran
+
+    while True:
+        # Apply a boost that became due, after the arrivals that preceded it
+        if boost_interval and current_time // boost_interval > epoch:
+            epoch = current_time // boost_interval
+            boost_time = epoch * boost_interval
+            while cursor < n and arrivals[cursor] < boost_time:
+                top[-1].append(cursor)
+                counts[0] += 1
+                cursor += 1
+            spliced = False
+            for level in range(1, bottom + 1):
+                if counts[level]:
+                    top.append(queues[level])
+                    queues[level] = deque()
+                    counts[0] += counts[level]
+                    counts[level] = 0
+                    spliced = True
+            if spliced:
+                # Later arrivals queue behind the boosted processes
+                top.append(deque())
+            mask = 1 if counts[0] else 0
+            if requeue is not None:
+                # The running process was boosted along with everyone else
+                requeue = (requeue[0], 0)
+
+        # Admit every process that has arrived by now
+        while cursor < n and arrivals[cursor] <= current_time:
+            top[-1].append(cursor)
+            counts[0] += 1
+            cursor += 1
+        if counts[0]:
+            mask |= 1
+
+        # The preempted or demoted process queues behind the arrivals
+        if requeue is not None:
+            index, level = requeue
+            requeue = None
+            if level == 0:
+                top[-1].append(index)
+            else:
+                queues[level].append(index)
+            counts[level] += 1
+            mask |= 1 << level
+
+        if not mask:
+            if cursor == n:
+                break
+            # CPU is idle until the next arrival
+            current_time = arrivals[cursor]
+            continue
+
+        level = (mask & -mask).bit_length() - 1
+        if level == 0:
+            while not top[0]:
+                top.popleft()
+            index = top[0].popleft()
+        else:
+            index = queues[level].popleft()
+        counts[level] -= 1
+        if not counts[level]:
+            mask &= ~(1 << level)
+
+        start = current_time
+        end = start + min(quanta[level], remaining[index])
+
+        # An arrival preempts a lower level unless a boost comes first
+        preempted = False
+        if level > 0 and cursor < n and arrivals[cursor] < end:
+            if not boost_interval or arrivals[cursor] // boost_interval == epoch:
+                end = arrivals[cursor]
+                preempted = True
+
+        remaining[index] -= end - start
+        current_time = end
+        yield index, start, end, remaining[index], level
+
+        if remaining[index] > 0:
+            requeue = (index, level if preempted else min(level + 1, bottom))
+
+
+BALANCING_POLICIES = ('global', 'per_cpu', 'work_stealing')
+
+
+def run_smp(arrivals, bursts, ranks, num_cpus, balancing='global', quantum=None,
+            balance_interval=None, seed=0):
+    """
+    Run a multiprocessor scheduler with a configurable run-queue layout
+
+    Balancing policies:
+        global: one run queue shared by every CPU
+        per_cpu: a run queue per CPU, rebalanced every balance_interval
+        work_stealing: a run queue per CPU; a CPU that runs dry, or is
+            already idle, takes the head of a randomly chosen non-empty queue
+
+    Arrivals go to an idle CPU when there is one and are spread round-robin
+    otherwise; preempted Round Robin slices return to their CPU's queue.
+    Time jumps between completion and arrival events, and rebalancing is
+    applied lazily at the first event of each interval, so the cost grows
+    with the number of events rather than CPUs x time.
+
+    Args:
+        arrivals: Arrival times, sorted ascending
+        bursts: CPU burst times, aligned with arrivals
+        ranks: Selection key per process (lower runs first), or None for
+            first-come first-served order
+        num_cpus: Number of CPUs
+        balancing: One of BALANCING_POLICIES
+        quantum: Time quantum for Round Robin, or None to run to completion
+        balance_interval: Time between rebalances for the per_cpu policy
+        seed: Seed for the work-stealing victim choice
+
+    Yields:
+        Tuples of (cpu, index, start, end, remaining) for every run,
+        where remaining is 0 once the process has completed
+    """
+    if balancing not in BALANCING_POLICIES:
+        raise ValueError(f'Unknown balancing policy: {balancing}')
+
+    n = len(arrivals)
+    remaining = list(bursts)
+    shared = balancing == 'global'
+    queues = [[] for _ in range(1 if shared else num_cpus)]
+    running = [None] * num_cpus  # (index, start) of the current run
+    events = []  # heap of (end, cpu) for runs in progress
+    free = list(range(num_cpus))  # heap of idle CPUs, validated on pop
+    listed = [True] * num_cpus  # whether a CPU has an entry in free
+    loaded = []  # CPUs with queued work, for O(1) victim choice
+    loaded_at = {}
+    rng = random.Random(seed)
+    seq = 0
+    cursor = 0
+    spread = 0
+    balance_epoch = 0
+
+    def push(cpu, entry):
+        heapq.heappush(queues[cpu], entry)
+        if not shared and cpu not in loaded_at:
+            loaded_at[cpu] = len(loaded)
+            loaded.append(cpu)
+
+    def pop(cpu):
+        queue = queues[cpu]
+        entry = heapq.heappop(queue)
+        if not shared and not queue:
+            # Swap-remove from the loaded index
+            position = loaded_at.pop(cpu)
+            last = loaded.pop()
+            if last != cpu:
+                loaded[position] = last
+                loaded_at[last] = position
+        return entry
+
+    def take_free():
+        while free:
+            cpu = heapq.heappop(free)
+            listed[cpu] = False
+            if running[cpu] is None:
+                return cpu
+        return None
+
+    def release(cpu):
+        if not listed[cpu]:
+            listed[cpu] = True
+            heapq.heappush(free, cpu)
+
+    def dispatch(cpu, index, now):
+        run = remaining[index] if quantum is None else min(quantum, remaining[index])
+        remaining[index] -= run
+        running[cpu] = (index, now)
+        heapq.heappush(events, (now + run, cpu))
+
+    while cursor < n or events:
+        if events and (cursor == n or events[0][0] <= arrivals[cursor]):
+            now = events[0][0]
+        else:
+            now = arrivals[cursor]
+
+        wake = []
+        requeue = []
+
+        # Completions come first so finished CPUs can take new arrivals
+        while events and events[0][0] == now:
+            _, cpu = heapq.heappop(events)
+            index, start = running[cpu]
+            running[cpu] = None
+            yield cpu, index, start, now, remaining[index]
+            if remaining[index] > 0:
+                requeue.append((cpu, index))
+            if shared or (remaining[index] == 0 and not queues[cpu]):
+                release(cpu)
+            wake.append(cpu)
+
+        # Arrivals prefer an idle CPU, then spread round-robin
+        while cursor < n and arrivals[cursor] <= now:
+            entry = (seq, cursor) if ranks is None else (ranks[cursor], arrivals[cursor], cursor)
+            seq += 1
+            if shared:
+                push(0, entry)
+            else:
+                cpu = take_free()
+                if cpu is None:
+                    cpu = spread
+                    spread = (spread + 1) % num_cpus
+                push(cpu, entry)
+                wake.append(cpu)
+            cursor += 1
+
+        # Preempted slices queue behind the arrivals on their own CPU
+        for cpu, index in requeue:
+            entry = (seq, index) if ranks is None else (ranks[index], arrivals[index], index)
+            seq += 1
+            push(0 if shared else cpu, entry)
+
+        if balancing == 'per_cpu' and balance_interval and now // balance_interval > balance_epoch:
+            # Even out queued plus running work across the CPUs
+            balance_epoch = now // balance_interval
+            loads = [len(queues[c]) + (running[c] is not None) for c in range(num_cpus)]
+            total = sum(loads)
+            order = sorted(range(num_cpus), key=lambda c: loads[c], reverse=True)
+            targets = [0] * num_cpus
+            for position, cpu in enumerate(order):
+                share = total // num_cpus + (1 if position < total % num_cpus else 0)
+                targets[cpu] = max(0, share - (running[cpu] is not None))
+            moving = []
+            for cpu in order:
+                while len(queues[cpu]) > targets[cpu]:
+                    moving.append(pop(cpu))
+            for cpu in reversed(order):
+                while moving and len(queues[cpu]) < targets[cpu]:
+                    push(cpu, moving.pop())
+                    wake.append(cpu)
+            for entry in moving:
+                push(order[-1], entry)
+                wake.append(order[-1])
+
+        # Dispatch onto every CPU that can run something
+        if shared:
+            while queues[0]:
+                cpu = take_free()
+                if cpu is None:
+                    break
+                index = pop(0)[-1]
+                dispatch(cpu, index, now)
+        else:
+            for cpu in wake:
+                if running[cpu] is not None:
+                    continue
+                if queues[cpu]:
+                    index = pop(cpu)[-1]
+                elif balancing == 'work_stealing' and loaded:
+                    index = pop(loaded[rng.randrange(len(loaded))])[-1]
+                else:
+                    release(cpu)
+                    continue
+                dispatch(cpu, index, now)
+
+            if balancing == 'work_stealing':
+                # CPUs that went idle at an earlier event steal too, so no
+                # CPU waits while another CPU's queue holds work
+                while loaded:
+                    cpu = take_free()
+                    if cpu is None:
+                        break
+                    dispatch(cpu, pop(loaded[rng.randrange(len(loaded))])[-1], now)
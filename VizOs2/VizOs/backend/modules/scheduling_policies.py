@@ -0,0 +1,158 @@
+"""
+Scheduling Policies
+Policy objects that plug each CPU scheduling algorithm into the shared engine
+"""
+
+from backend.modules.scheduling_engine import run_nonpreemptive, run_preemptive, run_round_robin
+
+
+class SchedulingPolicy:
+    """
+    How the engine picks the next process to run
+
+    Both result formats (the camelCase modules and the snake_case
+    algorithms) run a policy through run() and only differ in how they
+    shape its output.
+
+    Attributes:
+        key: Short identifier used by the API ("fcfs", "sjf", ...)
+        name: Algorithm name reported in results
+        preemptive: Whether a running process can lose the CPU
+        quantum: Time slice for time-sliced policies, otherwise None
+        reason: Why a process was dispatched, for step traces
+        reports_priority: Whether per-process results include the priority
+    """
+
+    key = None
+    name = None
+    preemptive = False
+    quantum = None
+    reason = None
+    reports_priority = False
+
+    def ranks(self, table):
+        """Selection key per process (lower runs first), or None for arrival order"""
+        return None
+
+    def run(self, table):
+        """
+        Run the policy over a process table
+
+        The table's start and completion columns are filled in as the
+        schedule is produced.
+
+        Args:
+            table: ProcessTable to schedule
+
+        Yields:
+            Tuples of (index, start, end, remaining), one per run on the CPU
+        """
+        table.reset_times(self.quantum)
+        start_times = table.start
+        completion_times = table.completion
+
+        for index, start, end, remaining in self._runs(table):
+            if start_times[index] == -1:
+                start_times[index] = start
+            if remaining == 0:
+                completion_times[index] = end
+            yield index, start, end, remaining
+
+    def _runs(self, table):
+        raise NotImplementedError
+
+
+class FCFSPolicy(SchedulingPolicy):
+    """First Come First Serve: run processes to completion in arrival order"""
+
+    key = 'fcfs'
+    name = 'FCFS'
+
+    def _runs(self, table):
+        current_time = 0
+        for index, (arrival, burst) in enumerate(zip(table.arrival, table.burst)):
+            start = max(current_time, arrival)
+            current_time = start + burst
+            yield index, start, current_time, 0
+
+
+class SJFPolicy(SchedulingPolicy):
+    """Shortest Job First, or Shortest Remaining Time First when preemptive"""
+
+    key = 'sjf'
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+        self.name = 'SRTF' if preemptive else 'SJF'
+        self.reason = 'shortest remaining time' if preemptive else 'shortest job'
+
+    def ranks(self, table):
+        return table.burst
+
+    def _runs(self, table):
+        if self.preemptive:
+            return run_preemptive(table.arrival, table.burst)
+        return ((index, start, end, 0)
+                for index, start, end in run_nonpreemptive(table.arrival, table.burst, table.burst))
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """Priority scheduling (lower number = higher priority)"""
+
+    key = 'priority'
+    reason = 'highest priority'
+    reports_priority = True
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+        self.name = 'Priority (Preemptive)' if preemptive else 'Priority'
+
+    def ranks(self, table):
+        return table.priority
+
+    def _runs(self, table):
+        if self.preemptive:
+            return run_preemptive(table.arrival, table.burst, table.priority)
+        return ((index, start, end, 0)
+                for index, start, end in run_nonpreemptive(table.arrival, table.burst, table.priority))
+
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """Round Robin with a fixed time quantum"""
+
+    key = 'roundrobin'
+    name = 'Round Robin'
+    preemptive = True
+
+    def __init__(self, quantum):
+        self.quantum = quantum
+
+    def _runs(self, table):
+        # Consecutive slices of a lone process arrive as one coalesced run
+        return run_round_robin(table.arrival, table.burst, self.quantum)
+
+
+def make_policy(key, preemptive=False, quantum=2):
+    """
+    Build a policy from its API identifier
+
+    Args:
+        key: "fcfs", "sjf", "priority", or "roundrobin"
+        preemptive: Preemptive variant of SJF or Priority
+        quantum: Time quantum for Round Robin
+
+    Returns:
+        SchedulingPolicy instance
+
+    Raises:
+        ValueError: If the identifier is unknown
+    """
+    if key == 'fcfs':
+        return FCFSPolicy()
+    if key == 'sjf':
+        return SJFPolicy(preemptive)
+    if key == 'priority':
+        return PriorityPolicy(preemptive)
+    if key == 'roundrobin':
+        return RoundRobinPolicy(quantum)
+    raise ValueError(f'Unknown policy: {key}')
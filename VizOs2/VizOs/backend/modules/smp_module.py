@@ -0,0 +1,124 @@
+"""
+Multiprocessor (SMP) CPU Scheduling Module
+Runs the scheduling policies across several CPUs with per-CPU run queues
+"""
+
+from backend.modules.process_table import ProcessTable
+from backend.modules.scheduling_engine import run_smp, BALANCING_POLICIES
+from backend.modules.scheduling_policies import make_policy
+
+class SMPModule:
+    def __init__(self):
+        self.name = "Multiprocessor Scheduling"
+        self.description = "Processes are scheduled across several CPUs using shared or per-CPU run queues"
+        self.balancing_policies = BALANCING_POLICIES
+
+    def simulate(self, processes, policy, num_cpus, balancing='global', time_quantum=2, balance_interval=10, seed=0):
+        """
+        Simulate a scheduling policy on several CPUs
+
+        Args:
+            processes: List of process dictionaries with keys: id, arrival, burst, priority,
+                or a ProcessTable
+            policy: "fcfs", "sjf", "priority", or "roundrobin"
+            num_cpus: Number of CPUs
+            balancing: "global", "per_cpu", or "work_stealing"
+            time_quantum: Time quantum when policy is "roundrobin"
+            balance_interval: Time between rebalances for "per_cpu"
+            seed: Seed for work-stealing victim selection
+
+        Returns:
+            Dictionary containing per-CPU Gantt charts and aggregate metrics
+        """
+        policy = make_policy(policy, quantum=time_quantum)
+
+        table = ProcessTable.of(processes)
+        table.reset_times(policy.quantum)
+
+        cpu_charts = [[] for _ in range(num_cpus)]
+        busy_times = [0] * num_cpus
+        current_time = 0
+        process_results = []
+        steps = []
+
+        for cpu, index, start_time, end_time, remaining in run_smp(table.arrival, table.burst, policy.ranks(table), num_cpus, balancing,
+                                                                     policy.quantum, balance_interval, seed):
+            process_id = table.ids[index]
+
+            if table.start[index] == -1:
+                table.start[index] = start_time
+
+            # Extend the CPU's last segment when the same process keeps running
+            chart = cpu_charts[cpu]
+            last = chart[-1] if chart else None
+            if last and last['name'] == process_id and last['startTime'] + last['duration'] == start_time:
+                last['duration'] += end_time - start_time
+            else:
+                chart.append({
+                    'name': process_id,
+                    'startTime': start_time,
+                    'duration': end_time - start_time
+                })
+            steps.append({
+                'event': 'dispatch',
+                'cpu': cpu,
+                'process': process_id,
+                'start': start_time,
+                'end': end_time
+            })
+
+            busy_times[cpu] += end_time - start_time
+            current_time = max(current_time, end_time)
+
+            if remaining == 0:
+                arrival = table.arrival[index]
+                burst = table.burst[index]
+                turnaround_time = end_time - arrival
+                table.completion[index] = end_time
+
+                process_results.append({
+                    'id': process_id,
+                    'cpu': cpu,
+                    'arrivalTime': arrival,
+                    'burstTime': burst,
+                    'startTime': table.start[index],
+                    'completionTime': end_time,
+                    'turnaroundTime': turnaround_time,
+                    'waitingTime': turnaround_time - burst,
+                    'responseTime': table.start[index] - arrival
+                })
+
+        # Calculate metrics over the table columns
+        n = len(table)
+        avg_waiting_time = table.total_waiting() / n
+        avg_turnaround_time = table.total_turnaround() / n
+        avg_response_time = table.total_response() / n
+        cpu_utilization = sum(busy_times) / (num_cpus * current_time) if current_time > 0 else 0
+        throughput = n / current_time if current_time > 0 else 0
+
+        return {
+            'algorithm': policy.name,
+            'numCpus': num_cpus,
+            'balancing': balancing,
+            'ganttChart': {
+                'cpus': [
+                    {
+                        'cpu': cpu,
+                        'processes': cpu_charts[cpu],
+                        'busyTime': busy_times[cpu],
+                        'utilization': round(busy_times[cpu] / current_time, 4) if current_time > 0 else 0
+                    }
+                    for cpu in range(num_cpus)
+                ],
+                'totalTime': current_time
+            },
+            'processResults': process_results,
+            'metrics': {
+                'avgWaitingTime': round(avg_waiting_time, 2),
+                'avgTurnaroundTime': round(avg_turnaround_time, 2),
+                'avgResponseTime': round(avg_response_time, 2),
+                'cpuUtilization': round(cpu_utilization, 4),
+                'throughput': round(throughput, 4)
+            },
+            'steps': steps
+        }
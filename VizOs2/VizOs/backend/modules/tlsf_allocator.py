@@ -0,0 +1,177 @@
+"""
+TLSF Allocator
+Two-level segregated fit: constant-time allocation and free
+"""
+
+
+class TLSFAllocator:
+    """
+    Two-level segregated fit allocator over one region of memory
+
+    Free blocks are kept in segregated lists by size class. The first
+    level splits sizes by power of two, and the second level splits each
+    power of two into 2 ** second_level_bits equal ranges. A bitmap of
+    non-empty first-level classes, and one bitmap per first-level class
+    for its second-level lists, find a list holding a large enough block
+    with two lowest-set-bit operations.
+
+    The request is rounded up to the next class boundary before the
+    search, so every block in the list found fits and the head of the
+    list can be taken as is. Freed blocks merge with their physical
+    neighbours through boundary tags (the start and end of every free
+    block). Every allocation and free is a bounded number of steps,
+    whatever the state of the heap; the price is that a block slightly
+    larger than the request but in the request's own class is not used.
+
+    It offers the same find / take / release interface as FreeList, and
+    counts the constant-time steps it performs in `steps`.
+    """
+
+    def __init__(self, size, metrics=None, second_level_bits=4):
+        """
+        Args:
+            size: Size of the region, free as one block
+            metrics: Optional FragmentationMetrics told about every free
+                block added or removed
+            second_level_bits: log2 of the number of second-level lists
+                per power of two
+        """
+        self.metrics = metrics
+        self.second_level_bits = second_level_bits
+        self.second_level = 1 << second_level_bits
+        first_levels = self._mapping(max(size, 1))[0] + 1
+        self.fl_bitmap = 0
+        self.sl_bitmaps = [0] * first_levels
+        self.heads = [[None] * self.second_level for _ in range(first_levels)]
+        self.block_size = {}  # Start -> size of every free block
+        self.block_at_end = {}  # End -> start of every free block (the boundary tags)
+        self.next_free = {}  # Start -> start of the next block in its list
+        self.prev_free = {}  # Start -> start of the previous block in its list
+        self.free_units = 0
+        self.steps = 0
+        if size > 0:
+            self._link(0, size)
+            self.free_units = size
+
+    def __len__(self):
+        return len(self.block_size)
+
+    def __iter__(self):
+        """Free blocks as (start, size) pairs in address order"""
+        return iter(sorted(self.block_size.items()))
+
+    def find(self, size, strategy=None):
+        """
+        Start address of the free block a request of size units takes
+
+        Args:
+            size: Requested size
+            strategy: Ignored; accepted for the FreeList interface
+
+        Returns:
+            Start address of the block, or None if no class that is sure
+            to fit the request has a free block
+        """
+        fl, sl = self._search_class(size)
+        self.steps += 1
+        sl_map = self.sl_bitmaps[fl] & (-1 << sl) if fl < len(self.sl_bitmaps) else 0
+        if not sl_map:
+            # No list left in this power of two: the next non-empty first level
+            self.steps += 1
+            fl_map = self.fl_bitmap & (-1 << (fl + 1))
+            if not fl_map:
+                return None
+            fl = (fl_map & -fl_map).bit_length() - 1
+            sl_map = self.sl_bitmaps[fl]
+        sl = (sl_map & -sl_map).bit_length() - 1
+        return self.heads[fl][sl]
+
+    def take(self, start, size):
+        """Allocate size units from the front of the free block at start"""
+        block = self.block_size[start]
+        if block < size:
+            raise ValueError(f'Free block at {start} is smaller than {size}')
+        self._unlink(start)
+        if block > size:
+            # Split, returning the remainder to its list
+            self._link(start + size, block - size)
+        self.free_units -= size
+
+    def release(self, start, size):
+        """
+        Free size units at start, merging them with free physical neighbours
+
+        Returns:
+            Tuple of (start, size) of the free block after merging
+
+        Raises:
+            ValueError: If the range starts or ends inside free memory
+        """
+        end = start + size
+        if start in self.block_size or end in self.block_at_end:
+            raise ValueError(f'Range {start}-{end} overlaps free memory')
+        self.free_units += size
+
+        self.steps += 1
+        if end in self.block_size:
+            size += self.block_size[end]
+            self._unlink(end)
+        self.steps += 1
+        left = self.block_at_end.get(start)
+        if left is not None:
+            size += self.block_size[left]
+            self._unlink(left)
+            start = left
+        self._link(start, size)
+        return start, size
+
+    def _mapping(self, size):
+        """First- and second-level class of a block size"""
+        if size < self.second_level:
+            return 0, size
+        shift = size.bit_length() - 1 - self.second_level_bits
+        return shift + 1, (size >> shift) - self.second_level
+
+    def _search_class(self, size):
+        """Class of the smallest blocks that all fit size units"""
+        if size >= self.second_level:
+            size += (1 << (size.bit_length() - 1 - self.second_level_bits)) - 1
+        return self._mapping(size)
+
+    def _link(self, start, size):
+        """Push a free block onto the head of its list"""
+        self.steps += 1
+        fl, sl = self._mapping(size)
+        head = self.heads[fl][sl]
+        self.next_free[start] = head
+        self.prev_free[start] = None
+        if head is not None:
+            self.prev_free[head] = start
+        self.heads[fl][sl] = start
+        self.block_size[start] = size
+        self.block_at_end[start + size] = start
+        self.sl_bitmaps[fl] |= 1 << sl
+        self.fl_bitmap |= 1 << fl
+        if self.metrics is not None:
+            self.metrics.add(size)
+
+    def _unlink(self, start):
+        """Remove a free block from its list"""
+        self.steps += 1
+        size = self.block_size.pop(start)
+        del self.block_at_end[start + size]
+        fl, sl = self._mapping(size)
+        prev = self.prev_free.pop(start)
+        following = self.next_free.pop(start)
+        if prev is None:
+            self.heads[fl][sl] = following
+        else:
+            self.next_free[prev] = following
+        if following is not None:
+            self.prev_free[following] = prev
+        if self.heads[fl][sl] is None:
+            self.sl_bitmaps[fl] &= ~(1 << sl)
+            if not self.sl_bitmaps[fl]:
+                self.fl_bitmap &= ~(1 << fl)
+        if self.metrics is not None:
+            self.metrics.remove(size)
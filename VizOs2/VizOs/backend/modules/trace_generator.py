@@ -0,0 +1,252 @@
+"""
+Trace Generator
+Seeded synthetic page traces for benchmarking the page replacement algorithms
+
+A pattern is described by a JSON-friendly dictionary:
+    {'type': 'zipf', 'pages': 10000, 'alpha': 1.0}
+        Independent references, page k chosen with weight 1 / (k + 1) ** alpha
+    {'type': 'loop', 'pages': 500}
+        Sequential scan over the pages, repeated
+    {'type': 'phased', 'pages': 100000, 'working_set': 200, 'phase_length': 5000}
+        Uniform references within a working set that moves every phase
+    {'type': 'mixture', 'components': [{'weight': 3, ...}, {'weight': 1, ...}], 'block': 64}
+        Blocks of references drawn from the component patterns by weight
+Every pattern also takes an 'offset' added to its page numbers.
+
+Usage:
+    python -m backend.modules.trace_generator OUT --pattern '{"type": "zipf", "pages": 100000}'
+        --length 100000000 [--seed 1] [--format binary|json] [--dtype uint32|uint64]
+"""
+
+import argparse
+import json
+import random
+from array import array
+from itertools import accumulate
+
+from backend.modules.page_trace import TRACE_TYPES
+
+def _check_pages(kind, pages, offset):
+    """Reject page ranges that do not fit in unsigned 64-bit page numbers"""
+    if pages < 1:
+        raise ValueError(f'A {kind} pattern needs at least one page')
+    if offset < 0 or offset + pages > 1 << 64:
+        raise ValueError(f'The {kind} pattern pages must lie between 0 and 2 ** 64 - 1')
+
+class ZipfPattern:
+    """Independent references following a Zipf distribution over the pages"""
+
+    def __init__(self, rng, pages, alpha=1.0, offset=0):
+        _check_pages('Zipf', pages, offset)
+        self.rng = rng
+        self.population = range(offset, offset + pages)
+        self.cum_weights = list(accumulate(1 / (rank + 1) ** alpha for rank in range(pages)))
+
+    def take(self, n):
+        """Next n references"""
+        return array('Q', self.rng.choices(self.population, cum_weights=self.cum_weights, k=n))
+
+class LoopPattern:
+    """A sequential scan over the pages, repeated"""
+
+    def __init__(self, rng, pages, offset=0):
+        _check_pages('loop', pages, offset)
+        self.pages = pages
+        self.offset = offset
+        self.position = 0
+
+    def take(self, n):
+        """Next n references"""
+        chunk = array('Q')
+        while len(chunk) < n:
+            end = min(self.pages, self.position + n - len(chunk))
+            chunk.extend(range(self.offset + self.position, self.offset + end))
+            self.position = end % self.pages
+        return chunk
+
+class PhasedPattern:
+    """Uniform references within a working set that moves to a random place every phase"""
+
+    def __init__(self, rng, pages, working_set, phase_length, offset=0):
+        _check_pages('phased', pages, offset)
+        if not 1 <= working_set <= pages:
+            raise ValueError('The working set must hold between 1 page and all pages')
+        if phase_length < 1:
+            raise ValueError('Phases must be at least one reference long')
+        self.rng = rng
+        self.pages = pages
+        self.working_set = working_set
+        self.phase_length = phase_length
+        self.offset = offset
+        self.left = 0  # References left in the current phase
+        self.population = None
+
+    def take(self, n):
+        """Next n references"""
+        chunk = array('Q')
+        while len(chunk) < n:
+            if self.left == 0:
+                base = self.offset + self.rng.randrange(self.pages - self.working_set + 1)
+                self.population = range(base, base + self.working_set)
+                self.left = self.phase_length
+            k = min(self.left, n - len(chunk))
+            chunk.extend(self.rng.choices(self.population, k=k))
+            self.left -= k
+        return chunk
+
+class MixturePattern:
+    """Blocks of references drawn from component patterns, chosen by weight"""
+
+    def __init__(self, rng, components, block=64, offset=0):
+        if not components:
+            raise ValueError('A mixture needs at least one component')
+        if block < 1:
+            raise ValueError('Mixture blocks must be at least one reference long')
+        self.rng = rng
+        self.block = block
+        self.cum_weights = list(accumulate(component.get('weight', 1) for component in components))
+        self.patterns = [make_pattern(rng, {**component, 'offset': offset + component.get('offset', 0)})
+                         for component in components]
+        self.current = None  # Pattern of the current block
+        self.left = 0  # References left in the current block
+
+    def take(self, n):
+        """Next n references"""
+        chunk = array('Q')
+        while len(chunk) < n:
+            if self.left == 0:
+                self.current = self.rng.choices(self.patterns, cum_weights=self.cum_weights)[0]
+                self.left = self.block
+            k = min(self.left, n - len(chunk))
+            chunk.extend(self.current.take(k))
+            self.left -= k
+        return chunk
+
+def make_pattern(rng, spec):
+    """
+    Build a pattern from its dictionary description
+
+    Args:
+        rng: random.Random instance shared by the pattern and its components
+        spec: Pattern description (see module docstring)
+
+    Returns:
+        Pattern instance with a take(n) method
+
+    Raises:
+        ValueError: If the pattern type or its parameters are invalid
+    """
+    spec = dict(spec)
+    kind = spec.pop('type', None)
+    spec.pop('weight', None)
+    try:
+        if kind == 'zipf':
+            return ZipfPattern(rng, **spec)
+        if kind == 'loop':
+            return LoopPattern(rng, **spec)
+        if kind == 'phased':
+            return PhasedPattern(rng, **spec)
+        if kind == 'mixture':
+            return MixturePattern(rng, **spec)
+    except TypeError as e:
+        raise ValueError(f'Invalid {kind} pattern: {e}')
+    raise ValueError(f'Unknown pattern: {kind}')
+
+def pattern_pages(spec):
+    """
+    Pages spanned by a pattern and all of its components
+
+    Building a Zipf pattern takes memory in proportion to its pages, so
+    callers serving untrusted patterns can bound this before generating.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError('A pattern must be a dictionary')
+    pages = spec.get('pages', 0)
+    if not isinstance(pages, int):
+        raise ValueError('Pattern pages must be an integer')
+    return pages + sum(pattern_pages(component) for component in spec.get('components', []))
+
+def generate(spec, length, seed=None, chunk_size=1 << 16):
+    """
+    Generate a synthetic page trace
+
+    The same pattern, length and seed always give the same trace,
+    whatever the chunk size.
+
+    Args:
+        spec: Pattern description (see module docstring)
+        length: Number of references
+        seed: Random seed
+        chunk_size: References per yielded chunk
+
+    Returns:
+        Iterator of array('Q') chunks of page numbers, in trace order
+
+    Raises:
+        ValueError: If the pattern is invalid
+    """
+    pattern = make_pattern(random.Random(seed), spec)
+    return (pattern.take(min(chunk_size, length - start)) for start in range(0, length, chunk_size))
+
+def write_trace(path, chunks, fmt='binary', dtype='uint32'):
+    """
+    Write a page trace in a format the page replacement module reads
+
+    Args:
+        path: Output file path
+        chunks: Iterable of page number arrays, e.g. from generate()
+        fmt: 'binary' for a flat file of dtype page numbers (see
+            page_trace), or 'json' for a {"page_requests": [...]} request body
+        dtype: 'uint32' or 'uint64', for binary output
+
+    Returns:
+        Number of references written
+    """
+    if fmt not in ('binary', 'json'):
+        raise ValueError(f'Unknown trace format: {fmt}')
+    if dtype not in TRACE_TYPES:
+        raise ValueError(f'Unknown trace type: {dtype}')
+
+    written = 0
+    if fmt == 'binary':
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                if dtype == 'uint32':
+                    chunk = array(TRACE_TYPES[dtype], chunk)
+                chunk.tofile(f)
+                written += len(chunk)
+        return written
+
+    with open(path, 'w') as f:
+        f.write('{"page_requests": [')
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            if written:
+                f.write(', ')
+            f.write(', '.join(map(str, chunk)))
+            written += len(chunk)
+        f.write(']}\n')
+    return written
+
+def main(argv=None):
+    """Generate a trace file from the command line"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic page trace')
+    parser.add_argument('output', help='Output file path')
+    parser.add_argument('--pattern', required=True, help='Pattern description as JSON')
+    parser.add_argument('--length', type=int, required=True, help='Number of references')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+    parser.add_argument('--format', choices=['binary', 'json'], default='binary', help='Output format')
+    parser.add_argument('--dtype', choices=sorted(TRACE_TYPES), default='uint32', help='Page number type for binary output')
+    args = parser.parse_args(argv)
+
+    try:
+        written = write_trace(args.output, generate(json.loads(args.pattern), args.length, args.seed),
+                              args.format, args.dtype)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f'Wrote {written} references to {args.output}')
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
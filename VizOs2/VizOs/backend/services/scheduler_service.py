@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from algorithms import FCFS, SJF, Priority, RoundRobin
+from backend.modules.process_table import ProcessTable
 
 def fcfs(processes):
     """
@@ -34,10 +35,10 @@ def fcfs(processes):
         'process_details': result['process_details']
     }
 
-def sjf(processes):
-    """Execute SJF scheduling algorithm"""
+def sjf(processes, preemptive=False):
+    """Execute SJF scheduling algorithm (SRTF when preemptive)"""
     validated_processes = _validate_processes(processes)
-    result = SJF.execute(validated_processes)
+    result = SJF.execute(validated_processes, preemptive)
     
     return {
         'gantt_chart': result['gantt_chart'],
@@ -69,14 +70,14 @@ def roundrobin(processes, quantum):
 
 def _validate_processes(processes, require_priority=False):
     """
-    Validate and normalize process data
+    Validate and normalize process data into a ProcessTable
     
     Args:
         processes: List of process dictionaries
         require_priority: Whether priority field is required
         
     Returns:
-        Validated list of processes
+        ProcessTable of the validated processes, sorted by arrival time
         
     Raises:
         ValueError: If validation fails
@@ -84,7 +85,10 @@ def _validate_processes(processes, require_priority=False):
     if not isinstance(processes, list) or len(processes) == 0:
         raise ValueError("Processes must be a non-empty list")
     
-    validated = []
+    ids = []
+    arrivals = []
+    bursts = []
+    priorities = []
     for i, proc in enumerate(processes):
         if not isinstance(proc, dict):
             raise ValueError(f"Process {i} must be a dictionary")
@@ -108,12 +112,10 @@ def _validate_processes(processes, require_priority=False):
             if 'priority' not in proc:
                 raise ValueError(f"Process {i} missing 'priority' field")
         
-        validated.append({
-            'id': str(proc['id']),
-            'arrival_time': int(proc['arrival_time']),
-            'burst_time': int(proc['burst_time']),
-            'priority': int(proc.get('priority', 0))
-        })
+        ids.append(str(proc['id']))
+        arrivals.append(int(proc['arrival_time']))
+        bursts.append(int(proc['burst_time']))
+        priorities.append(int(proc.get('priority', 0)))
     
-    return validated
+    return ProcessTable(ids, arrivals, bursts, priorities)
 
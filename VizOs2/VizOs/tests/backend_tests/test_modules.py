@@ -0,0 +1,842 @@
+"""
+Module Tests
+Unit tests for backend simulation modules
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from array import array
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+
+from backend.modules.process_table import ProcessTable
+from backend.modules import schedule_stream
+from backend.modules.fcfs_module import FCFSModule
+from backend.modules.sjf_module import SJFModule
+from backend.modules.priority_module import PriorityModule
+from backend.modules.roundrobin_module import RoundRobinModule
+from backend.modules.mlfq_module import MLFQModule
+from backend.modules.smp_module import SMPModule
+from backend.modules.scheduling_policies import make_policy
+from backend.modules.page_replacement_module import PageReplacementModule
+from backend.modules.page_trace import iter_trace
+from backend.modules import trace_generator
+from backend.modules import paging_sweep
+from backend.modules.address_translation_module import AddressTranslationModule
+from backend.modules.memory_allocation_module import MemoryAllocationModule
+from backend.modules.buddy_allocator import BuddyAllocator
+from backend.modules.fragmentation_metrics import FragmentationMetrics
+from backend.modules.tlsf_allocator import TLSFAllocator
+from backend.modules.allocation_index import SortedRuns, SizeIndex, MaxSegmentTree, FreeList
+from backend.modules.paging_engine import run_fifo, run_lru, run_opt, run_arc, run_2q
+from algorithms import FCFS, SJF, Priority, RoundRobin
+
+class TestProcessTable(unittest.TestCase):
+    """Test cases for the columnar process table"""
+
+    def test_table_sorts_by_arrival(self):
+        """Test rows are stably sorted by arrival and remember input order"""
+        processes = [
+            {'id': 'P1', 'arrival': 4, 'burst': 2},
+            {'id': 'P2', 'arrival': 0, 'burst': 3, 'priority': 2},
+            {'id': 'P3', 'arrival': 4, 'burst': 1}
+        ]
+
+        table = ProcessTable.from_processes(processes)
+
+        self.assertEqual(table.ids, ['P2', 'P1', 'P3'])
+        self.assertEqual(list(table.order), [1, 0, 2])
+        self.assertEqual(list(table.priority), [2, 0, 0])
+        self.assertEqual(table.arrival.typecode, 'q')
+
+    def test_table_shared_across_modules(self):
+        """Test one table can be simulated repeatedly with the same result"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 5, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 3, 'priority': 0}
+        ]
+        table = ProcessTable.from_processes(processes)
+
+        for _ in range(2):
+            result = RoundRobinModule().simulate(table, 2)
+            self.assertEqual(result, RoundRobinModule().simulate(processes, 2))
+        self.assertEqual(table.total_waiting(), 6)
+        self.assertEqual(SJFModule().simulate(table)['metrics']['avgWaitingTime'], 2.0)
+
+    def test_null_priority_defaults_to_zero(self):
+        """Test a null priority does not break policies that never read it"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 3, 'priority': None},
+            {'id': 'P2', 'arrival': 1, 'burst': 2}
+        ]
+
+        self.assertEqual(list(ProcessTable.from_processes(processes).priority), [0, 0])
+        self.assertEqual(FCFSModule().simulate(processes)['metrics']['avgWaitingTime'], 1.0)
+        self.assertEqual(SJFModule().simulate(processes)['metrics']['avgWaitingTime'], 1.0)
+        self.assertEqual(RoundRobinModule().simulate(processes, 2)['metrics']['avgWaitingTime'], 1.5)
+
+class TestSchedulingPolicies(unittest.TestCase):
+    """Test cases for the policy objects shared by modules and algorithms"""
+
+    def test_surfaces_share_one_core(self):
+        """Test both output formats report the same schedule for each policy"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 7, 'priority': 3},
+            {'id': 'P2', 'arrival': 2, 'burst': 4, 'priority': 1},
+            {'id': 'P3', 'arrival': 4, 'burst': 1, 'priority': 2}
+        ]
+        legacy = [{'id': p['id'], 'arrival_time': p['arrival'], 'burst_time': p['burst'],
+                   'priority': p['priority']} for p in processes]
+        cases = [
+            (FCFSModule().simulate(processes), FCFS.execute(legacy)),
+            (SJFModule().simulate(processes, True), SJF.execute(legacy, True)),
+            (PriorityModule().simulate(processes), Priority.execute(legacy)),
+            (RoundRobinModule().simulate(processes, 3), RoundRobin.execute(legacy, 3))
+        ]
+
+        for module_result, algorithm_result in cases:
+            segments = [(s['name'], s['startTime'], s['startTime'] + s['duration'])
+                        for s in module_result['ganttChart']['processes']]
+            self.assertEqual(segments, [(s['process'], s['start'], s['end'])
+                                        for s in algorithm_result['gantt_chart']])
+            self.assertEqual([p['completionTime'] for p in module_result['processResults']],
+                             [p['completion_time'] for p in algorithm_result['process_details']])
+            self.assertEqual(module_result['metrics']['avgWaitingTime'],
+                             algorithm_result['metrics']['average_waiting_time'])
+
+    def test_make_policy(self):
+        """Test API identifiers map to configured policies"""
+        self.assertEqual(make_policy('sjf', preemptive=True).name, 'SRTF')
+        self.assertEqual(make_policy('roundrobin', quantum=4).quantum, 4)
+        with self.assertRaises(ValueError):
+            make_policy('lottery')
+
+class TestScheduleStream(unittest.TestCase):
+    """Test cases for streamed scheduling results"""
+
+    def test_stream_trailer_comes_last(self):
+        """Test records stream in schedule order with the summary last"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 3, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 2, 'priority': 0}
+        ]
+
+        lines = [json.loads(line) for line in schedule_stream.ndjson(RoundRobinModule().stream(processes, 1))]
+
+        self.assertEqual(lines[0], {'type': 'header', 'algorithm': 'Round Robin', 'timeQuantum': 1})
+        self.assertEqual([l['name'] for l in lines if l['type'] == 'segment'], ['P1', 'P2', 'P1', 'P2', 'P1'])
+        self.assertEqual(lines[-1]['type'], 'summary')
+        self.assertEqual(lines[-1]['totalTime'], 5)
+
+    def test_collect_matches_simulate(self):
+        """Test collecting a stream rebuilds the full simulation result"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 8, 'priority': 2},
+            {'id': 'P2', 'arrival': 1, 'burst': 4, 'priority': 1}
+        ]
+        module = PriorityModule()
+
+        streamed = schedule_stream.collect(module.stream(processes, preemptive=True))
+
+        self.assertEqual(streamed, module.simulate(processes, preemptive=True))
+        self.assertEqual(list(streamed), ['algorithm', 'ganttChart', 'processResults', 'metrics', 'steps'])
+
+    def test_max_segments_summarizes_buckets(self):
+        """Test long charts collapse into dominant-process bucket summaries"""
+        processes = [
+            {'id': 'A', 'arrival': 0, 'burst': 10, 'priority': 0},
+            {'id': 'B', 'arrival': 0, 'burst': 30, 'priority': 0}
+        ]
+        module = RoundRobinModule()
+
+        full = module.simulate(processes, 1)
+        compact = module.simulate(processes, 1, max_segments=4)
+
+        self.assertEqual(len(full['ganttChart']['processes']), 20)
+        self.assertEqual(compact['ganttChart']['processes'], [
+            {'name': 'A', 'startTime': 0, 'duration': 20, 'share': 0.5, 'processCount': 2},
+            {'name': 'B', 'startTime': 20, 'duration': 20, 'share': 1.0, 'processCount': 1}
+        ])
+        self.assertEqual(compact['metrics'], full['metrics'])
+
+    def test_max_segments_keeps_short_charts(self):
+        """Test charts already within the cap are returned unchanged"""
+        processes = [
+            {'id': 'A', 'arrival': 0, 'burst': 3, 'priority': 0},
+            {'id': 'B', 'arrival': 5, 'burst': 2, 'priority': 0}
+        ]
+        module = SJFModule()
+
+        self.assertEqual(module.simulate(processes, max_segments=2), module.simulate(processes))
+
+class TestSJFModule(unittest.TestCase):
+    """Test cases for SJF module"""
+
+    def test_sjf_dispatch_order(self):
+        """Test shortest ready job runs next, ties broken by arrival"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 8, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 4, 'priority': 0},
+            {'id': 'P3', 'arrival': 2, 'burst': 2, 'priority': 0},
+            {'id': 'P4', 'arrival': 3, 'burst': 2, 'priority': 0}
+        ]
+
+        result = SJFModule().simulate(processes)
+
+        order = [seg['name'] for seg in result['ganttChart']['processes']]
+        self.assertEqual(order, ['P1', 'P3', 'P4', 'P2'])
+        self.assertEqual(result['ganttChart']['totalTime'], 16)
+
+    def test_sjf_idle_gap(self):
+        """Test CPU idles until the next arrival"""
+        processes = [
+            {'id': 'P1', 'arrival': 5, 'burst': 3, 'priority': 0}
+        ]
+
+        result = SJFModule().simulate(processes)
+
+        self.assertEqual(result['processResults'][0]['startTime'], 5)
+        self.assertEqual(result['metrics']['cpuUtilization'], 0.375)
+
+    def test_srtf_splits_preempted_runs(self):
+        """Test SRTF preempts on a shorter arrival and resumes later"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 8, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 4, 'priority': 0},
+            {'id': 'P3', 'arrival': 2, 'burst': 9, 'priority': 0}
+        ]
+
+        result = SJFModule().simulate(processes, preemptive=True)
+
+        segments = [(seg['name'], seg['startTime'], seg['duration'])
+                    for seg in result['ganttChart']['processes']]
+        self.assertEqual(result['algorithm'], 'SRTF')
+        self.assertEqual(segments, [('P1', 0, 1), ('P2', 1, 4), ('P1', 5, 7), ('P3', 12, 9)])
+        p1 = next(p for p in result['processResults'] if p['id'] == 'P1')
+        self.assertEqual(p1['responseTime'], 0)
+        self.assertEqual(p1['waitingTime'], 4)
+
+class TestPriorityModule(unittest.TestCase):
+    """Test cases for Priority module"""
+
+    def test_priority_dispatch_order(self):
+        """Test lowest priority number runs first once the CPU is free"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 4, 'priority': 3},
+            {'id': 'P2', 'arrival': 1, 'burst': 3, 'priority': 2},
+            {'id': 'P3', 'arrival': 2, 'burst': 1, 'priority': 1}
+        ]
+
+        result = PriorityModule().simulate(processes)
+
+        order = [seg['name'] for seg in result['ganttChart']['processes']]
+        self.assertEqual(order, ['P1', 'P3', 'P2'])
+
+    def test_priority_preemptive_long_bursts(self):
+        """Test preemptive priority advances by events, not by time units"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 10 ** 9, 'priority': 3},
+            {'id': 'P2', 'arrival': 5, 'burst': 10 ** 9, 'priority': 1}
+        ]
+
+        result = PriorityModule().simulate(processes, preemptive=True)
+
+        segments = [(seg['name'], seg['startTime'], seg['duration'])
+                    for seg in result['ganttChart']['processes']]
+        self.assertEqual(segments, [
+            ('P1', 0, 5),
+            ('P2', 5, 10 ** 9),
+            ('P1', 10 ** 9 + 5, 10 ** 9 - 5)
+        ])
+        self.assertEqual(result['ganttChart']['totalTime'], 2 * 10 ** 9)
+
+class TestRoundRobinModule(unittest.TestCase):
+    """Test cases for Round Robin module"""
+
+    def test_roundrobin_rotation(self):
+        """Test arrivals queue ahead of the preempted process"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 5, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 3, 'priority': 0}
+        ]
+
+        result = RoundRobinModule().simulate(processes, 2)
+
+        segments = [(seg['name'], seg['startTime'], seg['duration'])
+                    for seg in result['ganttChart']['processes']]
+        self.assertEqual(segments, [('P1', 0, 2), ('P2', 2, 2), ('P1', 4, 2), ('P2', 6, 1), ('P1', 7, 1)])
+
+    def test_roundrobin_lone_process_coalesced(self):
+        """Test slices of a lone process collapse into one segment"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 10 ** 7, 'priority': 0},
+            {'id': 'P2', 'arrival': 10 ** 7 + 3, 'burst': 4, 'priority': 0}
+        ]
+
+        result = RoundRobinModule().simulate(processes, 1)
+
+        segments = [(seg['name'], seg['startTime'], seg['duration'])
+                    for seg in result['ganttChart']['processes']]
+        self.assertEqual(segments, [('P1', 0, 10 ** 7), ('P2', 10 ** 7 + 3, 4)])
+        self.assertEqual(result['metrics']['avgWaitingTime'], 0)
+
+    def test_roundrobin_sweep_matches_simulate(self):
+        """Test sweep metrics agree with individual simulations"""
+        processes = [
+            {'id': 'P1', 'arrival': 0, 'burst': 7, 'priority': 0},
+            {'id': 'P2', 'arrival': 1, 'burst': 4, 'priority': 0},
+            {'id': 'P3', 'arrival': 3, 'burst': 9, 'priority': 0}
+        ]
+        module = RoundRobinModule()
+
+        result = module.sweep(processes, [1, 2, 5])
+
+        self.assertEqual([r['timeQuantum'] for r in result['sweep']], [1, 2, 5])
+        for entry in result['sweep']:
+            single = module.simulate(processes, entry['timeQuantum'])
+            self.assertNotIn('ganttChart', entry)
+            for key, value in single['metrics'].items():
+                self.assertEqual(entry['metrics'][key], value)
+        self.assertEqual(result['sweep'][2]['metrics']['contextSwitches'], 4)
+
+class TestMLFQModule(unittest.TestCase):
+    """Test cases for MLFQ module"""
+
+    def test_mlfq_demotion_and_preemption(self):
+        """Test full quanta demote and arrivals preempt lower levels"""
+        processes = [
+            {'id': 'A', 'arrival': 0, 'burst': 10, 'priority': 0},
+            {'id': 'B', 'arrival': 3, 'burst': 2, 'priority': 0}
+        ]
+
+        result = MLFQModule().simulate(processes, num_levels=2, quanta=[2, 4])
+
+        slices = [(s['process'], s['start'], s['end'], s['level']) for s in result['steps']]
+        self.assertEqual(slices, [
+            ('A', 0, 2, 0), ('A', 2, 3, 1), ('B', 3, 5, 0), ('A', 5, 9, 1), ('A', 9, 12, 1)
+        ])
+        segments = [(seg['name'], seg['startTime'], seg['duration'])
+                    for seg in result['ganttChart']['processes']]
+        self.assertEqual(segments, [('A', 0, 3), ('B', 3, 2), ('A', 5, 7)])
+
+    def test_mlfq_priority_boost(self):
+        """Test periodic boosts return demoted processes to the top level"""
+        processes = [
+            {'id': 'A', 'arrival': 0, 'burst': 20, 'priority': 0},
+            {'id': 'B', 'arrival': 0, 'burst': 20, 'priority': 0}
+        ]
+
+        result = MLFQModule().simulate(processes, num_levels=2, quanta=[1, 4], boost_interval=5)
+
+        slices = [(s['process'], s['start'], s['end'], s['level']) for s in result['steps'][:6]]
+        self.assertEqual(slices, [
+            ('A', 0, 1, 0), ('B', 1, 2, 0), ('A', 2, 6, 1),
+            ('B', 6, 7, 0), ('A', 7, 8, 0), ('B', 8, 12, 1)
+        ])
+        self.assertEqual(result['ganttChart']['totalTime'], 40)
+
+class TestSMPModule(unittest.TestCase):
+    """Test cases for multiprocessor scheduling module"""
+
+    def setUp(self):
+        self.processes = [
+            {'id': 'A', 'arrival': 0, 'burst': 10, 'priority': 0},
+            {'id': 'B', 'arrival': 0, 'burst': 1, 'priority': 0},
+            {'id': 'C', 'arrival': 1, 'burst': 2, 'priority': 0},
+            {'id': 'D', 'arrival': 1, 'burst': 2, 'priority': 0}
+        ]
+
+    def _start_of(self, result, process_id):
+        return next(p['startTime'] for p in result['processResults'] if p['id'] == process_id)
+
+    def test_smp_global_queue(self):
+        """Test a shared queue keeps every CPU busy while work is queued"""
+        result = SMPModule().simulate(self.processes, 'fcfs', 2, 'global')
+
+        self.assertEqual(len(result['ganttChart']['cpus']), 2)
+        self.assertEqual(self._start_of(result, 'D'), 3)
+        self.assertEqual(result['ganttChart']['totalTime'], 10)
+        self.assertEqual(result['metrics']['cpuUtilization'], 0.75)
+        self.assertEqual(result['metrics']['throughput'], 0.4)
+
+    def test_smp_per_cpu_balancing(self):
+        """Test per-CPU queues only move work at a rebalance or a steal"""
+        module = SMPModule()
+
+        unbalanced = module.simulate(self.processes, 'fcfs', 2, 'per_cpu', balance_interval=100)
+        balanced = module.simulate(self.processes, 'fcfs', 2, 'per_cpu', balance_interval=2)
+        stealing = module.simulate(self.processes, 'fcfs', 2, 'work_stealing')
+
+        self.assertEqual(self._start_of(unbalanced, 'D'), 10)
+        self.assertEqual(self._start_of(balanced, 'D'), 3)
+        self.assertEqual(self._start_of(stealing, 'D'), 3)
+
+    def test_smp_work_stealing_keeps_cpus_busy(self):
+        """Test no CPU idles under work stealing while any queue holds work"""
+        processes = [
+            {'id': f'P{i}', 'arrival': arrival, 'burst': burst}
+            for i, (arrival, burst) in enumerate(zip([3, 4, 4, 11], [5, 3, 8, 4]))
+        ]
+        result = SMPModule().simulate(processes, 'roundrobin', 3, 'work_stealing', time_quantum=1)
+
+        for t in range(result['ganttChart']['totalTime']):
+            busy = sum(1 for cpu in result['ganttChart']['cpus'] for run in cpu['processes']
+                       if run['startTime'] <= t < run['startTime'] + run['duration'])
+            live = sum(1 for p in result['processResults'] if p['arrivalTime'] <= t < p['completionTime'])
+            self.assertEqual(busy, min(live, 3), f'idle CPU with queued work at t={t}')
+
+class TestPageReplacementModule(unittest.TestCase):
+    """Test cases for page replacement"""
+
+    def setUp(self):
+        self.module = PageReplacementModule()
+        self.page_requests = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+
+    def test_fifo(self):
+        """Test FIFO faults, victims and final memory in load order"""
+        result = self.module.simulate('fifo', 3, self.page_requests)
+
+        self.assertEqual(result['total_page_faults'], 15)
+        self.assertEqual(result['final_memory'], [7, 0, 1])
+        self.assertEqual(result['steps'][3]['replaced_page'], 7)
+        self.assertEqual(result['steps'][3]['memory_after'], [0, 1, 2])
+
+    def test_lru(self):
+        """Test LRU faults and final memory in load order"""
+        result = self.module.simulate('lru', 3, self.page_requests)
+
+        self.assertEqual(result['total_page_faults'], 12)
+        self.assertEqual(result['final_memory'], [1, 0, 7])
+        self.assertFalse(result['steps'][4]['page_fault'])
+
+    def test_opt(self):
+        """Test OPT evicts the page used farthest in the future"""
+        result = self.module.simulate('opt', 3, self.page_requests)
+
+        self.assertEqual(result['total_page_faults'], 9)
+        self.assertEqual(result['final_memory'], [0, 1, 7])
+        self.assertEqual([step['replaced_page'] for step in result['steps'] if step['replaced_page'] is not None],
+                         [7, 1, 0, 4, 3, 2])
+
+    def test_opt_is_lower_bound(self):
+        """Test OPT never faults more than FIFO or LRU"""
+        page_requests = [(i * 7) % 11 + (i // 13) % 3 for i in range(300)]
+        for frames in range(1, 8):
+            faults = run_opt(frames, page_requests)[0]
+            self.assertLessEqual(faults, run_fifo(frames, page_requests)[0])
+            self.assertLessEqual(faults, run_lru(frames, page_requests)[0])
+
+    def test_policies_share_result_schema(self):
+        """Test every policy reports the same fields and consistent memory"""
+        fifo = self.module.simulate('fifo', 3, self.page_requests)
+        for algorithm in ('clock', 'second_chance', 'lfu', 'arc', '2q'):
+            result = self.module.simulate(algorithm, 3, self.page_requests)
+            self.assertEqual(list(result), list(fifo))
+            self.assertEqual(result['final_memory'], result['steps'][-1]['memory_after'])
+            self.assertEqual(result['total_page_faults'],
+                             sum(step['page_fault'] for step in result['steps']))
+
+    def test_clock_and_second_chance_agree(self):
+        """Test CLOCK spares referenced pages like second chance does"""
+        clock = self.module.simulate('clock', 3, self.page_requests)
+        second_chance = self.module.simulate('second_chance', 3, self.page_requests)
+
+        self.assertEqual(clock['total_page_faults'], 14)
+        self.assertEqual([step['replaced_page'] for step in clock['steps']],
+                         [step['replaced_page'] for step in second_chance['steps']])
+
+    def test_lfu_and_scan_resistance(self):
+        """Test LFU keeps the hot page and 2Q/ARC survive a one-off scan"""
+        result = self.module.simulate('lfu', 2, [1, 1, 2, 3])
+        self.assertEqual(result['steps'][3]['replaced_page'], 2)
+
+        page_requests = [1, 2, 1, 2] + list(range(10, 20)) + [1, 2]
+        self.assertEqual(run_arc(4, page_requests)[0], 12)
+        self.assertEqual(run_lru(4, page_requests)[0], 14)
+
+        # 2Q promotes pages re-referenced after leaving its FIFO queue
+        page_requests = [1, 2, 3, 4, 5, 1, 2] + list(range(10, 20)) + [1, 2]
+        self.assertEqual(run_2q(4, page_requests)[0], 17)
+        self.assertEqual(run_lru(4, page_requests)[0], 19)
+
+    def test_compact_trace(self):
+        """Test compact rows and keyframes rebuild every full step"""
+        full = self.module.simulate('lru', 3, self.page_requests)
+        compact = self.module.simulate('lru', 3, self.page_requests, trace='compact', keyframe_interval=4)
+
+        self.assertEqual(compact['total_page_faults'], full['total_page_faults'])
+        self.assertEqual(compact['final_memory'], full['final_memory'])
+        self.assertEqual(compact['steps'][3], [2, 1, 7, 0])
+        self.assertEqual(len(compact['keyframes']), 5)
+        self.assertEqual(compact['keyframes'][1], [0, 1, 2])
+        for step in full['steps']:
+            self.assertEqual(self.module.expand_step(compact, step['step']), step)
+
+    def test_simulate_file(self):
+        """Test a binary trace streams through the engine like a list"""
+        for dtype, typecode in (('uint32', 'I'), ('uint64', 'Q')):
+            with tempfile.NamedTemporaryFile(suffix='.bin') as f:
+                array(typecode, self.page_requests).tofile(f)
+                f.flush()
+
+                self.assertEqual(list(iter_trace(f.name, dtype, chunk_size=1)), self.page_requests)
+                for algorithm in ('lru', 'opt'):
+                    result = self.module.simulate_file(algorithm, 3, f.name, dtype)
+                    expected = self.module.simulate(algorithm, 3, self.page_requests)
+                    self.assertEqual(result['total_requests'], 20)
+                    self.assertEqual(result['total_page_faults'], expected['total_page_faults'])
+                    self.assertNotIn('steps', result)
+
+    def test_generated_traces(self):
+        """Test generated traces are reproducible and readable as binary or JSON"""
+        pattern = {'type': 'mixture', 'block': 4, 'components': [
+            {'type': 'zipf', 'pages': 50, 'weight': 3},
+            {'type': 'loop', 'pages': 10, 'offset': 1000},
+            {'type': 'phased', 'pages': 500, 'working_set': 8, 'phase_length': 16}
+        ]}
+        first = [page for chunk in trace_generator.generate(pattern, 1000, seed=5, chunk_size=64) for page in chunk]
+        again = [page for chunk in trace_generator.generate(pattern, 1000, seed=5) for page in chunk]
+        self.assertEqual(first, again)
+        self.assertEqual(len(first), 1000)
+
+        loop = trace_generator.generate({'type': 'loop', 'pages': 3, 'offset': 7}, 7, chunk_size=2)
+        self.assertEqual([page for chunk in loop for page in chunk], [7, 8, 9, 7, 8, 9, 7])
+
+        with tempfile.TemporaryDirectory() as directory:
+            binary = os.path.join(directory, 'trace.bin')
+            text = os.path.join(directory, 'trace.json')
+            trace_generator.write_trace(binary, trace_generator.generate(pattern, 1000, seed=5))
+            trace_generator.write_trace(text, trace_generator.generate(pattern, 1000, seed=5), 'json')
+
+            self.assertEqual(list(iter_trace(binary)), first)
+            with open(text) as f:
+                self.assertEqual(json.load(f)['page_requests'], first)
+
+        with self.assertRaises(ValueError):
+            trace_generator.generate({'type': 'phased', 'pages': 4, 'working_set': 8, 'phase_length': 1}, 10)
+        with self.assertRaises(ValueError):
+            trace_generator.generate({'type': 'loop', 'pages': 4, 'offset': -1}, 10)
+        with self.assertRaises(ValueError):
+            trace_generator.generate({'type': 'mixture', 'components': [{'type': 'zipf', 'pages': 4, 'offset': 2 ** 64}]}, 10)
+        self.assertEqual(trace_generator.pattern_pages(
+            {'type': 'mixture', 'components': [{'type': 'loop', 'pages': 5}, {'type': 'zipf', 'pages': 7}]}), 12)
+
+    def test_miss_ratio_curve_matches_lru(self):
+        """Test the one-pass curve agrees with an LRU run per frame count"""
+        result = self.module.miss_ratio_curve(self.page_requests, 6)
+
+        self.assertEqual(result['unique_pages'], 6)
+        self.assertEqual([point['page_faults'] for point in result['curve']],
+                         [run_lru(frames, self.page_requests)[0] for frames in range(1, 7)])
+        self.assertEqual(result['curve'][2]['miss_ratio'], 0.6)
+
+    def test_fifo_sweep_flags_belady_anomaly(self):
+        """Test the parallel FIFO sweep matches serial runs and flags the anomaly"""
+        page_requests = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+        # Force the pool even for this short trace
+        min_work = paging_sweep.SWEEP_POOL_MIN_WORK
+        paging_sweep.SWEEP_POOL_MIN_WORK = 0
+        try:
+            result = self.module.fifo_sweep(page_requests, workers=2)
+        finally:
+            paging_sweep.SWEEP_POOL_MIN_WORK = min_work
+
+        self.assertEqual([point['page_faults'] for point in result['curve']],
+                         [run_fifo(frames, page_requests)[0] for frames in range(1, 6)])
+        self.assertEqual(result['anomalies'], [{'frames': 4, 'page_faults': 10, 'previous_page_faults': 9}])
+        self.assertEqual(self.module.fifo_sweep(page_requests, 3, workers=1)['anomalies'], [])
+
+    def test_fifo_sweep_rejects_pages_on_every_path(self):
+        """Test the sweep takes the same pages whether or not it uses a pool"""
+        for workers in [1, 2]:
+            for page_requests in [['a', 'b', 'a'], [1, -1], [2 ** 63]]:
+                with self.assertRaises(ValueError):
+                    self.module.fifo_sweep(page_requests, 2, workers=workers)
+
+    def test_working_set_and_pff(self):
+        """Test the sliding working set and PFF releasing idle pages"""
+        result = self.module.working_set([1, 2, 3, 1, 1, 1, 1, 4], window=3, pff_threshold=2)
+
+        self.assertEqual(result['working_set']['sizes'], [1, 2, 3, 3, 2, 1, 1, 2])
+        self.assertEqual(result['working_set']['page_faults'], 4)
+        self.assertEqual(result['working_set']['avg_size'], 1.88)
+        # Page 2 is released on the late fault for page 4
+        self.assertEqual(result['pff']['frames'], [1, 2, 3, 3, 3, 3, 3, 3])
+        self.assertEqual(result['pff']['page_faults'], 4)
+
+        sampled = self.module.working_set([1, 2, 3, 1, 1, 1, 1, 4], window=3, sample_interval=3)
+        self.assertEqual(sampled['working_set']['sizes'], [3, 1])
+
+    def test_engines_report_slots(self):
+        """Test the engines reuse the victim's frame slot"""
+        events = []
+        run_lru(2, [1, 2, 1, 3], lambda *event: events.append(event))
+
+        self.assertEqual(events, [(1, True, None, 0), (2, True, None, 1),
+                                  (1, False, None, 0), (3, True, 2, 1)])
+
+    def test_fifo_belady_anomaly(self):
+        """Test FIFO can fault more with more frames"""
+        page_requests = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+
+        self.assertEqual(run_fifo(3, page_requests)[0], 9)
+        self.assertEqual(run_fifo(4, page_requests)[0], 10)
+
+class TestAddressTranslationModule(unittest.TestCase):
+    """Test cases for the TLB and page table model"""
+
+    def setUp(self):
+        self.module = AddressTranslationModule()
+        self.addresses = [0x1000, 0x1008, 0x2000, 0x200000, 0x1000]
+
+    def test_huge_pages_extend_reach(self):
+        """Test larger pages raise the hit rate and shorten the walk"""
+        result = self.module.simulate(self.addresses, [4096, 1 << 21, 1 << 30], tlb_entries=4, tlb_ways=2)
+        base, huge, giant = result['results']
+
+        self.assertEqual([base['levels'], huge['levels'], giant['levels']], [4, 3, 2])
+        self.assertEqual([base['tlb_hits'], huge['tlb_hits'], giant['tlb_hits']], [2, 3, 4])
+        self.assertEqual(base['page_table_pages'], 5)
+        self.assertEqual(base['effective_access_time'], 341.0)
+        self.assertEqual(giant['effective_access_time'], 141.0)
+
+    def test_set_conflicts(self):
+        """Test pages mapping to one set evict each other in LRU order"""
+        pages = [0, 2, 4, 0, 2, 4]
+        direct = self.module.simulate([page << 12 for page in pages], tlb_entries=2, tlb_ways=1)
+        associative = self.module.simulate([page << 12 for page in pages], tlb_entries=4, tlb_ways=4)
+
+        self.assertEqual(direct['results'][0]['tlb_hits'], 0)
+        self.assertEqual(associative['results'][0]['tlb_hits'], 3)
+
+    def test_invalid_configuration(self):
+        """Test TLB shapes, page tables, page sizes and addresses are validated"""
+        with self.assertRaises(ValueError):
+            self.module.simulate(self.addresses, tlb_entries=6, tlb_ways=4)
+        with self.assertRaises(ValueError):
+            self.module.simulate(self.addresses, [3000])
+        with self.assertRaises(ValueError):
+            self.module.simulate(self.addresses, bits_per_level=0)
+        with self.assertRaises(ValueError):
+            self.module.simulate([4096, -1])
+        with self.assertRaises(ValueError):
+            self.module.simulate([1 << 32], address_bits=32)
+
+class TestMemoryAllocationModule(unittest.TestCase):
+    """Test cases for memory allocation"""
+
+    def setUp(self):
+        self.module = MemoryAllocationModule()
+        self.blocks = [100, 500, 200, 300, 600]
+        self.processes = [212, 417, 112, 426]
+
+    def _blocks_used(self, strategy):
+        result = self.module.allocate_memory(self.blocks, self.processes, strategy)
+        return [entry['block'] for entry in result['allocation']]
+
+    def test_fit_strategies(self):
+        """Test the classic best, first and worst fit placements"""
+        self.assertEqual(self._blocks_used('best'), [4, 2, 3, 5])
+        self.assertEqual(self._blocks_used('first'), [2, 5, 2, None])
+        self.assertEqual(self._blocks_used('worst'), [5, 2, 5, None])
+
+    def test_indexes_prefer_lowest_block(self):
+        """Test ties go to the lowest block index and shrinking blocks move"""
+        best = SizeIndex([50, 30, 30, 80])
+        worst = SizeIndex([50, 80, 30, 80], largest=True)
+        first = MaxSegmentTree([10, 40, 25, 40, 5])
+
+        self.assertEqual(best.find(30), 1)
+        best.resize(1, 5)
+        self.assertEqual(best.find(30), 2)
+        self.assertEqual(worst.find(60), 1)
+        worst.resize(1, 10)
+        self.assertEqual(worst.find(60), 3)
+        self.assertIsNone(worst.find(81))
+        self.assertEqual(first.find(30), 1)
+        first.resize(1, 0)
+        self.assertEqual(first.find(30), 3)
+        self.assertIsNone(first.find(41))
+
+    def test_sorted_runs_split(self):
+        """Test sorted runs stay ordered across run splits and removals"""
+        runs = SortedRuns()
+        runs.RUN = 2
+        for value in [5, 1, 9, 3, 7, 2, 8]:
+            runs.add(value)
+        runs.remove(9)
+        runs.remove(1)
+
+        self.assertEqual(list(runs), [2, 3, 5, 7, 8])
+        self.assertEqual(runs.ceiling(4), 5)
+        self.assertIsNone(runs.ceiling(9))
+
+    def test_buddy_strategy(self):
+        """Test buddy allocation rounds requests up to power-of-two chunks"""
+        result = self.module.allocate_memory(self.blocks, self.processes, 'buddy')
+
+        self.assertEqual(self._blocks_used('buddy'), [2, 5, 2, None])
+        self.assertEqual([step['chunk_size'] for step in result['steps']], [256, 512, 128, None])
+        self.assertEqual([step['internal_fragmentation'] for step in result['steps']], [44, 95, 16, 0])
+        self.assertEqual(result['total_internal_fragmentation'], 155)
+        self.assertEqual(result['final_block_status'][1]['remaining'], 116)
+
+    def test_buddy_split_and_coalesce(self):
+        """Test freed buddies merge back into the chunks they were split from"""
+        buddy = BuddyAllocator(24)
+        self.assertEqual(buddy.free_chunks(), [(0, 16), (16, 8)])
+
+        # The smallest free chunk that fits is split first
+        self.assertEqual(buddy.alloc(3), (16, 2))
+        self.assertEqual(buddy.alloc(4), (20, 2))
+        self.assertEqual(buddy.alloc(8), (0, 3))
+        self.assertEqual(buddy.alloc(8), (8, 3))
+        self.assertIsNone(buddy.alloc(1))
+
+        self.assertEqual(buddy.free(16), (16, 2))
+        # The 8-unit tail has no buddy inside the region
+        self.assertEqual(buddy.free(20), (16, 3))
+        self.assertEqual(buddy.free(0), (0, 3))
+        self.assertEqual(buddy.free(8), (0, 4))
+        self.assertEqual(buddy.free_chunks(), [(0, 16), (16, 8)])
+        self.assertEqual(buddy.free_units, 24)
+
+    def test_free_list_coalesces(self):
+        """Test freed ranges merge with the free extents on both sides"""
+        free_list = FreeList(100)
+        free_list.RUN = 1
+        for start in range(0, 100, 10):
+            free_list.take(start, 10)
+        for start in [10, 30, 50]:
+            free_list.release(start, 10)
+
+        self.assertEqual(list(free_list), [(10, 10), (30, 10), (50, 10)])
+        self.assertEqual(free_list.release(20, 10), (10, 30))
+        self.assertEqual(free_list.release(40, 5), (10, 35))
+        self.assertEqual(list(free_list), [(10, 35), (50, 10)])
+        self.assertEqual(free_list.free_units, 45)
+        with self.assertRaises(ValueError):
+            free_list.release(55, 10)
+
+    def test_timeline_strategies(self):
+        """Test the strategies place allocations in the holes left by frees"""
+        events = [
+            {'type': 'alloc', 'id': 'a', 'size': 30},
+            {'type': 'alloc', 'id': 'b', 'size': 10},
+            {'type': 'alloc', 'id': 'c', 'size': 20},
+            {'type': 'alloc', 'id': 'd', 'size': 10},
+            ['free', 'a'],
+            ['free', 'c'],
+            ['alloc', 'e', 15],
+        ]
+        addresses = {}
+        for strategy in ['first', 'best', 'worst']:
+            result = self.module.simulate_timeline(110, events, strategy)
+            addresses[strategy] = result['steps'][-1]['address']
+
+        self.assertEqual(addresses, {'first': 0, 'best': 40, 'worst': 70})
+        self.assertEqual(result['free_extents'], [[0, 30], [40, 20], [85, 25]])
+
+    def test_timeline_frees(self):
+        """Test frees coalesce, failed allocations are skipped and bad frees raise"""
+        events = [['alloc', 1, 60], ['alloc', 2, 60], ['alloc', 3, 40], ['free', 2], ['free', 1], ['free', 3]]
+        result = self.module.simulate_timeline(100, events)
+
+        self.assertEqual([step['status'] for step in result['steps']],
+                         ['allocated', 'not_allocated', 'allocated', 'skipped', 'freed', 'freed'])
+        self.assertEqual(result['free_extents'], [[0, 100]])
+        self.assertEqual(result['failed_allocations'], 1)
+        with self.assertRaises(ValueError):
+            self.module.simulate_timeline(100, [['free', 1]])
+
+    def test_fragmentation_metrics(self):
+        """Test metrics follow extents as they are added and removed"""
+        metrics = FragmentationMetrics([40, 0, 10])
+        metrics.add(3)
+        metrics.remove(40)
+        metrics.add(12)
+
+        self.assertEqual(metrics.snapshot(), {
+            'total_free': 25,
+            'largest_free': 12,
+            'free_extents': 3,
+            'fragmentation_index': 0.52,
+            'histogram': [{'min_size': 2, 'count': 1}, {'min_size': 8, 'count': 2}]
+        })
+        self.assertEqual(FragmentationMetrics().fragmentation_index(), 0)
+
+    def test_fragmentation_with_fractional_sizes(self):
+        """Test blocks and processes need not be whole units"""
+        result = self.module.allocate_memory([100.5, 50], [20], 'first')
+        self.assertEqual(result['final_fragmentation']['total_free'], 130.5)
+        self.assertEqual(result['final_fragmentation']['histogram'],
+                         [{'min_size': 32, 'count': 1}, {'min_size': 64, 'count': 1}])
+
+        result = self.module.allocate_memory([100, 200], [150.5], 'best')
+        self.assertEqual(result['final_fragmentation']['largest_free'], 100)
+        self.assertEqual(result['final_fragmentation']['free_extents'], 2)
+
+    def test_fragmentation_samples(self):
+        """Test every strategy samples fragmentation every sample_interval steps"""
+        result = self.module.allocate_memory(self.blocks, self.processes, 'best', sample_interval=2)
+        self.assertEqual([sample['step'] for sample in result['fragmentation']], [2, 4])
+        self.assertEqual(result['final_fragmentation']['total_free'], 533)
+        self.assertEqual(result['final_fragmentation']['largest_free'], 174)
+
+        result = self.module.allocate_memory([16], [3, 4], 'buddy')
+        self.assertEqual([sample['free_extents'] for sample in result['fragmentation']], [2, 1])
+        self.assertEqual(result['final_fragmentation']['total_free'], 8)
+
+        events = [['alloc', 1, 30], ['alloc', 2, 30], ['free', 1]]
+        result = self.module.simulate_timeline(100, events, sample_interval=1)
+        self.assertEqual([sample['largest_free'] for sample in result['fragmentation']], [70, 40, 40])
+        self.assertEqual(result['fragmentation'][-1]['fragmentation_index'], round(1 - 40 / 70, 4))
+
+    def test_tlsf_classes_and_merges(self):
+        """Test TLSF rounds searches up a class and merges freed neighbours"""
+        heap = TLSFAllocator(1000)
+        self.assertEqual(heap._mapping(15), (0, 15))
+        self.assertEqual(heap._mapping(16), (1, 0))
+        self.assertEqual(heap._mapping(100), (3, 9))
+        # 97 is in the class of 96-99, so the search starts at 100
+        self.assertEqual(heap._search_class(97), (3, 9))
+
+        for start in range(0, 500, 100):
+            self.assertEqual(heap.find(100), start)
+            heap.take(start, 100)
+        heap.release(100, 100)
+        heap.release(300, 100)
+        # A 100-unit hole fits exactly; a 150-unit request takes the tail
+        self.assertEqual(heap.find(100), 300)
+        self.assertEqual(heap.find(150), 500)
+        self.assertEqual(heap.release(200, 100), (100, 300))
+        self.assertEqual(list(heap), [(100, 300), (500, 500)])
+
+        steps = heap.steps
+        heap.find(1)
+        heap.take(100, 1)
+        self.assertLessEqual(heap.steps - steps, 4)
+
+    def test_timeline_costs(self):
+        """Test TLSF and best fit report costs on the same timeline"""
+        events = [['alloc', n, 10 + n % 7] for n in range(50)] + [['free', n] for n in range(0, 50, 2)]
+        events += [['alloc', 'big', 40], ['free', 'big']]
+        result = self.module.simulate_timeline(1000, events, 'tlsf', include_steps=False, measure_costs=True)
+
+        self.assertEqual(result['costs']['alloc']['operations'], 51)
+        self.assertEqual(result['costs']['free']['operations'], 26)
+        self.assertLessEqual(result['costs']['alloc']['max_steps'], 4)
+        self.assertLessEqual(result['costs']['free']['max_steps'], 5)
+        self.assertEqual(result['final_fragmentation']['total_free'], result['free_memory'])
+
+        comparison = self.module.compare_costs(1000, events)
+        self.assertEqual(list(comparison['results']), ['tlsf', 'best'])
+        self.assertNotIn('max_steps', comparison['results']['best']['costs']['alloc'])
+        self.assertEqual(comparison['results']['best']['failed_allocations'], 0)
+
+if __name__ == '__main__':
+    unittest.main()